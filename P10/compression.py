@@ -0,0 +1,110 @@
+import gzip
+import re
+import zlib
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.regex_helper import _lazy_re_compile
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+accept_encoding_re = _lazy_re_compile(r'\s*([^\s;,]+)\s*(?:;\s*q\s*=\s*([0-9.]+))?')
+
+
+def get_accepted_encodings(request):
+    """
+    Returns the content codings the client accepts, those with `q=0` left out.
+    """
+    accepted = set()
+
+    for coding in request.META.get('HTTP_ACCEPT_ENCODING', '').split(','):
+        match = accept_encoding_re.match(coding)
+
+        if not match:
+            continue
+
+        name, quality = match.groups()
+
+        try:
+            if quality is not None and float(quality) == 0:
+                continue
+        except ValueError:
+            continue
+
+        accepted.add(name.lower())
+
+    return accepted
+
+
+def compress_sequence(sequence, encoding):
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=settings.RESPONSE_COMPRESSION['BROTLI_QUALITY'])
+        compress, finish = compressor.process, compressor.finish
+    else:
+        compressor = zlib.compressobj(settings.RESPONSE_COMPRESSION['GZIP_LEVEL'], wbits=31)
+        compress, finish = compressor.compress, compressor.flush
+
+    for item in sequence:
+        data = compress(item)
+
+        if data:
+            yield data
+
+    yield finish()
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Compresses API responses of at least RESPONSE_COMPRESSION['MIN_SIZE']
+    bytes with brotli when the client accepts it and the `brotli` package is
+    installed, and with gzip otherwise. Smaller bodies are sent as they are,
+    the framing would cost more than it saves.
+    """
+    content_types = re.compile(r'^application/(json|msgpack|x-ndjson)\b')
+
+    def process_response(self, request, response):
+        if response.has_header('Content-Encoding') or response.status_code in (204, 304):
+            return response
+
+        if not self.content_types.match(response.get('Content-Type', '')):
+            return response
+
+        if not response.streaming and len(response.content) < settings.RESPONSE_COMPRESSION['MIN_SIZE']:
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        accepted = get_accepted_encodings(request)
+
+        if brotli is not None and 'br' in accepted:
+            encoding = 'br'
+        elif 'gzip' in accepted:
+            encoding = 'gzip'
+        else:
+            return response
+
+        if response.streaming:
+            response.streaming_content = compress_sequence(response.streaming_content, encoding)
+            del response['Content-Length']
+        else:
+            if encoding == 'br':
+                content = brotli.compress(response.content, quality=settings.RESPONSE_COMPRESSION['BROTLI_QUALITY'])
+            else:
+                content = gzip.compress(response.content, settings.RESPONSE_COMPRESSION['GZIP_LEVEL'], mtime=0)
+
+            response.content = content
+            response['Content-Length'] = str(len(content))
+
+        # The representation changed, a strong ETag no longer matches it byte for byte.
+        etag = response.get('ETag')
+
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+
+        response['Content-Encoding'] = encoding
+
+        return response
@@ -0,0 +1,208 @@
+import asyncio
+import bisect
+import contextvars
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.http import HttpResponse
+
+logger = logging.getLogger(__name__)
+
+current_request = contextvars.ContextVar('current_request', default=None)
+
+
+class RequestStats:
+    __slots__ = ('request', 'queries', 'sql_time')
+
+    def __init__(self, request):
+        self.request = request
+        self.queries = 0
+        self.sql_time = 0.0
+
+
+def get_url_name(request):
+    """
+    Labels a request with its URL name, or its route for unnamed URLs, so the
+    label values stay bounded whatever the paths requested.
+    """
+    match = request.resolver_match
+
+    if match is None:
+        return 'unmatched'
+
+    return match.url_name or match.route
+
+
+def record_query(execute, sql, params, many, context):
+    stats = current_request.get()
+
+    if stats is None:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        duration = time.perf_counter() - start
+        stats.queries += 1
+        stats.sql_time += duration
+
+        threshold = settings.METRICS['SLOW_QUERY_THRESHOLD']
+
+        if threshold is not None and duration >= threshold:
+            logger.warning('Slow query (%.3fs) in %s %s: %s', duration, stats.request.method,
+                           get_url_name(stats.request), sql)
+
+
+def install_query_wrapper(connection, **kwargs):
+    """
+    Wraps every query of the connection for the whole life of the process.
+    The wrapper is installed per connection rather than entered around each
+    request with connection.execute_wrapper(), because async views run their
+    queries on other threads, and so other connections, than the middleware.
+    """
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+connection_created.connect(install_query_wrapper)
+
+
+def escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Registry:
+    """
+    Request duration histograms, query counts and SQL time per URL name,
+    method and status, rendered in the Prometheus text format.
+    """
+
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.series = {}
+        self.lock = threading.Lock()
+
+    def observe(self, labels, duration, queries, sql_time):
+        with self.lock:
+            series = self.series.get(labels)
+
+            if series is None:
+                series = self.series[labels] = {
+                    'buckets': [0] * (len(self.buckets) + 1), 'sum': 0.0, 'queries': 0, 'sql_time': 0.0}
+
+            series['buckets'][bisect.bisect_left(self.buckets, duration)] += 1
+            series['sum'] += duration
+            series['queries'] += queries
+            series['sql_time'] += sql_time
+
+    def render(self):
+        with self.lock:
+            series = {labels: {**values, 'buckets': list(values['buckets'])}
+                      for labels, values in self.series.items()}
+
+        durations = [
+            '# HELP p10_http_request_duration_seconds Request duration by URL name, method and status.',
+            '# TYPE p10_http_request_duration_seconds histogram',
+        ]
+        queries = [
+            '# HELP p10_http_request_queries_total SQL queries run by requests.',
+            '# TYPE p10_http_request_queries_total counter',
+        ]
+        sql_time = [
+            '# HELP p10_http_request_sql_seconds_total Time requests spent running SQL queries.',
+            '# TYPE p10_http_request_sql_seconds_total counter',
+        ]
+
+        for (url_name, method, status), values in sorted(series.items()):
+            labels = f'url_name="{escape(url_name)}",method="{escape(method)}",status="{status}"'
+            count = 0
+
+            for bound, observed in zip(self.buckets + ('+Inf',), values['buckets']):
+                count += observed
+                durations.append(f'p10_http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {count}')
+
+            durations.append(f'p10_http_request_duration_seconds_sum{{{labels}}} {values["sum"]}')
+            durations.append(f'p10_http_request_duration_seconds_count{{{labels}}} {count}')
+            queries.append(f'p10_http_request_queries_total{{{labels}}} {values["queries"]}')
+            sql_time.append(f'p10_http_request_sql_seconds_total{{{labels}}} {values["sql_time"]}')
+
+        return '\n'.join(durations + queries + sql_time) + '\n'
+
+
+registry = Registry(settings.METRICS['BUCKETS'])
+
+
+class MetricsMiddleware:
+    """
+    Records the duration, query count and SQL time of every request into
+    the registry served by metrics_view.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+        if asyncio.iscoroutinefunction(get_response):
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+        # Connections opened before this module was imported missed the signal.
+        for connection in connections.all(initialized_only=True):
+            install_query_wrapper(connection)
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+
+        stats = RequestStats(request)
+        token = current_request.set(stats)
+        start = time.perf_counter()
+
+        try:
+            response = self.get_response(request)
+        finally:
+            current_request.reset(token)
+
+        self.observe(stats, response, time.perf_counter() - start)
+
+        return response
+
+    async def __acall__(self, request):
+        stats = RequestStats(request)
+        token = current_request.set(stats)
+        start = time.perf_counter()
+
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_request.reset(token)
+
+        self.observe(stats, response, time.perf_counter() - start)
+
+        return response
+
+    def observe(self, stats, response, duration):
+        labels = (get_url_name(stats.request), stats.request.method, response.status_code)
+        registry.observe(labels, duration, stats.queries, stats.sql_time)
+
+
+def metrics_view(request):
+    from projects.authentication import user_cache
+
+    cache = [
+        '# HELP p10_auth_user_cache_hits_total Authenticated requests served from the user cache.',
+        '# TYPE p10_auth_user_cache_hits_total counter',
+        f'p10_auth_user_cache_hits_total {user_cache.hits}',
+        '# HELP p10_auth_user_cache_misses_total Authenticated requests that queried the user.',
+        '# TYPE p10_auth_user_cache_misses_total counter',
+        f'p10_auth_user_cache_misses_total {user_cache.misses}',
+    ]
+
+    return HttpResponse(registry.render() + '\n'.join(cache) + '\n',
+                        content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -0,0 +1,60 @@
+import asyncio
+import contextvars
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+read_only_request = contextvars.ContextVar('read_only_request', default=False)
+
+
+class ReadOnlyRequestMiddleware:
+    """
+    Flags safe requests so that ReadWriteRouter can send their queries to the
+    read-only connections.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+        if asyncio.iscoroutinefunction(get_response):
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+
+        token = read_only_request.set(request.method in SAFE_METHODS)
+
+        try:
+            return self.get_response(request)
+        finally:
+            read_only_request.reset(token)
+
+    async def __acall__(self, request):
+        token = read_only_request.set(request.method in SAFE_METHODS)
+
+        try:
+            return await self.get_response(request)
+        finally:
+            read_only_request.reset(token)
+
+
+class ReadWriteRouter:
+    """
+    Sends the queries of safe requests to the `reader` connections and
+    everything else, including reads made while handling a write, to the
+    single `default` writer. Both aliases point at the same SQLite file.
+    """
+
+    def db_for_read(self, model, **hints):
+        return 'reader' if read_only_request.get() else 'default'
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == 'default'
@@ -10,6 +10,8 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.1/ref/settings/
 """
 
+import importlib.util
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -29,10 +31,128 @@ ALLOWED_HOSTS = []
 
 REST_FRAMEWORK = {
   'DEFAULT_AUTHENTICATION_CLASSES': (
-    'rest_framework_simplejwt.authentication.JWTAuthentication',
+    'projects.authentication.CachedJWTAuthentication',
   ),
+  'DEFAULT_THROTTLE_CLASSES': (
+    'projects.throttling.TokenBucketThrottle',
+  ),
+  'PAGE_SIZE': 100,
+}
+
+
+# Render JSON through orjson when it is installed, see projects/renderers.py.
+REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] = [
+    'projects.renderers.ORJSONRenderer' if importlib.util.find_spec('orjson') is not None
+    else 'rest_framework.renderers.JSONRenderer',
+    'rest_framework.renderers.BrowsableAPIRenderer',
+]
+REST_FRAMEWORK['DEFAULT_PARSER_CLASSES'] = [
+    'rest_framework.parsers.JSONParser',
+    'rest_framework.parsers.FormParser',
+    'rest_framework.parsers.MultiPartParser',
+]
+
+# Negotiate MessagePack when msgpack is installed, see projects/messagepack.py.
+if importlib.util.find_spec('msgpack') is not None:
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'].insert(1, 'projects.messagepack.MessagePackRenderer')
+    REST_FRAMEWORK['DEFAULT_PARSER_CLASSES'].append('projects.messagepack.MessagePackParser')
+
+# Compress JSON and MessagePack responses from MIN_SIZE bytes, with brotli
+# when it is installed and accepted, see P10/compression.py.
+RESPONSE_COMPRESSION = {
+    'MIN_SIZE': 1024,
+    'GZIP_LEVEL': 6,
+    'BROTLI_QUALITY': 4,
+}
+
+# Serialize list endpoints from values_list() rows, see projects/rows.py.
+FAST_LIST_SERIALIZATION = True
+
+# Token buckets per user (or anonymous client IP) and per view, with separate
+# read and write buckets, see projects/throttling.py. Buckets are (rate in
+# requests per second, burst), a view name overrides the DEFAULT buckets.
+THROTTLE_BUCKETS = {
+    'DEFAULT': {'read': (20, 100), 'write': (5, 30)},
+    'ProjectIssuesView': {'read': (10, 50)},
+}
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'throttle': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'throttle',
+        'OPTIONS': {'MAX_ENTRIES': 100000},
+    },
+}
+
+# Request duration histograms, query counts and SQL time per URL name served
+# at /metrics, see P10/metrics.py. Queries slower than SLOW_QUERY_THRESHOLD
+# seconds are logged with their SQL, None turns the log off.
+METRICS = {
+    'BUCKETS': (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+    'SLOW_QUERY_THRESHOLD': None,
+}
+
+# Deleting a project hides it at once and purges it on a background thread
+# when BACKGROUND is set, otherwise the request waits for the purge. Rows are
+# deleted BATCH_SIZE at a time, pausing PAUSE_RATIO times as long as a batch
+# took after it so other writers get the database, see projects/deletion.py.
+PROJECT_DELETION = {
+    'BACKGROUND': True,
+    'BATCH_SIZE': 1000,
+    'PAUSE_RATIO': 1,
+}
+
+# In-process cache of authenticated users, see projects/authentication.py.
+AUTH_USER_CACHE = {
+    'MAX_SIZE': 10000,
+    'TTL': 300,
+}
+
+# Issues with one of STATUSES created more than DAYS days ago are moved, with
+# their comments, to archive tables by the archive_issues command, BATCH_SIZE
+# issues per transaction, see projects/archive.py.
+ISSUE_ARCHIVE = {
+    'STATUSES': ['closed'],
+    'DAYS': 90,
+    'BATCH_SIZE': 1000,
+}
+
+# Access tokens carry the user's project memberships when they are in at most
+# MAX_PROJECTS projects, so views authorize without a query, see
+# projects/membership.py. Once a membership changes, the claims of the user's
+# tokens are ignored until they are refreshed; other processes notice it within
+# VERSION_TTL seconds.
+MEMBERSHIP_CLAIMS = {
+    'ENABLED': True,
+    'MAX_PROJECTS': 100,
+    'VERSION_TTL': 5,
 }
 
+SIMPLE_JWT = {
+    'TOKEN_OBTAIN_SERIALIZER': 'projects.tokens.MembershipTokenObtainPairSerializer',
+    'TOKEN_REFRESH_SERIALIZER': 'projects.tokens.MembershipTokenRefreshSerializer',
+}
+
+# Process pool running password hashing and verification for signup and
+# login, see projects/hashing.py. Requests beyond WORKERS + QUEUE_SIZE get a 429,
+# and checks taking longer than TIMEOUT seconds a 503.
+PASSWORD_HASHING_POOL = {
+    'WORKERS': 2,
+    'QUEUE_SIZE': 8,
+    'TIMEOUT': 30,
+}
+
+AUTHENTICATION_BACKENDS = [
+    'projects.backends.PooledModelBackend',
+]
+
+# Serve the read endpoints from native async views, for deployments behind
+# an ASGI server (see P10/asgi.py).
+ASYNC_READ_VIEWS = os.environ.get('P10_ASYNC_READ_VIEWS') == '1'
+
 
 # Application definition
 
@@ -47,6 +167,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'P10.metrics.MetricsMiddleware',
+    'P10.compression.CompressionMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -87,6 +209,49 @@ DATABASES = {
     }
 }
 
+# Production SQLite mode: WAL journaling so readers never block the writer,
+# tuned pragmas, persistent connections, and safe requests routed to
+# read-only connections while writes go through the single writer.
+if os.environ.get('P10_SQLITE_PRODUCTION') == '1':
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'busy_timeout': 5000,
+        'synchronous': 'NORMAL',
+        'mmap_size': 268435456,
+        'cache_size': -65536,
+        'temp_store': 'MEMORY',
+    }
+
+    DATABASES = {
+        'default': {
+            'ENGINE': 'P10.sqlite',
+            'NAME': BASE_DIR / 'db.sqlite3',
+            'CONN_MAX_AGE': 600,
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {
+                'timeout': 5,
+                'pragmas': SQLITE_PRAGMAS,
+            },
+        },
+        'reader': {
+            'ENGINE': 'P10.sqlite',
+            'NAME': BASE_DIR / 'db.sqlite3',
+            'CONN_MAX_AGE': 600,
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {
+                'timeout': 5,
+                'pragmas': {**SQLITE_PRAGMAS, 'query_only': 'ON'},
+            },
+            'TEST': {
+                'MIRROR': 'default',
+            },
+        },
+    }
+
+    DATABASE_ROUTERS = ['P10.routers.ReadWriteRouter']
+
+    MIDDLEWARE.insert(0, 'P10.routers.ReadOnlyRequestMiddleware')
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
@@ -0,0 +1,21 @@
+from django.db.backends.sqlite3 import base
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    SQLite backend applying the `pragmas` entry of the database OPTIONS to
+    every new connection (journal mode, busy timeout, cache sizes...).
+    """
+
+    def get_connection_params(self):
+        params = super().get_connection_params()
+        params.pop('pragmas', None)
+        return params
+
+    def get_new_connection(self, conn_params):
+        connection = super().get_new_connection(conn_params)
+
+        for name, value in self.settings_dict['OPTIONS'].get('pragmas', {}).items():
+            connection.execute(f'PRAGMA {name} = {value}')
+
+        return connection
@@ -0,0 +1,368 @@
+"""
+End-to-end benchmark of the API. Seeds a scratch database with the
+seed_data command (or uses --database, seeded beforehand), logs clients in
+through /login and drives every route of projects/urls.py from
+--concurrency threads against a threaded WSGI server. Reports throughput,
+latency percentiles and SQL queries per endpoint, saves them as JSON and
+compares them with a previous run.
+
+    python -m benchmarks.api --duration 30 --output before.json
+    python -m benchmarks.api --duration 30 --output after.json --compare before.json
+"""
+import argparse
+import json
+import logging
+import math
+import random
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+
+from .utils import BASE_DIR, make_server, request, setup_django
+
+ISSUE_FILTERS = ['', '?status=open', '?priority=high&ordering=-created_at', '?ordering=status', '?fields=id,title',
+                 '?expand=comments,comment_count,users&page_size=50']
+
+
+class Client:
+    """
+    A logged-in user driving the endpoints of one project it is the author
+    of, keeping track of what it created so that deletes have a target.
+    """
+
+    def __init__(self, base, username, password, project_id, issue_id, comment_id, outsider_id):
+        self.base = base
+        self.username = username
+        self.password = password
+        self.project_id = project_id
+        self.issue_id = issue_id
+        self.comment_id = comment_id
+        self.outsider_id = outsider_id
+        self.created = defaultdict(list)
+        self.member = False
+        self.token = None
+
+    def login(self):
+        status, body = request(f'{self.base}/login', {'username': self.username, 'password': self.password})
+        assert status == 200, body
+        self.token = json.loads(body)['access']
+
+
+def operations(client, rng):
+    """
+    Returns (weight, endpoint, method, path, data, on_response) tuples, the
+    endpoint being the URL name the metrics middleware labels requests with.
+    """
+    project = f'/projects/{client.project_id}'
+    issue = f'{project}/issues/{client.issue_id}'
+    item = {'title': 'benchmark issue', 'description': 'created by the benchmark', 'tag': 'bug',
+            'priority': 'low', 'status': 'open'}
+
+    def created(kind):
+        def on_response(status, body):
+            if status < 400:
+                client.created[kind].append(json.loads(body)['id'])
+
+        return on_response
+
+    def deleted(kind):
+        return lambda status, body: client.created[kind].pop()
+
+    ops = [
+        (1, 'token_obtain_pair', 'POST', '/login', {'username': client.username, 'password': client.password}, None),
+        (1, 'signup', 'POST', '/signup', {'username': f'signup-{uuid.uuid4().hex}', 'password': 'password'}, None),
+        (10, 'projects', 'GET', '/projects', None, None),
+        (1, 'projects', 'POST', '/projects', {'title': 'benchmark', 'description': '', 'type': 'back-end'},
+         created('project')),
+        (10, 'project', 'GET', project, None, None),
+        (2, 'project', 'PUT', project, {'description': f'updated {rng.random()}'}, None),
+        (5, 'project_users', 'GET', f'{project}/users', None, None),
+        (20, 'project_issues', 'GET', f'{project}/issues{rng.choice(ISSUE_FILTERS)}', None, None),
+        (3, 'project_issues', 'POST', f'{project}/issues', item, created('issue')),
+        (3, 'project_issues', 'PUT', issue, {'status': rng.choice(['open', 'in progress', 'closed'])}, None),
+        (1, 'project_issues_bulk', 'POST', f'{project}/issues/bulk', {'create': [item] * 10}, None),
+        (10, 'project_issues_comments', 'GET', f'{issue}/comments', None, None),
+        (3, 'project_issues_comments', 'GET', f'{issue}/comments/{client.comment_id}', None, None),
+        (3, 'project_issues_comments', 'POST', f'{issue}/comments', {'description': 'benchmark comment'},
+         created('comment')),
+        (1, 'project_issues_comments', 'PUT', f'{issue}/comments/{client.comment_id}',
+         {'description': f'edited {rng.random()}'}, None),
+        (2, 'project_changes', 'GET', f'{project}/changes?since={rng.choice([0, 1000, 100000])}', None, None),
+        (1, 'project_export', 'GET', f'{project}/export', None, None),
+        (3, 'project_search', 'GET', f'{project}/search?q={rng.choice(["cursor", "login", "slow%20query"])}',
+         None, None),
+        (3, 'project_stats', 'GET', f'{project}/stats', None, None),
+    ]
+
+    if client.outsider_id is not None:
+        if client.member:
+            ops.append((1, 'project_users', 'DELETE', f'{project}/users/{client.outsider_id}', None,
+                        lambda status, body: setattr(client, 'member', status >= 400)))
+        else:
+            ops.append((1, 'project_users', 'POST', f'{project}/users',
+                        {'user_id': client.outsider_id, 'permission': 'editor'},
+                        lambda status, body: setattr(client, 'member', status < 400)))
+
+    if client.created['project']:
+        ops.append((1, 'project', 'DELETE', f'/projects/{client.created["project"][-1]}', None, deleted('project')))
+
+    if client.created['issue']:
+        ops.append((1, 'project_issues', 'DELETE', f'{project}/issues/{client.created["issue"][-1]}', None,
+                    deleted('issue')))
+
+    if client.created['comment']:
+        ops.append((1, 'project_issues_comments', 'DELETE', f'{issue}/comments/{client.created["comment"][-1]}',
+                    None, deleted('comment')))
+
+    return ops
+
+
+def drive(client, seed, deadline, results):
+    rng = random.Random(seed)
+
+    while time.monotonic() < deadline:
+        ops = operations(client, rng)
+        _, endpoint, method, path, data, on_response = rng.choices(ops, weights=[op[0] for op in ops])[0]
+
+        token = None if endpoint in ('token_obtain_pair', 'signup') else client.token
+        start = time.perf_counter()
+        status, body = request(f'{client.base}{path}', data, token, method)
+        latency = time.perf_counter() - start
+
+        if on_response is not None:
+            on_response(status, body)
+
+        results[(endpoint, method)].append((latency, status))
+
+
+def make_clients(base, count, password):
+    from projects.models.Comment import Comment
+    from projects.models.Contributor import Contributor
+    from projects.models.Issue import Issue
+
+    authors = list(Contributor.objects.filter(permission='author').select_related('user').order_by(
+        'project_id')[:count])
+
+    if len(authors) < count:
+        raise SystemExit(f'The database has {len(authors)} projects, {count} clients need as many.')
+
+    clients = []
+
+    for author in authors:
+        issue = Issue.objects.filter(project_id=author.project_id).order_by('id').first()
+
+        if issue is None:
+            issue = Issue.objects.create(title='benchmark', project_id=author.project_id, author_id=author.user_id)
+
+        comment = Comment.objects.filter(issue=issue).order_by('id').first()
+
+        if comment is None:
+            comment = Comment.objects.create(description='benchmark', issue=issue, author_id=author.user_id)
+
+        outsider = Contributor.objects.values_list('user_id', flat=True).exclude(
+            user_id__in=Contributor.objects.filter(project_id=author.project_id).values('user_id')).first()
+
+        client = Client(base, author.user.username, password, author.project_id, issue.id, comment.id, outsider)
+        client.login()
+        clients.append(client)
+
+    return clients
+
+
+def get_query_counts():
+    """
+    Sums the requests and queries the metrics middleware recorded per URL
+    name and method.
+    """
+    from P10.metrics import registry
+
+    with registry.lock:
+        counts = defaultdict(lambda: [0, 0, 0.0])
+
+        for (url_name, method, _), series in registry.series.items():
+            totals = counts[(url_name, method)]
+            totals[0] += sum(series['buckets'])
+            totals[1] += series['queries']
+            totals[2] += series['sql_time']
+
+    return counts
+
+
+def percentile(latencies, fraction):
+    return latencies[max(math.ceil(fraction * len(latencies)) - 1, 0)] * 1000
+
+
+def summarize(results, before, after, duration):
+    endpoints = {}
+
+    for (endpoint, method), samples in sorted(results.items()):
+        latencies = sorted(latency for latency, _ in samples)
+        requests, queries, sql_time = (
+            a - b for a, b in zip(after[(endpoint, method)], before.get((endpoint, method), [0, 0, 0.0])))
+
+        endpoints[f'{method} {endpoint}'] = {
+            'requests': len(samples),
+            'errors': sum(1 for _, status in samples if status >= 400),
+            'statuses': dict(sorted(Counter(str(status) for _, status in samples).items())),
+            'throughput': len(samples) / duration,
+            'p50': percentile(latencies, 0.5),
+            'p95': percentile(latencies, 0.95),
+            'p99': percentile(latencies, 0.99),
+            'queries': queries / requests if requests else None,
+            'sql_ms': sql_time / requests * 1000 if requests else None,
+        }
+
+    total = sum(endpoint['requests'] for endpoint in endpoints.values())
+
+    return {
+        'requests': total,
+        'errors': sum(endpoint['errors'] for endpoint in endpoints.values()),
+        'throughput': total / duration,
+    }, endpoints
+
+
+def report(total, endpoints):
+    print(f'{"endpoint":<32} {"requests":>8} {"errors":>6} {"req/s":>7} {"p50":>8} {"p95":>8} {"p99":>8} '
+          f'{"queries":>7} {"sql":>7}')
+
+    for name, stats in endpoints.items():
+        queries = f'{stats["queries"]:7.1f}' if stats['queries'] is not None else f'{"-":>7}'
+        sql = f'{stats["sql_ms"]:5.1f}ms' if stats['sql_ms'] is not None else f'{"-":>7}'
+        print(f'{name:<32} {stats["requests"]:>8} {stats["errors"]:>6} {stats["throughput"]:>7.1f} '
+              f'{stats["p50"]:>6.1f}ms {stats["p95"]:>6.1f}ms {stats["p99"]:>6.1f}ms {queries} {sql}')
+
+    print(f'{"total":<32} {total["requests"]:>8} {total["errors"]:>6} {total["throughput"]:>7.1f}')
+
+    for name, stats in endpoints.items():
+        if stats['errors']:
+            print(f'{name}: ' + ', '.join(f'{count} x {status}' for status, count in stats['statuses'].items()))
+
+
+def compare(endpoints, baseline, tolerance, min_requests):
+    """
+    Prints the p95 latency and query count changes against a previous run,
+    returning the endpoints that run more queries, or got slower than
+    `tolerance` allows over at least `min_requests` requests in both runs.
+    """
+    regressions = []
+
+    print(f'\n{"endpoint":<32} {"p95 before":>10} {"p95 after":>10} {"change":>8} {"queries":>16}')
+
+    for name, stats in endpoints.items():
+        previous = baseline['endpoints'].get(name)
+
+        if previous is None:
+            continue
+
+        change = stats['p95'] / previous['p95'] - 1 if previous['p95'] else 0
+        slower = change > tolerance and min(stats['requests'], previous['requests']) >= min_requests
+        more_queries = (stats['queries'] is not None and previous['queries'] is not None
+                        and stats['queries'] > previous['queries'] + 0.5)
+        queries = (f'{previous["queries"]:.1f} -> {stats["queries"]:.1f}'
+                   if stats['queries'] is not None and previous['queries'] is not None else '-')
+        flag = '  REGRESSION' if slower or more_queries else ''
+
+        print(f'{name:<32} {previous["p95"]:>8.1f}ms {stats["p95"]:>8.1f}ms {change * 100:>+7.1f}% '
+              f'{queries:>16}{flag}')
+
+        if flag:
+            regressions.append(name)
+
+    return regressions
+
+
+def get_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=BASE_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--concurrency', type=int, default=8, help='Client threads, one logged-in user each.')
+    parser.add_argument('--threads', type=int, default=8, help='Request threads of the server.')
+    parser.add_argument('--duration', type=float, default=20)
+    parser.add_argument('--warmup', type=float, default=2)
+    parser.add_argument('--database', help='Seeded SQLite database to run against instead of a scratch one.')
+    parser.add_argument('--users', type=int, default=500, help='seed_data --users for the scratch database.')
+    parser.add_argument('--projects', type=int, default=50, help='seed_data --projects for the scratch database.')
+    parser.add_argument('--issues', type=int, default=200, help='seed_data --issues for the scratch database.')
+    parser.add_argument('--comments', type=int, default=5, help='seed_data --comments for the scratch database.')
+    parser.add_argument('--password', default='password', help='Password of the seeded users.')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='Writes the results to this JSON file.')
+    parser.add_argument('--compare', help='Compares the results with this JSON file, exiting 1 on regressions.')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='p95 latency increase tolerated by --compare (default 0.25).')
+    parser.add_argument('--min-requests', type=int, default=20,
+                        help='Requests an endpoint needs in both runs for --compare to judge its latency.')
+    args = parser.parse_args()
+
+    setup_django(args.database)
+
+    from django.core.management import call_command
+
+    if args.database is None:
+        call_command('seed_data', users=args.users, projects=args.projects, issues=args.issues,
+                     comments=args.comments, password=args.password, seed=args.seed)
+
+    server, base = make_server(args.threads)
+    logging.getLogger('django.request').setLevel(logging.CRITICAL)
+
+    clients = make_clients(base, args.concurrency, args.password)
+
+    # Only the results of the last pass are kept, the first one warms up.
+    for duration in (args.warmup, args.duration):
+        results = defaultdict(list)
+        before = get_query_counts()
+        deadline = time.monotonic() + duration
+        workers = [threading.Thread(target=drive, args=(client, args.seed + n, deadline, results))
+                   for n, client in enumerate(clients)]
+
+        start = time.monotonic()
+
+        for worker in workers:
+            worker.start()
+
+        for worker in workers:
+            worker.join()
+
+        elapsed = time.monotonic() - start
+
+    total, endpoints = summarize(results, before, get_query_counts(), elapsed)
+    server.shutdown()
+
+    report(total, endpoints)
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump({
+                'meta': {
+                    'timestamp': datetime.now(timezone.utc).isoformat(),
+                    'commit': get_commit(),
+                    'python': sys.version.split()[0],
+                    'args': vars(args),
+                },
+                'total': total,
+                'endpoints': endpoints,
+            }, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+
+        regressions = compare(endpoints, baseline, args.tolerance, args.min_requests)
+
+        if regressions:
+            print(f'\n{len(regressions)} endpoints regressed.')
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
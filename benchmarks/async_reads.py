@@ -0,0 +1,89 @@
+"""
+Load test of the read endpoints under ASGI, once with the synchronous DRF
+views and once with the native async views (P10_ASYNC_READ_VIEWS=1).
+
+    python -m benchmarks.async_reads --requests 2000 --concurrency 100
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from .utils import setup_django
+
+
+async def load(requests, concurrency, page_size):
+    from django.contrib.auth.models import User
+    from django.test import AsyncClient
+
+    from projects.models.Contributor import Contributor
+    from projects.models.Issue import Issue
+    from projects.models.Project import Project
+
+    user = await User.objects.acreate(username='benchmark')
+    project = await Project.objects.acreate(title='benchmark')
+    await Contributor.objects.acreate(project=project, user=user, permission='author')
+    await Issue.objects.abulk_create([
+        Issue(title=f'issue {n}', description='description' * 20, project=project, author=user)
+        for n in range(page_size * 4)])
+
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    client = AsyncClient()
+    authorization = f'Bearer {AccessToken.for_user(user)}'
+    urls = [f'/projects/{project.id}/issues?page_size={page_size}', f'/projects/{project.id}',
+            '/projects', f'/projects/{project.id}/users']
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def fetch(n):
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.get(urls[n % len(urls)], AUTHORIZATION=authorization)
+            latencies.append(time.perf_counter() - start)
+            assert response.status_code == 200, response.content
+
+    start = time.perf_counter()
+    await asyncio.gather(*[fetch(n) for n in range(requests)])
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+
+    return {
+        'throughput': requests / elapsed,
+        'p50': statistics.median(latencies) * 1000,
+        'p99': latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=100)
+    parser.add_argument('--page-size', type=int, default=50)
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        setup_django()
+        result = asyncio.run(load(args.requests, args.concurrency, args.page_size))
+        print(json.dumps(result))
+        return
+
+    for mode, flag in [('sync', '0'), ('async', '1')]:
+        output = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.async_reads', '--child'] + sys.argv[1:],
+            env={**os.environ, 'P10_ASYNC_READ_VIEWS': flag},
+            capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.splitlines()[-1])
+
+        print(f'{mode:5}  {result["throughput"]:8.0f} req/s  '
+              f'p50 {result["p50"]:7.1f} ms  p99 {result["p99"]:7.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
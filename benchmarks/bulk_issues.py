@@ -0,0 +1,60 @@
+"""
+Compares creating issues one request at a time against a single request to
+the bulk endpoint.
+
+    python -m benchmarks.bulk_issues --issues 500
+"""
+import argparse
+import time
+
+from .utils import setup_django
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--issues', type=int, default=500)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.contrib.auth.models import User
+    from rest_framework.test import APIClient
+
+    User.objects.create_user('benchmark', password='benchmark')
+
+    client = APIClient()
+    response = client.post('/login', {'username': 'benchmark', 'password': 'benchmark'})
+    assert response.status_code == 200, response.data
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {response.data["access"]}')
+    refresh = response.data['refresh']
+
+    response = client.post('/projects', {'title': 'benchmark', 'description': '', 'type': ''})
+    assert response.status_code == 200, response.data
+    project_id = response.data['id']
+
+    # The access token only carries the new membership once refreshed.
+    response = client.post('/api/token/refresh', {'refresh': refresh})
+    assert response.status_code == 200, response.data
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {response.data["access"]}')
+
+    issues = [{'title': f'issue {n}', 'description': 'description', 'tag': 'bug',
+               'priority': 'low', 'status': 'open'} for n in range(args.issues)]
+
+    start = time.perf_counter()
+    for issue in issues:
+        response = client.post(f'/projects/{project_id}/issues', issue, format='json')
+        assert response.status_code == 200, response.data
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    response = client.post(f'/projects/{project_id}/issues/bulk', {'create': issues}, format='json')
+    assert response.status_code == 200, response.data
+    assert all(item['status'] == 201 for item in response.data['create']), response.data
+    bulk = time.perf_counter() - start
+
+    print(f'single: {args.issues / single:10.0f} issues/s')
+    print(f'bulk:   {args.issues / bulk:10.0f} issues/s ({single / bulk:.0f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""
+Compares encode time, payload size and client decode time of issue and
+comment lists rendered as JSON and as MessagePack, uncompressed and with the
+gzip and brotli settings of CompressionMiddleware.
+
+    python -m benchmarks.compact_renderers --rows 100 1000 10000
+"""
+import argparse
+import gzip
+import json
+import random
+
+from .utils import setup_django, timed
+
+WORDS = ('the issue list fails to load when a contributor opens the project after the last deploy '
+         'because the cursor pagination returns duplicated rows for comments created in the same '
+         'millisecond steps to reproduce expected result actual result stack trace attached').split()
+
+
+def text(rng, words):
+    return ' '.join(rng.choice(WORDS) for _ in range(words))
+
+
+def seed(rows):
+    from django.contrib.auth.models import User
+    from django.db import connection, transaction
+
+    from projects.models.Issue import Issue
+    from projects.models.Project import Project
+
+    rng = random.Random(rows)
+
+    with transaction.atomic():
+        users = [User.objects.get_or_create(username=f'user{n}')[0] for n in range(10)]
+        project = Project.objects.create(title=f'benchmark {rows}')
+        issue = Issue.objects.create(title='commented', project=project, author=users[0])
+
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                'INSERT INTO projects_issue (title, description, tag, priority, status, project_id, '
+                'author_id, assignee_id, created_at) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)',
+                ((text(rng, 8), text(rng, rng.randint(20, 120)), rng.choice(('bug', 'feature', 'task')),
+                  rng.choice(('low', 'medium', 'high')), rng.choice(('open', 'in progress', 'closed')),
+                  project.id, users[n % 10].id, users[n % 7].id if n % 3 else None,
+                  f'2022-01-01 00:00:{n % 60:02}.{n % 1000000:06}')
+                 for n in range(rows)))
+            cursor.executemany(
+                'INSERT INTO projects_comment (description, author_id, issue_id, created_at) '
+                'VALUES (%s, %s, %s, %s)',
+                ((text(rng, rng.randint(5, 60)), users[n % 10].id, issue.id,
+                  f'2022-01-01 00:00:{n % 60:02}.{n % 1000000:06}')
+                 for n in range(rows)))
+
+    return project, issue
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, nargs='+', default=[100, 1000, 10000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+    from django.utils.module_loading import import_string
+
+    from projects.models.Comment import Comment, CommentSerializer
+    from projects.models.Issue import Issue, IssueSerializer
+
+    try:
+        import msgpack
+
+        from projects.messagepack import MessagePackRenderer
+    except ImportError:
+        msgpack = None
+
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+
+    compression = settings.RESPONSE_COMPRESSION
+    renderer = import_string(settings.REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'][0])()
+    formats = [('json', renderer.render, json.loads)]
+
+    if msgpack is not None:
+        formats.append(('msgpack', MessagePackRenderer().render, msgpack.unpackb))
+
+    print(f'JSON rendered with {type(renderer).__name__}, gzip level {compression["GZIP_LEVEL"]}, '
+          f'brotli quality {compression["BROTLI_QUALITY"]}' + ('' if brotli else ' (brotli not installed)'))
+    print(f'{"list":>8} {"rows":>6} {"format":>8} {"encode":>9} {"decode":>9} {"raw":>10} '
+          f'{"gzip":>10} {"+time":>8} {"brotli":>10} {"+time":>8}')
+
+    for rows in args.rows:
+        project, issue = seed(rows)
+
+        lists = (
+            ('issues', IssueSerializer(Issue.objects.filter(project=project).order_by('id'), many=True).data),
+            ('comments', CommentSerializer(Comment.objects.filter(issue=issue).order_by('id'), many=True).data),
+        )
+
+        for name, data in lists:
+            for format, render, decode in formats:
+                payload = render(data)
+                encode_time = timed(lambda: render(data), args.repeat)
+                decode_time = timed(lambda: decode(payload), args.repeat)
+
+                gzipped = gzip.compress(payload, compression['GZIP_LEVEL'])
+                gzip_time = timed(lambda: gzip.compress(payload, compression['GZIP_LEVEL']), args.repeat)
+                line = (f'{name:>8} {rows:>6} {format:>8} {encode_time * 1000:>7.2f}ms {decode_time * 1000:>7.2f}ms '
+                        f'{len(payload):>10} {len(gzipped):>10} {gzip_time * 1000:>6.2f}ms')
+
+                if brotli is not None:
+                    compressed = brotli.compress(payload, quality=compression['BROTLI_QUALITY'])
+                    brotli_time = timed(lambda: brotli.compress(payload, quality=compression['BROTLI_QUALITY']),
+                                        args.repeat)
+                    line += f' {len(compressed):>10} {brotli_time * 1000:>6.2f}ms'
+
+                print(line)
+
+
+if __name__ == '__main__':
+    main()
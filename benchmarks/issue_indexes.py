@@ -0,0 +1,112 @@
+"""
+Seeds a scratch database with issues and comments, then prints the SQLite
+query plan and median latency of the issue and comment listing queries.
+
+    python -m benchmarks.issue_indexes --issues 1000000
+"""
+import argparse
+import random
+
+from .utils import setup_django, timed
+
+STATUSES = ['open', 'in progress', 'closed']
+PRIORITIES = ['low', 'medium', 'high']
+TAGS = ['bug', 'feature', 'task']
+
+
+def seed(issues, projects, users, comments):
+    from django.contrib.auth.models import User
+    from django.db import connection, transaction
+
+    from projects.models.Issue import Issue
+    from projects.models.Project import Project
+
+    if Issue.objects.exists():
+        return
+
+    random.seed(0)
+
+    with transaction.atomic():
+        User.objects.bulk_create([User(username=f'user{n}') for n in range(users)])
+        Project.objects.bulk_create([Project(title=f'project{n}') for n in range(projects)])
+
+        user_ids = list(User.objects.values_list('id', flat=True))
+        project_ids = list(Project.objects.values_list('id', flat=True))
+
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                'INSERT INTO projects_issue (title, description, tag, priority, status, project_id, '
+                'author_id, assignee_id, created_at) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)',
+                ((f'issue {n}', 'description', random.choice(TAGS), random.choice(PRIORITIES),
+                  random.choice(STATUSES), random.choice(project_ids), random.choice(user_ids),
+                  random.choice(user_ids + [None]), f'2022-01-01 00:00:{n % 60:02}.{n:06}')
+                 for n in range(issues)))
+
+            cursor.executemany(
+                'INSERT INTO projects_comment (description, author_id, issue_id, created_at) '
+                'VALUES (%s, %s, %s, %s)',
+                (('comment', random.choice(user_ids), random.randint(1, issues),
+                  '2022-01-01 00:00:00') for _ in range(comments)))
+
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+
+
+def explain(name, queryset):
+    from django.db import connection
+
+    sql, params = queryset.query.sql_with_params()
+
+    with connection.cursor() as cursor:
+        cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+        plan = [row[-1] for row in cursor.fetchall()]
+
+    latency = timed(lambda: list(queryset.all()))
+
+    print(f'{name}: {latency * 1000:.2f} ms')
+
+    for step in plan:
+        print(f'    {step}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--database', help='Reuse (or create) this SQLite file.')
+    parser.add_argument('--issues', type=int, default=1000000)
+    parser.add_argument('--projects', type=int, default=100)
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--comments', type=int, default=200000)
+    args = parser.parse_args()
+
+    setup_django(args.database)
+    seed(args.issues, args.projects, args.users, args.comments)
+
+    from django.contrib.auth.models import User
+
+    from projects.filters import filter_issues, get_issue_ordering
+    from projects.models.Comment import Comment
+    from projects.models.Issue import Issue
+
+    project_id = Issue.objects.values_list('project_id', flat=True).first()
+    user_id = User.objects.values_list('id', flat=True).first()
+    issue_id = Comment.objects.values_list('issue_id', flat=True).first()
+
+    cases = [
+        ('list', {}),
+        ('status', {'status': 'open'}),
+        ('priority', {'priority': 'high'}),
+        ('status ordered by -created_at', {'status': 'open', 'ordering': '-created_at'}),
+    ]
+
+    for name, params in cases:
+        issues = filter_issues(Issue.objects.filter(project_id=project_id), params)
+        explain(f'issues {name}', issues.order_by(*get_issue_ordering(params))[:100])
+
+    explain('issues assigned and open', Issue.objects.filter(
+        assignee_id=user_id, status='open')[:100])
+    explain('comments', Comment.objects.filter(
+        issue_id=issue_id).order_by('created_at', 'id')[:100])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Measures the overhead of MetricsMiddleware on the issue list, by timing the
+same requests through a handler with and without it.
+
+    python -m benchmarks.metrics --requests 2000
+"""
+import argparse
+
+from .utils import setup_django, timed
+
+
+def fetch(client, url):
+    response = client.get(url)
+    assert response.status_code == 200, response.content
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+    from django.contrib.auth.models import User
+    from django.test.utils import override_settings
+    from rest_framework.test import APIClient
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    from projects.models.Contributor import Contributor
+    from projects.models.Issue import Issue
+    from projects.models.Project import Project
+
+    user = User.objects.create(username='benchmark')
+    project = Project.objects.create(title='benchmark')
+    Contributor.objects.create(project=project, user=user, permission='author')
+    Issue.objects.bulk_create(Issue(title=f'issue {n}', project=project, author=user) for n in range(20))
+
+    url = f'/projects/{project.id}/issues'
+    middleware = [name for name in settings.MIDDLEWARE if name != 'P10.metrics.MetricsMiddleware']
+    timings = {}
+
+    for mode, settings_override in [('without', {'MIDDLEWARE': middleware}), ('with', {})]:
+        with override_settings(**settings_override):
+            client = APIClient()
+            client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}')
+            fetch(client, url)
+
+            timings[mode] = timed(lambda: [fetch(client, url) for _ in range(args.requests)], args.repeat)
+
+    without, with_metrics = (timings[mode] / args.requests * 1e6 for mode in ('without', 'with'))
+    print(f'per request: {without:.0f}us without metrics, {with_metrics:.0f}us with metrics '
+          f'({with_metrics - without:+.0f}us, {(with_metrics / without - 1) * 100:+.1f}%)')
+
+
+if __name__ == '__main__':
+    main()
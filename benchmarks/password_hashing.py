@@ -0,0 +1,103 @@
+"""
+Measures read latency on a server with a fixed number of request threads
+while clients hammer /login, once with password hashing inline on the
+request threads and once through the hashing pool (projects/hashing.py).
+
+    python -m benchmarks.password_hashing --threads 8 --logins 16 --duration 10
+"""
+import argparse
+import logging
+import statistics
+import threading
+import time
+
+from .utils import make_server, request, setup_django
+
+
+def run(base, token, logins, duration):
+    stop = time.monotonic() + duration
+    statuses = []
+    latencies = []
+
+    def login():
+        while time.monotonic() < stop:
+            status, _ = request(f'{base}/login', {'username': 'benchmark', 'password': 'password'})
+            statuses.append(status)
+
+            if status == 429:
+                time.sleep(0.05)
+
+    def read():
+        while time.monotonic() < stop:
+            start = time.perf_counter()
+            status, body = request(f'{base}/projects', token=token)
+            assert status == 200, body
+            latencies.append(time.perf_counter() - start)
+            time.sleep(0.05)
+
+    workers = [threading.Thread(target=login) for _ in range(logins)]
+    workers.append(threading.Thread(target=read))
+
+    for worker in workers:
+        worker.start()
+
+    for worker in workers:
+        worker.join()
+
+    return statuses, latencies
+
+
+def report(name, statuses, latencies, duration):
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1] if latencies else 0
+
+    print(f'{name:>8}: read p50 {statistics.median(latencies) * 1000:8.1f}ms  p95 {p95 * 1000:8.1f}ms  '
+          f'max {latencies[-1] * 1000:8.1f}ms  logins {statuses.count(200) / duration:5.1f}/s  '
+          f'429s {statuses.count(429)}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--threads', type=int, default=8, help='Request threads of the server.')
+    parser.add_argument('--logins', type=int, default=16, help='Concurrent login clients.')
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--workers', type=int, default=2, help='Hashing pool processes.')
+    parser.add_argument('--queue-size', type=int, default=2)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+    from django.contrib.auth.models import User
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    from projects import hashing
+
+    user = User.objects.create_user('benchmark', password='password')
+    token = str(AccessToken.for_user(user))
+    server, base = make_server(args.threads)
+    logging.getLogger('django.request').setLevel(logging.ERROR)
+
+    _, latencies = run(base, token, 0, 3)
+    report('idle', [], latencies, 3)
+
+    modes = [
+        ('inline', {'WORKERS': 0, 'QUEUE_SIZE': 0, 'TIMEOUT': 30}),
+        ('pool', {'WORKERS': args.workers, 'QUEUE_SIZE': args.queue_size, 'TIMEOUT': 30}),
+    ]
+
+    for name, config in modes:
+        settings.PASSWORD_HASHING_POOL = config
+        hashing.reset_pool()
+        # Starts the pool processes before measuring.
+        request(f'{base}/login', {'username': 'benchmark', 'password': 'password'})
+
+        statuses, latencies = run(base, token, args.logins, args.duration)
+        report(name, statuses, latencies, args.duration)
+
+    hashing.reset_pool()
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
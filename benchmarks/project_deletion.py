@@ -0,0 +1,98 @@
+"""
+Compares deleting a large project through Django's collector
+(Project.delete()) with the batched set-based deletion of
+projects/deletion.py, and times the soft delete the API answers with when
+PROJECT_DELETION['BACKGROUND'] is set. A concurrent writer updates an issue
+of another project meanwhile, showing how long deletions block other writes.
+
+    python -m benchmarks.project_deletion --issues 20000 --comments 5
+"""
+import argparse
+import os
+import threading
+import time
+
+from .utils import setup_django
+
+
+def seed(issues, comments):
+    from django.core.management import call_command
+
+    from projects.models.Project import Project
+
+    call_command('seed_data', users=20, projects=1, contributors=5, issues=issues, comments=comments,
+                 stdout=open(os.devnull, 'w'))
+
+    return Project.all_objects.order_by('-id').first()
+
+
+def write_meanwhile(issue_id, stop, latencies, errors):
+    from django.db import OperationalError, connection
+
+    from projects.models.Issue import Issue
+
+    while not stop.is_set():
+        start = time.perf_counter()
+
+        try:
+            Issue.objects.filter(id=issue_id).update(title=f'write {start}')
+            latencies.append(time.perf_counter() - start)
+        except OperationalError:
+            errors.append(time.perf_counter() - start)
+
+        time.sleep(0.01)
+
+    connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--issues', type=int, default=20000, help='Mean issues of the deleted project.')
+    parser.add_argument('--comments', type=int, default=5, help='Mean comments per issue.')
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from projects import deletion
+    from projects.models.Comment import Comment
+    from projects.models.Issue import Issue
+
+    other = seed(0, 0)
+    other = Issue.objects.create(title='other', project=other, author=other.contributors.first())
+
+    print(f'{"deletion":>12} {"issues":>8} {"comments":>9} {"response":>11} {"purged":>11} '
+          f'{"max write wait":>15} {"failed writes":>14}')
+
+    for name in ('collector', 'batched', 'soft delete'):
+        project = seed(args.issues, args.comments)
+        rows = (Issue.objects.filter(project=project).count(),
+                Comment.objects.filter(issue__project=project).count())
+
+        stop = threading.Event()
+        latencies, errors = [], []
+        writer = threading.Thread(target=write_meanwhile, args=(other.id, stop, latencies, errors))
+        writer.start()
+        time.sleep(0.05)
+        start = time.perf_counter()
+
+        if name == 'collector':
+            project.delete()
+        elif name == 'batched':
+            deletion.delete_project(project.id, args.batch_size)
+        else:
+            deletion.soft_delete_project(project.id)
+
+        response = time.perf_counter() - start
+        deletion.purger.queue.join()
+        purged = time.perf_counter() - start
+
+        stop.set()
+        writer.join()
+
+        print(f'{name:>12} {rows[0]:>8} {rows[1]:>9} {response * 1000:>9.1f}ms {purged * 1000:>9.1f}ms '
+              f'{max(latencies + errors) * 1000:>13.1f}ms {len(errors):>14}')
+
+
+if __name__ == '__main__':
+    main()
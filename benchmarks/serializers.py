@@ -0,0 +1,83 @@
+"""
+Compares serializing and rendering issue lists through IssueSerializer and
+through the compiled RowSerializer path, checking that both produce the
+same bytes.
+
+    python -m benchmarks.serializers --rows 1000 10000 100000
+"""
+import argparse
+
+from .utils import setup_django, timed
+
+
+def seed(rows):
+    from django.contrib.auth.models import User
+    from django.db import connection, transaction
+
+    from projects.models.Project import Project
+
+    with transaction.atomic():
+        users = [User.objects.get_or_create(username=f'user{n}')[0] for n in range(10)]
+        project = Project.objects.create(title=f'benchmark {rows}')
+
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                'INSERT INTO projects_issue (title, description, tag, priority, status, project_id, '
+                'author_id, assignee_id, created_at) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)',
+                ((f'issue {n}', 'description ' * 20, 'bug', 'high', 'open', project.id,
+                  users[n % 10].id, users[n % 7].id if n % 3 else None,
+                  f'2022-01-01 00:00:{n % 60:02}.{n % 1000000:06}')
+                 for n in range(rows)))
+
+    return project
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from rest_framework.renderers import JSONRenderer
+
+    from projects.models.Issue import Issue, IssueSerializer
+    from projects.rows import RowSerializer
+
+    try:
+        from projects.renderers import ORJSONRenderer
+    except ImportError:
+        ORJSONRenderer = None
+
+    print(f'{"rows":>8} {"serializer":>12} {"rows path":>12} {"speedup":>8} {"+orjson":>10}')
+
+    for rows in args.rows:
+        project = seed(rows)
+
+        queryset = Issue.objects.filter(project=project).order_by('created_at', 'id')
+        compiled = RowSerializer.compile(IssueSerializer())
+        values = compiled.get_queryset(queryset)
+
+        def slow():
+            return JSONRenderer().render(IssueSerializer(queryset.all(), many=True).data)
+
+        def fast():
+            return JSONRenderer().render(compiled.to_representation(values.all()))
+
+        assert slow() == fast(), 'RowSerializer output differs from IssueSerializer'
+
+        slow_time = timed(slow, args.repeat)
+        fast_time = timed(fast, args.repeat)
+        line = f'{rows:>8} {slow_time * 1000:>10.1f}ms {fast_time * 1000:>10.1f}ms {slow_time / fast_time:>7.1f}x'
+
+        if ORJSONRenderer is not None:
+            orjson_time = timed(lambda: ORJSONRenderer().render(compiled.to_representation(values.all())),
+                                args.repeat)
+            line += f' {orjson_time * 1000:>8.1f}ms'
+
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+Concurrent read/write benchmark, once with the default SQLite configuration
+and once in production mode (P10_SQLITE_PRODUCTION=1).
+
+    python -m benchmarks.sqlite_concurrency --readers 8 --writers 2 --duration 10
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+from .utils import setup_django
+
+
+def run(readers, writers, duration):
+    from django.contrib.auth.models import User
+    from django.test import Client
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    from projects.models.Contributor import Contributor
+    from projects.models.Issue import Issue
+    from projects.models.Project import Project
+
+    user = User.objects.create(username='benchmark')
+    project = Project.objects.create(title='benchmark')
+    Contributor.objects.create(project=project, user=user, permission='author')
+    Issue.objects.bulk_create([
+        Issue(title=f'issue {n}', description='description', project=project, author=user)
+        for n in range(500)])
+    issue = Issue.objects.first()
+
+    authorization = f'Bearer {AccessToken.for_user(user)}'
+    deadline = time.monotonic() + duration
+    results = {'read': [], 'write': [], 'errors': 0}
+    lock = threading.Lock()
+
+    def worker(kind):
+        client = Client(HTTP_AUTHORIZATION=authorization)
+        latencies, errors = [], 0
+
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+
+            if kind == 'read':
+                response = client.get(f'/projects/{project.id}/issues?page_size=50')
+            else:
+                response = client.post(f'/projects/{project.id}/issues/{issue.id}/comments',
+                                       {'description': 'comment'}, content_type='application/json')
+
+            if response.status_code == 200:
+                latencies.append(time.perf_counter() - start)
+            else:
+                errors += 1
+
+        with lock:
+            results[kind] += latencies
+            results['errors'] += errors
+
+    threads = [threading.Thread(target=worker, args=('read',)) for _ in range(readers)]
+    threads += [threading.Thread(target=worker, args=('write',)) for _ in range(writers)]
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    summary = {'errors': results['errors']}
+
+    for kind in ['read', 'write']:
+        latencies = sorted(results[kind]) or [0]
+        summary[kind] = {
+            'throughput': len(results[kind]) / duration,
+            'p50': statistics.median(latencies) * 1000,
+            'p99': latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        }
+
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--writers', type=int, default=2)
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        setup_django()
+        print(json.dumps(run(args.readers, args.writers, args.duration)))
+        return
+
+    for mode, flag in [('default', '0'), ('production', '1')]:
+        output = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.sqlite_concurrency', '--child'] + sys.argv[1:],
+            env={**os.environ, 'P10_SQLITE_PRODUCTION': flag},
+            capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.splitlines()[-1])
+
+        for kind in ['read', 'write']:
+            print(f'{mode:10}  {kind:5}  {result[kind]["throughput"]:7.0f} req/s  '
+                  f'p50 {result[kind]["p50"]:7.1f} ms  p99 {result[kind]["p99"]:7.1f} ms')
+
+        print(f'{mode:10}  errors {result["errors"]}')
+
+
+if __name__ == '__main__':
+    main()
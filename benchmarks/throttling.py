@@ -0,0 +1,105 @@
+"""
+Times the throttle check, then simulates bursty clients against the
+throttled issue list: one client hammering it in a tight loop and others
+sending short bursts, reporting what each got against what its bucket
+allows. The throttling behavior itself is covered by projects/tests.py.
+
+    python -m benchmarks.throttling --seconds 5 --bursty 3
+"""
+import argparse
+import logging
+import threading
+import time
+
+from .utils import setup_django, timed
+
+
+def client_for(user):
+    from rest_framework.test import APIClient
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}')
+
+    return client
+
+
+def run(client, url, seconds, burst_size, pause, result):
+    deadline = time.monotonic() + seconds
+
+    while time.monotonic() < deadline:
+        for _ in range(burst_size):
+            response = client.get(url)
+
+            if response.status_code == 200:
+                result['accepted'] += 1
+            else:
+                result['rejected'] += 1
+
+        time.sleep(pause)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--bursty', type=int, default=3, help='Clients sending bursts.')
+    parser.add_argument('--burst-size', type=int, default=40)
+    parser.add_argument('--pause', type=float, default=1)
+    args = parser.parse_args()
+
+    setup_django(throttling=True)
+    logging.getLogger('django.request').setLevel(logging.ERROR)
+
+    from django.contrib.auth.models import User
+    from django.core.cache import caches
+    from rest_framework.test import APIRequestFactory
+
+    from projects.models.Contributor import Contributor
+    from projects.models.Issue import Issue
+    from projects.models.Project import Project
+    from projects.throttling import TokenBucketThrottle, get_bucket
+    from projects.views import ProjectIssuesView
+
+    project = Project.objects.create(title='throttling')
+    users = [User.objects.create(username=f'client{n}') for n in range(args.bursty + 1)]
+    Contributor.objects.bulk_create(Contributor(project=project, user=user, permission='author') for user in users)
+    Issue.objects.bulk_create(Issue(title=f'issue {n}', project=project, author=users[0]) for n in range(20))
+
+    url = f'/projects/{project.id}/issues'
+    rate, burst = get_bucket('ProjectIssuesView', 'read')
+
+    print(f'bucket: {rate} requests/s, burst {burst}')
+
+    request = APIRequestFactory().get(url)
+    request.user = users[0]
+    check = timed(lambda: [TokenBucketThrottle().allow_request(request, ProjectIssuesView()) for _ in range(10000)])
+    print(f'throttle check: {check / 10000 * 1e6:.1f}us')
+    caches['throttle'].clear()
+
+    results = [{'client': 'hammering', 'accepted': 0, 'rejected': 0}]
+    threads = [threading.Thread(target=run, args=(client_for(users[0]), url, args.seconds, 1, 0, results[0]))]
+
+    for n, user in enumerate(users[1:], 1):
+        results.append({'client': f'bursty {n}', 'accepted': 0, 'rejected': 0})
+        threads.append(threading.Thread(target=run, args=(
+            client_for(user), url, args.seconds, args.burst_size, args.pause, results[-1])))
+
+    start = time.monotonic()
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    elapsed = time.monotonic() - start
+    allowed = burst + rate * elapsed
+
+    print(f'{"client":>10} {"accepted":>9} {"rejected":>9} {"allowed":>9}')
+
+    for result in results:
+        print(f'{result["client"]:>10} {result["accepted"]:>9} {result["rejected"]:>9} {allowed:>9.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+import json
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def setup_django(database=None, throttling=False):
+    """
+    Configures Django against a scratch SQLite database (or the given one) and
+    applies the migrations, so that benchmarks never touch db.sqlite3.
+    Throttling is turned off unless asked for, the load would be rejected.
+    """
+    sys.path.insert(0, str(BASE_DIR))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'P10.settings')
+
+    from django.conf import settings
+
+    if database is None:
+        database = os.path.join(tempfile.mkdtemp(), 'benchmark.sqlite3')
+
+    for alias in settings.DATABASES.values():
+        alias['NAME'] = database
+
+    settings.ALLOWED_HOSTS = ['*']
+
+    if not throttling:
+        settings.REST_FRAMEWORK['DEFAULT_THROTTLE_CLASSES'] = ()
+
+    import django
+    django.setup()
+
+    from django.core.management import call_command
+    call_command('migrate', verbosity=0)
+
+    return database
+
+
+def timed(function, repeat=5):
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+
+    return statistics.median(timings)
+
+
+def make_server(threads):
+    from django.core.servers.basehttp import WSGIRequestHandler, WSGIServer
+    from django.core.wsgi import get_wsgi_application
+
+    class QuietHandler(WSGIRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+    class BoundedWSGIServer(WSGIServer):
+        # Serves requests on a fixed number of threads, like a gthread worker.
+        request_queue_size = 256
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.executor = ThreadPoolExecutor(threads)
+
+        def process_request(self, request, client_address):
+            self.executor.submit(self.process_request_thread, request, client_address)
+
+        def process_request_thread(self, request, client_address):
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+
+    server = BoundedWSGIServer(('127.0.0.1', 0), QuietHandler)
+    server.set_app(get_wsgi_application())
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server, f'http://127.0.0.1:{server.server_address[1]}'
+
+
+def request(url, data=None, token=None, method=None):
+    headers = {'Content-Type': 'application/json'}
+
+    if token:
+        headers['Authorization'] = f'Bearer {token}'
+
+    body = json.dumps(data).encode() if data is not None else None
+
+    try:
+        with urllib.request.urlopen(
+                urllib.request.Request(url, body, headers, method=method), timeout=60) as response:
+            return response.status, response.read()
+    except urllib.error.HTTPError as error:
+        return error.code, error.read()
@@ -0,0 +1,124 @@
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connections, router, transaction
+from django.utils import timezone
+
+from .deletion import pause
+from .models.Archive import ArchivedComment, ArchivedIssue, TriggerSuppression
+from .models.Comment import Comment
+from .models.Issue import Issue
+
+HOT = (Issue, Comment)
+ARCHIVE = (ArchivedIssue, ArchivedComment)
+
+
+@contextmanager
+def suppressed_triggers(using):
+    """
+    Runs the block in a transaction whose inserts and deletes of issues and
+    comments the search index, statistics and change log triggers ignore.
+    """
+    with transaction.atomic(using=using):
+        # Writing first takes the write lock up front: a SQLite transaction
+        # starting with a read fails when another writer holds it.
+        TriggerSuppression.objects.using(using).create()
+        yield
+        TriggerSuppression.objects.using(using).all().delete()
+
+
+def copy(queryset, target, using):
+    """
+    Copies the rows of `queryset` into the table of `target`, whose columns
+    have the same names, with a single INSERT ... SELECT.
+    """
+    connection = connections[using]
+    fields = target._meta.concrete_fields
+    select, params = queryset.values_list(*[field.attname for field in fields]).query.get_compiler(using).as_sql()
+    columns = ', '.join(connection.ops.quote_name(field.column) for field in fields)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'INSERT INTO {connection.ops.quote_name(target._meta.db_table)} ({columns}) {select}', params)
+
+
+def move(ids, source, target, using):
+    """
+    Moves issues with their comments from the `source` (issue, comment)
+    tables to the `target` ones, keeping their ids.
+    """
+    (issue_model, comment_model), (target_issue_model, target_comment_model) = source, target
+
+    copy(issue_model.objects.using(using).filter(id__in=ids), target_issue_model, using)
+
+    comments = comment_model.objects.using(using).filter(issue_id__in=ids)
+    copy(comments, target_comment_model, using)
+    comments._raw_delete(using)
+
+    issue_model.objects.using(using).filter(id__in=ids)._raw_delete(using)
+
+
+def archive_issues(age=None, statuses=None, batch_size=None):
+    """
+    Moves the issues with one of `statuses` created more than `age` ago into
+    the archive tables with their comments, `batch_size` issues per
+    transaction. Returns the number of issues archived.
+    """
+    age = timedelta(days=settings.ISSUE_ARCHIVE['DAYS']) if age is None else age
+    statuses = statuses or settings.ISSUE_ARCHIVE['STATUSES']
+    batch_size = batch_size or settings.ISSUE_ARCHIVE['BATCH_SIZE']
+
+    using = router.db_for_write(Issue)
+    issues = Issue.objects.using(using).filter(status__in=statuses, created_at__lt=timezone.now() - age)
+    archived = 0
+
+    while True:
+        started = time.perf_counter()
+        candidates = list(issues.values_list('id', flat=True)[:batch_size])
+
+        if not candidates:
+            return archived
+
+        with suppressed_triggers(using):
+            # Issues reopened since they were read stay.
+            ids = list(issues.filter(id__in=candidates).values_list('id', flat=True))
+            move(ids, HOT, ARCHIVE, using)
+
+        archived += len(ids)
+        pause(started)
+
+        if len(candidates) < batch_size:
+            return archived
+
+
+def restore_issues(issue_ids, project_id):
+    """
+    Moves the archived issues of the project back into the Issue table with
+    their comments. Returns the ids of the issues restored.
+    """
+    using = router.db_for_write(Issue)
+    issues = ArchivedIssue.objects.using(using).filter(id__in=issue_ids, project_id=project_id)
+
+    if not issues.exists():
+        return []
+
+    with suppressed_triggers(using):
+        ids = list(issues.values_list('id', flat=True))
+        move(ids, ARCHIVE, HOT, using)
+
+    return ids
+
+
+def get_issue(issue_id, project_id):
+    """
+    Returns the issue, restored first when it is an archived issue of the
+    project, or None. An archived issue of another project is returned as it
+    is, for the caller to reject.
+    """
+    issue = Issue.objects.filter(id=issue_id).first()
+
+    if issue is None and restore_issues([issue_id], project_id):
+        issue = Issue.objects.filter(id=issue_id).first()
+
+    return issue or ArchivedIssue.objects.filter(id=issue_id).first()
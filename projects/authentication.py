@@ -0,0 +1,180 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from . import membership
+from .models.MembershipVersion import MembershipVersion
+
+IDENTITY_FIELDS = ['id', 'username', 'is_active', 'is_staff', 'is_superuser']
+
+
+class UserCache:
+    """
+    Bounded LRU of user identities with a TTL, shared by the threads of a
+    process. Entries are dropped on user save or delete (see signals.py); the
+    TTL bounds staleness for changes made by other processes.
+    """
+
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id):
+        with self.lock:
+            entry = self.entries.get(user_id)
+
+            if entry is None or entry[0] < time.monotonic():
+                self.entries.pop(user_id, None)
+                self.misses += 1
+                return None
+
+            self.entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, user_id, identity):
+        with self.lock:
+            self.entries[user_id] = (time.monotonic() + self.ttl, identity)
+            self.entries.move_to_end(user_id)
+
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, user_id):
+        with self.lock:
+            self.entries.pop(user_id, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def hit_ratio(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+user_cache = UserCache(settings.AUTH_USER_CACHE['MAX_SIZE'], settings.AUTH_USER_CACHE['TTL'])
+# Membership versions by user. Entries are dropped on membership changes made
+# by this process (see signals.py), VERSION_TTL bounds how long other
+# processes keep trusting the claims of a stale token.
+version_cache = UserCache(settings.AUTH_USER_CACHE['MAX_SIZE'], settings.MEMBERSHIP_CLAIMS['VERSION_TTL'])
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that only queries the user table on a cache miss. Other
+    requests get a User rebuilt from the cached identity, without a query.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        if self.carries_memberships(validated_token):
+            version = version_cache.get(user_id)
+
+            if version is None:
+                version = membership.get_version(user_id)
+                version_cache.set(user_id, version)
+
+            self.check_version(validated_token, version)
+
+        cached = user_cache.get(user_id)
+
+        if cached is not None:
+            return self.build_user(cached)
+
+        user = super().get_user(validated_token)
+        self.cache_user(user_id, user)
+
+        return user
+
+    def carries_memberships(self, validated_token):
+        return membership.VERSION_CLAIM in validated_token and membership.is_available()
+
+    def check_version(self, validated_token, version):
+        """
+        Drops the membership claims of a token issued before a membership of
+        the user changed, so the views look memberships up in the database
+        until the client refreshes it.
+        """
+        if validated_token[membership.VERSION_CLAIM] != version:
+            del validated_token[membership.CLAIM]
+
+    def cache_user(self, user_id, user):
+        identity = {field: getattr(user, field) for field in IDENTITY_FIELDS}
+        user_cache.set(user_id, (identity, user._state.db))
+
+    def build_user(self, cached):
+        identity, db = cached
+
+        user = self.user_model(**identity)
+        user._state.adding = False
+        user._state.db = db
+
+        return user
+
+
+class AsyncJWTAuthentication(CachedJWTAuthentication):
+    """
+    JWTAuthentication for native async views: token validation is pure CPU
+    work and the user is loaded through the async ORM.
+    """
+
+    async def aauthenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        if self.carries_memberships(validated_token):
+            version = version_cache.get(user_id)
+
+            if version is None:
+                version = await MembershipVersion.objects.filter(user_id=user_id).values_list(
+                    'version', flat=True).afirst() or 0
+                version_cache.set(user_id, version)
+
+            self.check_version(validated_token, version)
+
+        cached = user_cache.get(user_id)
+
+        if cached is not None:
+            return self.build_user(cached)
+
+        try:
+            user = await self.user_model.objects.aget(**{api_settings.USER_ID_FIELD: user_id})
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        self.cache_user(user_id, user)
+
+        return user
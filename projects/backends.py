@@ -0,0 +1,39 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+from . import hashing
+
+UserModel = get_user_model()
+
+
+class PooledModelBackend(ModelBackend):
+    """
+    ModelBackend verifying passwords in the hashing pool (see hashing.py).
+    Raises Throttled when the pool is saturated, HashingTimeout when the check
+    takes too long.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+
+        if username is None or password is None:
+            return None
+
+        try:
+            user = UserModel._default_manager.get_by_natural_key(username)
+        except UserModel.DoesNotExist:
+            # Hash anyway, so unknown usernames take as long as wrong passwords.
+            hashing.make_password(password)
+            return None
+
+        is_correct, upgrade = hashing.check_password(password, user.password)
+
+        if not is_correct or not self.user_can_authenticate(user):
+            return None
+
+        if upgrade:
+            user.password = hashing.make_password(password)
+            user.save(update_fields=['password'])
+
+        return user
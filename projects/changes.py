@@ -0,0 +1,157 @@
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from .models.Archive import ArchivedComment, ArchivedIssue
+from .models.Change import Change, ChangeHorizon
+from .models.Comment import Comment, CommentSerializer
+from .models.Contributor import Contributor, ContributorSerializer
+from .models.Issue import Issue, IssueSerializer
+from .models.Project import Project, ProjectSerializer
+
+
+def is_available():
+    """
+    The change log is written by SQLite triggers, created in the
+    0008_change_log migration.
+    """
+    return connection.vendor == 'sqlite'
+
+
+def get_horizon():
+    return ChangeHorizon.objects.values_list('seq', flat=True).first() or 0
+
+
+def get_access_end(project_id, user_id):
+    """
+    For a user who is no longer a contributor of the project, returns
+    `(reason, seq)`: why they lost access, 'deleted' or 'removed', and the
+    sequence number of the change that ended it, the project's tombstone or
+    their own removal. Returns None when they never were a contributor, or
+    the change was compacted.
+    """
+    tombstones = Change.objects.filter(project_id=project_id, kind='project', object_id=project_id, action='delete')
+    # Purging logs another tombstone, after the removal of the contributors.
+    tombstone = tombstones.order_by('id').values_list('id', flat=True).first()
+
+    # Deleted in the background and not purged yet: contributors are still there.
+    if tombstone and Contributor.objects.filter(project_id=project_id, user_id=user_id).exists():
+        return 'deleted', tombstone
+
+    removal = Change.objects.filter(
+        project_id=project_id, kind='contributor', object_id=user_id, action='delete').order_by(
+        '-id').values_list('id', flat=True).first()
+
+    if removal is None:
+        return None
+
+    # Purging a project removes its contributors after its tombstone.
+    return 'deleted' if tombstone and tombstone < removal else 'removed', removal
+
+
+def get_changes(project_id, since, limit, until=None, serialize=True):
+    """
+    Returns the changes logged after `since` (at most `limit` log entries,
+    keeping only the latest entry of an object changed several times), the
+    sequence number to continue from, and whether more changes follow.
+    Entries after `until` are left out, and `serialize=False` leaves out the
+    current state of the objects.
+    """
+    entries = Change.objects.filter(project_id=project_id, id__gt=since)
+
+    if until is not None:
+        entries = entries.filter(id__lte=until)
+
+    entries = list(entries.order_by('id').values_list('id', 'kind', 'object_id', 'action')[:limit + 1])
+
+    more = len(entries) > limit
+    entries = entries[:limit]
+    latest = {}
+
+    for seq, kind, object_id, action in entries:
+        latest.pop((kind, object_id), None)
+        latest[(kind, object_id)] = (seq, action)
+
+    data = load(project_id, [key for key, (_, action) in latest.items() if action != 'delete']) if serialize else {}
+
+    changes = [{'seq': seq, 'type': kind, 'id': object_id, 'action': action, 'data': data.get((kind, object_id))}
+               for (kind, object_id), (seq, action) in latest.items()]
+
+    return changes, entries[-1][0] if entries else since, more
+
+
+def load(project_id, keys):
+    """
+    Serializes the current state of the (kind, id) objects, with one query per
+    kind. Objects deleted since they were logged are left out.
+    """
+    ids = {}
+
+    for kind, object_id in keys:
+        ids.setdefault(kind, []).append(object_id)
+
+    data = {}
+
+    if 'project' in ids:
+        projects = list(Project.objects.with_contributors().filter(id__in=ids['project']))
+
+        for project, serialized in zip(projects, ProjectSerializer(projects, many=True).data):
+            data[('project', project.id)] = serialized
+
+    if 'contributor' in ids:
+        contributors = list(Contributor.objects.with_username().filter(
+            project_id=project_id, user_id__in=ids['contributor']))
+
+        for contributor, serialized in zip(contributors, ContributorSerializer(contributors, many=True).data):
+            data[('contributor', contributor.user_id)] = serialized
+
+    # Archived issues and comments keep their ids, look there for the ones
+    # no longer in the live tables.
+    for model in (Issue, ArchivedIssue):
+        missing = [id for id in ids.get('issue', []) if ('issue', id) not in data]
+
+        if not missing:
+            break
+
+        issues = list(model.objects.filter(project_id=project_id, id__in=missing))
+
+        for issue, serialized in zip(issues, IssueSerializer(issues, many=True).data):
+            data[('issue', issue.id)] = serialized
+
+    for model in (Comment, ArchivedComment):
+        missing = [id for id in ids.get('comment', []) if ('comment', id) not in data]
+
+        if not missing:
+            break
+
+        comments = list(model.objects.filter(issue__project_id=project_id, id__in=missing))
+
+        for comment, serialized in zip(comments, CommentSerializer(comments, many=True).data):
+            data[('comment', comment.id)] = serialized
+
+    return data
+
+
+def compact(tombstone_age):
+    """
+    Drops entries superseded by a later entry for the same object, entries of
+    deleted projects but their tombstone, and tombstones older than
+    `tombstone_age`. Clients that synced before the newest purged tombstone
+    can no longer catch up, see get_horizon().
+    """
+    with transaction.atomic():
+        latest = Change.objects.values('project_id', 'kind', 'object_id').annotate(
+            latest=Max('id')).values('latest')
+        superseded, _ = Change.objects.exclude(id__in=latest).delete()
+
+        deleted_projects = Change.objects.filter(kind='project', action='delete').values('project_id')
+        orphaned, _ = Change.objects.filter(project_id__in=deleted_projects).exclude(kind='project').delete()
+
+        expired = Change.objects.filter(action='delete', created_at__lt=timezone.now() - tombstone_age)
+        horizon = expired.aggregate(Max('id'))['id__max']
+        purged, _ = expired.delete()
+
+        if horizon is not None:
+            ChangeHorizon.objects.update_or_create(id=1, defaults={'seq': max(horizon, get_horizon())})
+
+    return superseded + orphaned + purged
@@ -0,0 +1,87 @@
+import asyncio
+import hashlib
+from functools import wraps
+
+from django.http import HttpResponseNotModified
+from django.utils.http import parse_etags
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+
+from .models.Project import Project
+
+
+NOT_FOUND = {'error': 'Project not found.'}
+
+
+def get_etag(request, version):
+    """
+    Builds a weak ETag from the project version and everything else that
+    shapes the response: the path, the query string and the negotiated format.
+    """
+    variant = f'{request.get_full_path()}|{request.META.get("HTTP_ACCEPT", "")}'
+    digest = hashlib.md5(variant.encode()).hexdigest()[:16]
+
+    return f'W/"{version}-{digest}"'
+
+
+def etag_matches(request, etag):
+    header = request.META.get('HTTP_IF_NONE_MATCH')
+
+    if not header:
+        return False
+
+    etags = parse_etags(header)
+
+    return '*' in etags or etag.removeprefix('W/') in [tag.removeprefix('W/') for tag in etags]
+
+
+def conditional_project_get(view_method):
+    """
+    Answers `If-None-Match` with a 304 from the project version alone, before
+    the wrapped view runs its listing query or serializer. Projects that do
+    not exist, or are deleted and waiting for the purge, answer 404.
+    """
+    if asyncio.iscoroutinefunction(view_method):
+        @wraps(view_method)
+        async def async_wrapper(self, request, project_id, *args, **kwargs):
+            version = await Project.objects.filter(
+                id=project_id).values_list('version', flat=True).afirst()
+
+            if version is None:
+                raise NotFound(NOT_FOUND)
+
+            etag = get_etag(request, version)
+
+            if etag_matches(request, etag):
+                return HttpResponseNotModified(headers={'ETag': etag})
+
+            response = await view_method(self, request, project_id, *args, **kwargs)
+
+            if response.status_code == 200:
+                response['ETag'] = etag
+
+            return response
+
+        return async_wrapper
+
+    @wraps(view_method)
+    def wrapper(self, request, project_id, *args, **kwargs):
+        version = Project.objects.filter(
+            id=project_id).values_list('version', flat=True).first()
+
+        if version is None:
+            raise NotFound(NOT_FOUND)
+
+        etag = get_etag(request, version)
+
+        if etag_matches(request, etag):
+            return Response(status=304, headers={'ETag': etag})
+
+        response = view_method(self, request, project_id, *args, **kwargs)
+
+        if response.status_code == 200:
+            response['ETag'] = etag
+
+        return response
+
+    return wrapper
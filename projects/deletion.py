@@ -0,0 +1,157 @@
+import logging
+import queue
+import threading
+import time
+
+from django.conf import settings
+from django.db import connections, router, transaction
+from django.utils import timezone
+
+from .authentication import version_cache
+from .models.Archive import ArchivedIssue
+from .models.Contributor import Contributor
+from .models.Issue import Issue
+from .models.IssueStat import IssueStat
+from .models.Project import Project
+
+logger = logging.getLogger(__name__)
+
+
+def pause(started):
+    """
+    Leaves the database to other writers after a batch, for as long as the
+    batch took times PAUSE_RATIO. SQLite makes waiting writers poll for the
+    lock with growing sleeps, without a pause they would rarely get it back.
+    """
+    time.sleep((time.perf_counter() - started) * settings.PROJECT_DELETION['PAUSE_RATIO'])
+
+
+def delete_in_batches(queryset, batch_size):
+    """
+    Deletes the rows of `queryset` with set-based DELETEs of `batch_size`
+    rows, each in its own transaction so that other writers get the database
+    between batches. The collector and the delete signals are skipped, the
+    caller deletes dependent rows first.
+    """
+    model = queryset.model
+    using = router.db_for_write(model)
+    deleted = 0
+
+    while True:
+        started = time.perf_counter()
+
+        with transaction.atomic(using=using):
+            count = model._base_manager.filter(pk__in=queryset.values('pk')[:batch_size])._raw_delete(using)
+
+        deleted += count
+        pause(started)
+
+        if count < batch_size:
+            return deleted
+
+
+def delete_issues(issues, batch_size):
+    """
+    Deletes issues, live or archived, with their comments, `batch_size`
+    issues per transaction. Going through the issues keeps each batch from
+    scanning again the issues whose comments are already deleted.
+    """
+    using = router.db_for_write(Issue)
+    issues = issues.using(using)
+    issue_model, comment_model = issues.model, issues.get_comment_model()
+    deleted = 0
+
+    while True:
+        started = time.perf_counter()
+        # Read outside of the transaction: one starting with a read cannot
+        # wait for the write lock on SQLite, it fails when another writer holds it.
+        ids = list(issues.values_list('id', flat=True)[:batch_size])
+
+        with transaction.atomic(using=using):
+            comment_model._base_manager.filter(issue_id__in=ids)._raw_delete(using)
+            deleted += issue_model._base_manager.filter(id__in=ids)._raw_delete(using)
+
+        pause(started)
+
+        if len(ids) < batch_size:
+            return deleted
+
+
+def forget_memberships(project_id):
+    """
+    Drops the cached membership versions of the project contributors, whose
+    tokens the triggers make stale when the project is deleted.
+    """
+    for user_id in Contributor.objects.filter(project_id=project_id).values_list('user_id', flat=True):
+        version_cache.invalidate(user_id)
+
+
+def delete_project(project_id, batch_size=None):
+    """
+    Deletes a project and everything in it, in dependency order. Database
+    triggers still keep the statistics, change log and search index in step.
+    """
+    batch_size = batch_size or settings.PROJECT_DELETION['BATCH_SIZE']
+
+    if Project.objects.filter(id=project_id).exists():
+        forget_memberships(project_id)
+
+    delete_issues(Issue.objects.filter(project_id=project_id), batch_size)
+    delete_issues(ArchivedIssue.objects.filter(project_id=project_id), batch_size)
+    delete_in_batches(Contributor.objects.filter(project_id=project_id), batch_size)
+    delete_in_batches(IssueStat.objects.filter(project_id=project_id), batch_size)
+    delete_in_batches(Project.all_objects.filter(id=project_id), batch_size)
+
+
+class Purger:
+    """
+    Purges the projects marked as deleted one after the other on a daemon
+    thread. Projects still marked when the process exits are left to the
+    purge_deleted_projects command.
+    """
+
+    def __init__(self):
+        self.queue = queue.Queue()
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def submit(self, project_id):
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self.run, name='project-purger', daemon=True)
+                self.thread.start()
+
+        self.queue.put(project_id)
+
+    def run(self):
+        while True:
+            project_id = self.queue.get()
+
+            try:
+                delete_project(project_id)
+            except Exception:
+                logger.exception('Purging project %s failed.', project_id)
+            finally:
+                connections.close_all()
+                self.queue.task_done()
+
+
+purger = Purger()
+
+
+def soft_delete_project(project_id):
+    """
+    Hides the project from the API at once and purges it in the background.
+    """
+    Project.objects.filter(id=project_id).update(deleted_at=timezone.now())
+    forget_memberships(project_id)
+    transaction.on_commit(lambda: purger.submit(project_id))
+
+
+def purge_deleted_projects(batch_size=None):
+    project_ids = list(Project.all_objects.filter(deleted_at__isnull=False).values_list('id', flat=True))
+
+    for project_id in project_ids:
+        delete_project(project_id, batch_size)
+
+    return project_ids
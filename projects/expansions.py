@@ -0,0 +1,68 @@
+from django.contrib.auth import get_user_model
+from rest_framework import serializers
+
+
+class UserSummarySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = get_user_model()
+        fields = ['id', 'username']
+
+
+class ExpandableMixin:
+    """
+    Lets a model serializer inline related data named with the `expand`
+    keyword argument. `users` swaps the ids of `user_fields` for user
+    summaries; the other `expansions` add the fields returned by
+    get_expanded_fields(). Goes before SparseFieldsetMixin, so expanded
+    fields are added whatever the fieldset.
+    """
+    expansions = ['users']
+    user_fields = []
+
+    def __init__(self, *args, **kwargs):
+        self.expand = set(kwargs.pop('expand', ()))
+
+        super().__init__(*args, **kwargs)
+
+        if 'users' in self.expand:
+            for name in self.get_user_fields():
+                self.fields[name] = UserSummarySerializer(read_only=True)
+
+        for name, field in self.get_expanded_fields().items():
+            self.fields[name] = field
+
+    @classmethod
+    def get_fieldset(cls, params):
+        """
+        Reads `?expand=` along with `?fields=` / `?exclude=`.
+        """
+        fieldset = super().get_fieldset(params)
+
+        if 'expand' in params:
+            names = [name.strip() for name in params['expand'].split(',') if name.strip()]
+
+            for name in names:
+                if name not in cls.expansions:
+                    raise ValueError(f'Invalid expansion. ({name})')
+
+            fieldset['expand'] = names
+
+        return fieldset
+
+    def get_user_fields(self):
+        return [name for name in self.user_fields if name in self.fields]
+
+    def get_expanded_fields(self):
+        return {}
+
+    def narrow_queryset(self, queryset, extra=()):
+        """
+        Joins the expanded users, loading only the columns of their summary
+        even when the fieldset is not narrowed.
+        """
+        if 'users' not in self.expand or not self.get_user_fields():
+            return super().narrow_queryset(queryset, extra)
+
+        queryset = queryset.select_related(*self.get_user_fields())
+
+        return queryset.only(*self.get_only_fields(), *[name.lstrip('-') for name in extra])
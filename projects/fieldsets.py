@@ -0,0 +1,78 @@
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+
+class SparseFieldsetMixin:
+    """
+    Lets a model serializer be narrowed with the `fields` or `exclude` keyword
+    arguments, and narrows querysets to the columns the remaining fields read.
+    """
+    fieldset_params = ['fields', 'exclude']
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        exclude = kwargs.pop('exclude', None)
+
+        super().__init__(*args, **kwargs)
+
+        self.is_sparse = fields is not None or exclude is not None
+
+        if not self.is_sparse:
+            return
+
+        for name in list(self.fields):
+            if (fields is not None and name not in fields) or (exclude is not None and name in exclude):
+                self.fields.pop(name)
+
+    @classmethod
+    def get_fieldset(cls, params):
+        """
+        Reads `?fields=` / `?exclude=` into serializer keyword arguments.
+        """
+        fieldset = {}
+
+        for param in cls.fieldset_params:
+            if param not in params:
+                continue
+
+            names = [name.strip() for name in params[param].split(',') if name.strip()]
+
+            for name in names:
+                if name not in cls.Meta.fields:
+                    raise ValueError(f'Invalid field. ({name})')
+
+            fieldset[param] = names
+
+        return fieldset
+
+    def get_only_fields(self):
+        opts = self.Meta.model._meta
+        only = {opts.pk.name}
+
+        for field in self.fields.values():
+            path = field.source.split('.')
+
+            try:
+                model_field = opts.get_field(path[0])
+            except FieldDoesNotExist:
+                continue
+
+            if model_field.concrete:
+                only.update([path[0], '__'.join(path)])
+
+                # A nested serializer reads its columns through select_related().
+                if isinstance(field, serializers.Serializer):
+                    only.update(f'{"__".join(path)}__{child.source}'
+                                for child in field.fields.values() if child.source != '*')
+
+        return only
+
+    def narrow_queryset(self, queryset, extra=()):
+        """
+        Defers the columns no remaining field reads. `extra` lists columns the
+        caller needs regardless, such as the pagination ordering.
+        """
+        if not self.is_sparse:
+            return queryset
+
+        return queryset.only(*self.get_only_fields(), *[name.lstrip('-') for name in extra])
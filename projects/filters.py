@@ -0,0 +1,56 @@
+ISSUE_FILTER_FIELDS = ['status', 'priority', 'tag', 'assignee']
+ISSUE_ORDERING_FIELDS = ['created_at', 'status', 'priority', 'tag', 'assignee']
+
+
+def filter_issues(queryset, params):
+    for field in ISSUE_FILTER_FIELDS:
+        if field not in params:
+            continue
+
+        value = params[field]
+
+        if field == 'assignee':
+            if value == 'none':
+                queryset = queryset.filter(assignee__isnull=True)
+                continue
+
+            if not value.isdigit():
+                raise ValueError(f'Invalid filter value. ({field})')
+
+        queryset = queryset.filter(**{field: value})
+
+    return queryset
+
+
+def get_issue_ordering(params):
+    if 'ordering' not in params:
+        return ('created_at', 'id')
+
+    ordering = [name.strip() for name in params['ordering'].split(',') if name.strip()]
+
+    for name in ordering:
+        if name.lstrip('-') not in ISSUE_ORDERING_FIELDS:
+            raise ValueError(f'Invalid ordering. ({name})')
+
+    if not ordering:
+        raise ValueError('Invalid ordering.')
+
+    if 'created_at' not in [name.lstrip('-') for name in ordering]:
+        ordering.append('-created_at' if ordering[0].startswith('-') else 'created_at')
+
+    ordering.append('-id' if ordering[0].startswith('-') else 'id')
+
+    return tuple(ordering)
+
+
+def include_archived(params):
+    """
+    Reads `?include_archived=`, the opt-in to list archived issues and
+    comments along with the others, see projects/archive.py.
+    """
+    value = params.get('include_archived', 'false')
+
+    if value not in ('true', 'false'):
+        raise ValueError('Invalid filter value. (include_archived)')
+
+    return value == 'true'
@@ -0,0 +1,130 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from django.contrib.auth import hashers
+from rest_framework.exceptions import APIException, Throttled
+
+DEFAULTS = {
+    'WORKERS': 2,
+    'QUEUE_SIZE': 8,
+    'TIMEOUT': 30,
+}
+
+
+class HashingTimeout(APIException):
+    status_code = 503
+    default_detail = 'Password check timed out.'
+    default_code = 'hashing_timeout'
+
+
+class HashingPool:
+    """
+    Runs password hashing and verification in a process pool, so request
+    workers wait on it instead of spending their CPU time on PBKDF2. At most
+    WORKERS + QUEUE_SIZE jobs are accepted at once; beyond that callers get a
+    429 right away rather than tying up more request workers. Jobs running
+    longer than TIMEOUT seconds answer a 503. With WORKERS set to 0 the work
+    runs inline.
+    """
+
+    def __init__(self, workers, queue_size, timeout):
+        self.workers = workers
+        self.timeout = timeout
+        self.slots = threading.BoundedSemaphore(workers + queue_size)
+        self.lock = threading.Lock()
+        self.executor = None
+
+    def get_executor(self):
+        with self.lock:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(
+                    self.workers, mp_context=multiprocessing.get_context('spawn'),
+                    initializer=initialize_worker)
+
+            return self.executor
+
+    def run(self, function, *args):
+        if not self.workers:
+            return function(*args)
+
+        if not self.slots.acquire(blocking=False):
+            raise Throttled(wait=1, detail='Too many password checks in progress.')
+
+        try:
+            future = self.get_executor().submit(function, *args)
+        except BaseException:
+            self.slots.release()
+            raise
+
+        # The slot is held until the job is done, even if the caller stops waiting.
+        future.add_done_callback(lambda _: self.slots.release())
+
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            raise HashingTimeout()
+        except BrokenProcessPool:
+            self.shutdown()
+            raise
+
+    def shutdown(self):
+        with self.lock:
+            if self.executor is not None:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = None
+
+
+def initialize_worker():
+    import django
+    django.setup()
+
+
+def hash_password(password):
+    return hashers.make_password(password)
+
+
+def verify_password(password, encoded):
+    """
+    Returns whether the password matches, and whether its hash should be
+    upgraded to the preferred hasher.
+    """
+    upgrade = []
+    is_correct = hashers.check_password(password, encoded, setter=upgrade.append)
+
+    return is_correct, bool(upgrade)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            config = {**DEFAULTS, **getattr(settings, 'PASSWORD_HASHING_POOL', {})}
+            _pool = HashingPool(config['WORKERS'], config['QUEUE_SIZE'], config['TIMEOUT'])
+
+        return _pool
+
+
+def reset_pool():
+    global _pool
+
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
+
+
+def make_password(password):
+    return get_pool().run(hash_password, password)
+
+
+def check_password(password, encoded):
+    return get_pool().run(verify_password, password, encoded)
@@ -0,0 +1,24 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from projects import archive
+
+
+class Command(BaseCommand):
+    help = ('Moves old issues with a terminal status, with their comments, to the archive tables. '
+            'They are restored as soon as they are edited or commented on.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.ISSUE_ARCHIVE['DAYS'],
+                            help="Age after which issues are archived (default ISSUE_ARCHIVE['DAYS']).")
+        parser.add_argument('--status', action='append', dest='statuses',
+                            help="Status to archive, repeatable (default ISSUE_ARCHIVE['STATUSES']).")
+        parser.add_argument('--batch-size', type=int, default=None,
+                            help="Issues moved per transaction (default ISSUE_ARCHIVE['BATCH_SIZE']).")
+
+    def handle(self, *args, **options):
+        archived = archive.archive_issues(timedelta(days=options['days']), options['statuses'], options['batch_size'])
+
+        self.stdout.write(self.style.SUCCESS(f'{archived} issues archived.'))
@@ -0,0 +1,22 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from projects import changes
+
+
+class Command(BaseCommand):
+    help = ('Compacts the change log: keeps the latest entry of each object and '
+            'purges tombstones older than --days.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=30,
+                            help='Age after which tombstones are purged (default 30).')
+
+    def handle(self, *args, **options):
+        if not changes.is_available():
+            raise CommandError('The change log is only recorded on SQLite databases.')
+
+        removed = changes.compact(timedelta(days=options['days']))
+
+        self.stdout.write(self.style.SUCCESS(f'{removed} change log entries removed.'))
@@ -0,0 +1,295 @@
+import csv
+import json
+import time
+from collections import Counter, defaultdict
+from itertools import islice
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from projects.models.Comment import Comment
+from projects.models.Contributor import Contributor
+from projects.models.Import import ImportedObject, ImportJob
+from projects.models.Issue import Issue
+from projects.models.Project import Project
+
+User = get_user_model()
+
+ISSUE_FIELDS = ['title', 'description', 'tag', 'priority', 'status']
+
+
+def read_ndjson(file):
+    for line in file:
+        if line.strip():
+            record = json.loads(line)
+            yield record['type'], record['data']
+
+
+def read_csv(file):
+    for row in csv.DictReader(file):
+        kind = row.pop('type', None)
+        yield kind, {key: value for key, value in row.items() if value not in ('', None)}
+
+
+def parse_created_at(data):
+    value = parse_datetime(data['created_at']) if data.get('created_at') else None
+
+    if value is not None and timezone.is_naive(value):
+        value = timezone.make_aware(value, timezone.utc)
+
+    return value
+
+
+class UserResolver:
+    """
+    Maps external user references to User ids. Answers are cached for the
+    whole import and the misses of a batch are resolved with one query.
+    """
+
+    def __init__(self, create):
+        self.create = create
+        self.cache = {}
+
+    def prefetch(self, field, values):
+        missing = {str(value) for value in values if (field, str(value)) not in self.cache}
+
+        if field == 'id':
+            # Not an id, left unresolved rather than failing the query.
+            for value in missing:
+                if not value.isdecimal():
+                    self.cache[(field, value)] = None
+
+            missing = {value for value in missing if value.isdecimal()}
+
+        if not missing:
+            return
+
+        if self.create and field == 'username':
+            existing = set(User.objects.filter(username__in=missing).values_list('username', flat=True))
+            User.objects.bulk_create([User(username=username, password=make_password(None))
+                                      for username in missing - existing])
+
+        for value, user_id in User.objects.filter(**{f'{field}__in': missing}).values_list(field, 'id'):
+            self.cache[(field, str(value))] = user_id
+
+        for value in missing:
+            self.cache.setdefault((field, value), None)
+
+    def get(self, field, value):
+        if value is None:
+            return None
+
+        return self.cache.get((field, str(value)))
+
+
+class Command(BaseCommand):
+    help = ('Imports projects, contributors, issues and comments from an NDJSON file '
+            '(as produced by the export endpoint) or a CSV file with a `type` column. '
+            'Interrupted imports resume from their last committed batch.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--format', choices=['ndjson', 'csv'],
+                            help='Defaults to csv for .csv files and ndjson otherwise.')
+        parser.add_argument('--job', help='Import job name, used to resume (defaults to the file name).')
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--user-field', choices=['username', 'id'],
+                            help='User field matched by the author, assignee and user references. Defaults to '
+                                 'id for NDJSON files, whose exports reference users by id, and username for CSV.')
+        parser.add_argument('--create-users', action='store_true',
+                            help='Create missing users (username references only).')
+
+    def handle(self, *args, **options):
+        path = Path(options['path'])
+        is_csv = (options['format'] or path.suffix.lstrip('.')) == 'csv'
+        reader = read_csv if is_csv else read_ndjson
+        job, _ = ImportJob.objects.get_or_create(name=options['job'] or path.name)
+
+        if job.finished_at:
+            self.stdout.write(f'Import job "{job.name}" already finished.')
+            return
+
+        self.user_field = options['user_field'] or ('username' if is_csv else 'id')
+        self.users = UserResolver(options['create_users'])
+        self.ids = defaultdict(dict)
+        self.skipped = Counter()
+
+        for kind, external_id, object_id in job.imported_objects.values_list('kind', 'external_id', 'object_id'):
+            self.ids[kind][external_id] = object_id
+
+        if job.records:
+            self.stdout.write(f'Resuming import job "{job.name}" after {job.records} records.')
+
+        start = time.monotonic()
+        imported = 0
+
+        with path.open(newline='', encoding='utf-8') as file:
+            records = islice(reader(file), job.records, None)
+
+            while chunk := list(islice(records, options['batch_size'])):
+                skipped = sum(self.skipped.values())
+                self.import_chunk(job, chunk)
+                imported += len(chunk)
+
+                self.stdout.write(f'{job.records} records imported '
+                                  f'({imported / (time.monotonic() - start):.0f} rows/s)')
+
+                if sum(self.skipped.values()) > skipped:
+                    self.stderr.write(f'{sum(self.skipped.values()) - skipped} records of this batch skipped.')
+
+        job.finished_at = timezone.now()
+        job.save(update_fields=['finished_at'])
+
+        for reason, count in sorted(self.skipped.items()):
+            self.stderr.write(f'{count} records skipped: {reason}.')
+
+        if self.skipped:
+            self.stderr.write(f'Users were matched by {self.user_field}, see --user-field.')
+
+        self.stdout.write(self.style.SUCCESS(f'Import job "{job.name}" finished.'))
+
+    def import_chunk(self, job, chunk):
+        records = defaultdict(list)
+
+        for kind, data in chunk:
+            records[kind].append(data)
+
+        for kind, items in records.items():
+            if kind is None:
+                self.skipped['record without a type'] += len(items)
+            elif kind not in ['project', 'contributor', 'issue', 'comment']:
+                self.skipped[f'unknown type "{kind}"'] += len(items)
+
+        contributors = [(data.get('id'), contributor)
+                        for data in records['project'] for contributor in data.get('contributors', [])]
+
+        self.users.prefetch('username', [contributor['username'] for _, contributor in contributors])
+        self.users.prefetch(self.user_field, [data[field] for kind in ['contributor', 'issue', 'comment']
+                                              for data in records[kind]
+                                              for field in ['user', 'author', 'assignee'] if data.get(field)])
+
+        with transaction.atomic():
+            mapped = self.import_projects(job, records['project'])
+            self.import_contributors(contributors, records['contributor'])
+            mapped += self.import_issues(job, records['issue'])
+            self.import_comments(records['comment'])
+
+            ImportedObject.objects.bulk_create(mapped)
+
+            job.records += len(chunk)
+            job.save(update_fields=['records'])
+
+    def import_projects(self, job, records):
+        projects = [Project(title=data.get('title', ''), description=data.get('description', ''),
+                            type=data.get('type', '')) for data in records]
+
+        Project.objects.bulk_create(projects)
+
+        return self.map_ids(job, 'project', records, projects)
+
+    def import_contributors(self, nested, records):
+        contributors = []
+
+        for project, data in nested:
+            contributors.append((project, self.users.get('username', data.get('username')), data))
+
+        for data in records:
+            contributors.append((data.get('project'), self.users.get(self.user_field, data.get('user')), data))
+
+        objects = []
+
+        for project, user_id, data in contributors:
+            project_id = self.ids['project'].get(str(project))
+
+            if not project_id:
+                self.skipped['contributor of an unknown project'] += 1
+                continue
+
+            if not user_id:
+                self.skipped['contributor with an unknown user'] += 1
+                continue
+
+            objects.append(Contributor(project_id=project_id, user_id=user_id,
+                                       permission=data.get('permission', ''), role=data.get('role', '')))
+
+        Contributor.objects.bulk_create(objects)
+
+    def import_issues(self, job, records):
+        issues, kept = [], []
+
+        for data in records:
+            project_id = self.ids['project'].get(str(data.get('project')))
+            author_id = self.users.get(self.user_field, data.get('author'))
+            assignee_id = self.users.get(self.user_field, data.get('assignee'))
+
+            if not project_id:
+                self.skipped['issue of an unknown project'] += 1
+                continue
+
+            if not author_id or (data.get('assignee') and not assignee_id):
+                self.skipped['issue with an unknown author or assignee'] += 1
+                continue
+
+            issue = Issue(project_id=project_id, author_id=author_id, assignee_id=assignee_id,
+                          **{field: data.get(field, '') for field in ISSUE_FIELDS})
+            issues.append(issue)
+            kept.append(data)
+
+        self.bulk_create(Issue, issues, kept)
+
+        return self.map_ids(job, 'issue', kept, issues)
+
+    def import_comments(self, records):
+        comments, kept = [], []
+
+        for data in records:
+            issue_id = self.ids['issue'].get(str(data.get('issue')))
+            author_id = self.users.get(self.user_field, data.get('author'))
+
+            if not issue_id:
+                self.skipped['comment of an unknown issue'] += 1
+                continue
+
+            if not author_id:
+                self.skipped['comment with an unknown author'] += 1
+                continue
+
+            comments.append(Comment(issue_id=issue_id, author_id=author_id,
+                                    description=data.get('description', '')))
+            kept.append(data)
+
+        self.bulk_create(Comment, comments, kept)
+
+    def bulk_create(self, model, objects, records):
+        """
+        auto_now_add dates the inserted rows, the original dates are then
+        written back by batch.
+        """
+        dates = [parse_created_at(data) for data in records]
+        model.objects.bulk_create(objects)
+        dated = []
+
+        for obj, created_at in zip(objects, dates):
+            if created_at is not None:
+                obj.created_at = created_at
+                dated.append(obj)
+
+        model.objects.bulk_update(dated, ['created_at'], batch_size=500)
+
+    def map_ids(self, job, kind, records, objects):
+        mapped = []
+
+        for data, obj in zip(records, objects):
+            if data.get('id') is None:
+                continue
+
+            external_id = str(data['id'])
+            self.ids[kind][external_id] = obj.pk
+            mapped.append(ImportedObject(job=job, kind=kind, external_id=external_id, object_id=obj.pk))
+
+        return mapped
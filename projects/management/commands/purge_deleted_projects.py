@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from projects import deletion
+
+
+class Command(BaseCommand):
+    help = 'Purges the projects deleted in the background that are not purged yet.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=None,
+                            help="Rows deleted per transaction (default PROJECT_DELETION['BATCH_SIZE']).")
+
+    def handle(self, *args, **options):
+        project_ids = deletion.purge_deleted_projects(options['batch_size'])
+
+        self.stdout.write(self.style.SUCCESS(f'{len(project_ids)} projects purged.'))
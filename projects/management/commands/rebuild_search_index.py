@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from projects import search
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the full-text search index of issues and comments.'
+
+    def handle(self, *args, **options):
+        if not search.is_available():
+            raise CommandError('Search is only available on SQLite databases.')
+
+        search.rebuild_index()
+
+        self.stdout.write(self.style.SUCCESS('Search index rebuilt.'))
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from projects import stats
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the issue statistics counters from the issues, fixing any drift.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--project', type=int, help='Only recompute this project.')
+
+    def handle(self, *args, **options):
+        if not stats.is_maintained():
+            raise CommandError('Issue statistics are only stored on SQLite databases.')
+
+        stats.recompute(options['project'])
+
+        self.stdout.write(self.style.SUCCESS('Issue statistics recomputed.'))
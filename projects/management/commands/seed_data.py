@@ -0,0 +1,143 @@
+import random
+import time
+from itertools import islice
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from projects.models.Comment import Comment
+from projects.models.Contributor import Contributor
+from projects.models.Issue import Issue
+from projects.models.Project import Project
+
+User = get_user_model()
+
+WORDS = ('the issue list fails to load when a contributor opens the project after the last deploy because '
+         'the cursor pagination returns duplicated rows for comments created in the same millisecond steps '
+         'to reproduce expected result actual result stack trace attached login signup export search sync '
+         'mobile client timeout slow query index migration cache token permission editor author').split()
+
+TYPES = ['back-end', 'front-end', 'iOS', 'Android']
+TAGS = ['bug', 'feature', 'task']
+PRIORITIES = ['low', 'medium', 'high']
+STATUSES = ['open', 'in progress', 'closed']
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class Command(BaseCommand):
+    help = ('Generates synthetic users, projects, contributors, issues and comments. Contributor counts '
+            'follow a Pareto distribution, so most projects are small and a few are crowded.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--projects', type=int, default=100)
+        parser.add_argument('--contributors', type=int, default=4,
+                            help='Median contributors per project (default 4).')
+        parser.add_argument('--skew', type=float, default=1.16,
+                            help='Pareto shape of the contributor counts, lower is more skewed (default 1.16).')
+        parser.add_argument('--issues', type=int, default=50, help='Mean issues per project (default 50).')
+        parser.add_argument('--comments', type=int, default=3, help='Mean comments per issue (default 3).')
+        parser.add_argument('--prefix', default='seed', help='Prefix of the generated usernames.')
+        parser.add_argument('--password', default='password', help='Password of every generated user.')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed, the same seed generates the same data.')
+        parser.add_argument('--batch-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        if options['users'] < 1:
+            raise CommandError('At least one user is needed.')
+
+        self.rng = random.Random(options['seed'])
+        self.options = options
+        self.counts = {'users': 0, 'projects': 0, 'contributors': 0, 'issues': 0, 'comments': 0}
+        start = time.monotonic()
+
+        users = self.create_users()
+
+        for chunk in chunked(range(options['projects']), max(options['batch_size'] // 100, 1)):
+            with transaction.atomic():
+                self.create_projects(users, len(chunk))
+
+        elapsed = time.monotonic() - start
+        summary = ', '.join(f'{count} {name}' for name, count in self.counts.items())
+
+        self.stdout.write(self.style.SUCCESS(f'Created {summary} in {elapsed:.1f}s.'))
+
+    def text(self, words):
+        return ' '.join(self.rng.choice(WORDS) for _ in range(words))
+
+    def count(self, mean):
+        return round(self.rng.expovariate(1 / mean)) if mean > 0 else 0
+
+    def create_users(self):
+        """
+        Creates the missing `<prefix><n>` users, all sharing one password hash
+        (hashing it per user would dominate the run), and returns their ids.
+        """
+        prefix = self.options['prefix']
+        password = make_password(self.options['password'])
+        usernames = [f'{prefix}{n}' for n in range(self.options['users'])]
+        ids = {}
+
+        for chunk in chunked(usernames, self.options['batch_size']):
+            existing = dict(User.objects.filter(username__in=chunk).values_list('username', 'id'))
+            created = User.objects.bulk_create(
+                User(username=username, password=password) for username in chunk if username not in existing)
+            self.counts['users'] += len(created)
+            ids.update(existing)
+
+            if created:
+                ids.update(User.objects.filter(username__in=[user.username for user in created])
+                           .values_list('username', 'id'))
+
+        return [ids[username] for username in usernames]
+
+    def create_projects(self, users, count):
+        median, skew = self.options['contributors'], self.options['skew']
+
+        projects = Project.objects.bulk_create(
+            Project(title=self.text(3).capitalize(), description=self.text(self.rng.randint(10, 40)),
+                    type=self.rng.choice(TYPES)) for _ in range(count))
+
+        contributors = []
+        members = {}
+
+        for project in projects:
+            # The median of a Pareto variate is 2 ** (1 / shape).
+            size = round(median * self.rng.paretovariate(skew) / 2 ** (1 / skew))
+            members[project.id] = self.rng.sample(users, min(max(size, 1), len(users)))
+
+            for n, user_id in enumerate(members[project.id]):
+                permission = 'author' if n == 0 else 'editor'
+                contributors.append(Contributor(
+                    project_id=project.id, user_id=user_id, permission=permission, role=permission))
+
+        Contributor.objects.bulk_create(contributors, batch_size=self.options['batch_size'])
+        self.counts['projects'] += len(projects)
+        self.counts['contributors'] += len(contributors)
+
+        issues = (
+            Issue(title=self.text(6).capitalize(), description=self.text(self.rng.randint(20, 120)),
+                  tag=self.rng.choice(TAGS), priority=self.rng.choice(PRIORITIES), status=self.rng.choice(STATUSES),
+                  project_id=project.id, author_id=self.rng.choice(members[project.id]),
+                  assignee_id=self.rng.choice(members[project.id] + [None]))
+            for project in projects for _ in range(self.count(self.options['issues'])))
+
+        for chunk in chunked(issues, self.options['batch_size']):
+            chunk = Issue.objects.bulk_create(chunk)
+            self.counts['issues'] += len(chunk)
+
+            comments = (
+                Comment(description=self.text(self.rng.randint(5, 60)), issue_id=issue.id,
+                        author_id=self.rng.choice(members[issue.project_id]))
+                for issue in chunk for _ in range(self.count(self.options['comments'])))
+
+            for comments_chunk in chunked(comments, self.options['batch_size']):
+                self.counts['comments'] += len(Comment.objects.bulk_create(comments_chunk))
@@ -0,0 +1,91 @@
+from django.conf import settings
+from django.db import connection
+
+from .models.Contributor import Contributor
+from .models.MembershipVersion import MembershipVersion
+
+# Access token claims: project ids by permission, and the membership version
+# they were read at.
+CLAIM = 'projects'
+VERSION_CLAIM = 'projects_version'
+
+
+def is_available():
+    """
+    Membership versions are bumped by SQLite triggers, created in the
+    0010_membership_version migration. Without them a token could not be
+    told stale, so it carries no memberships.
+    """
+    return settings.MEMBERSHIP_CLAIMS['ENABLED'] and connection.vendor == 'sqlite'
+
+
+def get_version(user_id):
+    return MembershipVersion.objects.filter(user_id=user_id).values_list('version', flat=True).first() or 0
+
+
+def get_claims(user_id):
+    """
+    Returns the membership claims of an access token for the user, or no
+    claims when they are unavailable or the user is in more than
+    MAX_PROJECTS projects, leaving the views to query the database.
+    """
+    if not is_available():
+        return {}
+
+    # Read the version first: a change made in between leaves the token
+    # with an older version, so it is rejected rather than trusted.
+    version = get_version(user_id)
+    limit = settings.MEMBERSHIP_CLAIMS['MAX_PROJECTS']
+    memberships = list(Contributor.objects.filter(user_id=user_id, project__deleted_at__isnull=True).values_list(
+        'project_id', 'permission')[:limit + 1])
+
+    if len(memberships) > limit:
+        return {}
+
+    projects = {}
+
+    for project_id, permission in memberships:
+        projects.setdefault(permission, []).append(project_id)
+
+    return {CLAIM: projects, VERSION_CLAIM: version}
+
+
+def read_claims(token):
+    """
+    Returns `{project_id: (True, permission)}` from the token claims, or None
+    when the token does not carry them. The version was checked on
+    authentication, see projects/authentication.py.
+    """
+    if token is None or CLAIM not in token or not is_available():
+        return None
+
+    return {project_id: (True, permission)
+            for permission, project_ids in token[CLAIM].items() for project_id in project_ids}
+
+
+def get_membership(request, project_id):
+    """
+    Returns `(is_member, permission)` for the authenticated user on the given
+    project, read from the access token claims when it carries them, else
+    resolved with a single indexed lookup and memoized on the request.
+    """
+    memberships = getattr(request, '_project_memberships', None)
+
+    if memberships is None:
+        claimed = read_claims(getattr(request, 'auth', None))
+        request._project_memberships_claimed = claimed is not None
+        memberships = request._project_memberships = claimed or {}
+
+    project_id = int(project_id)
+
+    if project_id not in memberships:
+        if request._project_memberships_claimed:
+            return False, None
+
+        permission = Contributor.objects.filter(
+            project_id=project_id, user_id=request.user.id, project__deleted_at__isnull=True).values_list(
+            'permission', flat=True).first()
+
+        memberships[project_id] = (permission is not None, permission)
+
+    return memberships[project_id]
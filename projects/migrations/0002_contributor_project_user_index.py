@@ -0,0 +1,17 @@
+# Generated by Django 4.1.2 on 2026-10-18 19:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contributor',
+            index=models.Index(fields=['project', 'user'], name='projects_co_project_4e6fa4_idx'),
+        ),
+    ]
@@ -0,0 +1,74 @@
+from django.db import migrations
+
+CREATE_SQL = [
+    "CREATE VIRTUAL TABLE projects_issue_search USING fts5("
+    "project, title, description, tokenize = 'unicode61 remove_diacritics 2')",
+    "CREATE VIRTUAL TABLE projects_comment_search USING fts5("
+    "project, issue_id UNINDEXED, description, tokenize = 'unicode61 remove_diacritics 2')",
+
+    """CREATE TRIGGER projects_issue_search_insert AFTER INSERT ON projects_issue BEGIN
+        INSERT INTO projects_issue_search (rowid, project, title, description)
+        VALUES (new.id, new.project_id, new.title, new.description);
+    END""",
+    """CREATE TRIGGER projects_issue_search_update AFTER UPDATE OF project_id, title, description ON projects_issue BEGIN
+        UPDATE projects_issue_search SET project = new.project_id, title = new.title, description = new.description
+        WHERE rowid = old.id;
+    END""",
+    """CREATE TRIGGER projects_issue_search_delete AFTER DELETE ON projects_issue BEGIN
+        DELETE FROM projects_issue_search WHERE rowid = old.id;
+    END""",
+
+    """CREATE TRIGGER projects_comment_search_insert AFTER INSERT ON projects_comment BEGIN
+        INSERT INTO projects_comment_search (rowid, project, issue_id, description)
+        VALUES (new.id, (SELECT project_id FROM projects_issue WHERE id = new.issue_id), new.issue_id, new.description);
+    END""",
+    """CREATE TRIGGER projects_comment_search_update AFTER UPDATE OF issue_id, description ON projects_comment BEGIN
+        UPDATE projects_comment_search SET
+            project = (SELECT project_id FROM projects_issue WHERE id = new.issue_id),
+            issue_id = new.issue_id, description = new.description
+        WHERE rowid = old.id;
+    END""",
+    """CREATE TRIGGER projects_comment_search_delete AFTER DELETE ON projects_comment BEGIN
+        DELETE FROM projects_comment_search WHERE rowid = old.id;
+    END""",
+
+    "INSERT INTO projects_issue_search (rowid, project, title, description) "
+    "SELECT id, project_id, title, description FROM projects_issue",
+    "INSERT INTO projects_comment_search (rowid, project, issue_id, description) "
+    "SELECT comment.id, issue.project_id, comment.issue_id, comment.description "
+    "FROM projects_comment comment JOIN projects_issue issue ON issue.id = comment.issue_id",
+]
+
+DROP_SQL = [
+    'DROP TRIGGER IF EXISTS projects_comment_search_delete',
+    'DROP TRIGGER IF EXISTS projects_comment_search_update',
+    'DROP TRIGGER IF EXISTS projects_comment_search_insert',
+    'DROP TRIGGER IF EXISTS projects_issue_search_delete',
+    'DROP TRIGGER IF EXISTS projects_issue_search_update',
+    'DROP TRIGGER IF EXISTS projects_issue_search_insert',
+    'DROP TABLE IF EXISTS projects_comment_search',
+    'DROP TABLE IF EXISTS projects_issue_search',
+]
+
+
+def run(statements):
+    def operation(apps, schema_editor):
+        # The search index relies on SQLite FTS5, other backends go without it.
+        if schema_editor.connection.vendor != 'sqlite':
+            return
+
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    return operation
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0003_issue_comment_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(run(CREATE_SQL), run(DROP_SQL)),
+    ]
@@ -0,0 +1,74 @@
+# Generated by Django 4.1.2 on 2026-10-18 19:33
+
+from django.db import migrations, models
+
+BUMP = 'UPDATE projects_project SET version = version + 1 WHERE id = {}'
+ISSUE_PROJECT = '(SELECT project_id FROM projects_issue WHERE id = {}.issue_id)'
+
+CREATE_SQL = [
+    f"""CREATE TRIGGER projects_project_version_update AFTER UPDATE OF title, description, type ON projects_project BEGIN
+        {BUMP.format('new.id')};
+    END""",
+]
+
+for event, row in [('INSERT', 'new'), ('UPDATE', 'new'), ('DELETE', 'old')]:
+    CREATE_SQL += [
+        f"""CREATE TRIGGER projects_contributor_version_{event.lower()} AFTER {event} ON projects_contributor BEGIN
+            {BUMP.format(f'{row}.project_id')};
+        END""",
+        f"""CREATE TRIGGER projects_issue_version_{event.lower()} AFTER {event} ON projects_issue BEGIN
+            {BUMP.format(f'{row}.project_id')};
+        END""",
+        f"""CREATE TRIGGER projects_comment_version_{event.lower()} AFTER {event} ON projects_comment BEGIN
+            {BUMP.format(ISSUE_PROJECT.format(row))};
+        END""",
+    ]
+
+CREATE_SQL += [
+    # Issues and comments moved to another project invalidate the old one too.
+    f"""CREATE TRIGGER projects_issue_version_move AFTER UPDATE OF project_id ON projects_issue
+    WHEN old.project_id IS NOT new.project_id BEGIN
+        {BUMP.format('old.project_id')};
+    END""",
+    f"""CREATE TRIGGER projects_comment_version_move AFTER UPDATE OF issue_id ON projects_comment
+    WHEN old.issue_id IS NOT new.issue_id BEGIN
+        {BUMP.format(ISSUE_PROJECT.format('old'))};
+    END""",
+    # Contributor listings show usernames.
+    f"""CREATE TRIGGER projects_user_version_update AFTER UPDATE OF username ON auth_user BEGIN
+        UPDATE projects_project SET version = version + 1
+        WHERE id IN (SELECT project_id FROM projects_contributor WHERE user_id = new.id);
+    END""",
+]
+
+DROP_SQL = [
+    'DROP TRIGGER IF EXISTS ' + statement.split()[2]
+    for statement in reversed(CREATE_SQL)
+]
+
+
+def run(statements):
+    def operation(apps, schema_editor):
+        if schema_editor.connection.vendor != 'sqlite':
+            return
+
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    return operation
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0004_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='version',
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(run(CREATE_SQL), run(DROP_SQL)),
+    ]
@@ -0,0 +1,105 @@
+# Generated by Django 4.1.2 on 2026-10-18 19:51
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+# Value of each counted dimension for an issue row, unassigned issues count under ''.
+DIMENSIONS = {
+    'total': lambda row: "''",
+    'status': lambda row: f'{row}.status',
+    'priority': lambda row: f'{row}.priority',
+    'assignee': lambda row: f"COALESCE(CAST({row}.assignee_id AS TEXT), '')",
+}
+
+COLUMNS = {'status': 'status', 'priority': 'priority', 'assignee': 'assignee_id'}
+
+INCREMENT = '''INSERT INTO projects_issuestat (project_id, dimension, value, count)
+        VALUES ({row}.project_id, '{dimension}', {value}, 1)
+        ON CONFLICT (project_id, dimension, value) DO UPDATE SET count = count + 1'''
+
+# Never inserts, so issues deleted after their project's counters (on cascade) are a no-op.
+DECREMENT = '''UPDATE projects_issuestat SET count = count - 1
+        WHERE project_id = {row}.project_id AND dimension = '{dimension}' AND value = {value}'''
+
+
+def increment(row, dimension):
+    return INCREMENT.format(row=row, dimension=dimension, value=DIMENSIONS[dimension](row))
+
+
+def decrement(row, dimension):
+    return DECREMENT.format(row=row, dimension=dimension, value=DIMENSIONS[dimension](row))
+
+
+CREATE_SQL = [
+    f'''CREATE TRIGGER projects_issue_stats_insert AFTER INSERT ON projects_issue BEGIN
+        {'; '.join(increment('new', dimension) for dimension in DIMENSIONS)};
+    END''',
+    f'''CREATE TRIGGER projects_issue_stats_delete AFTER DELETE ON projects_issue BEGIN
+        {'; '.join(decrement('old', dimension) for dimension in DIMENSIONS)};
+    END''',
+    f'''CREATE TRIGGER projects_issue_stats_move AFTER UPDATE OF project_id ON projects_issue
+    WHEN old.project_id IS NOT new.project_id BEGIN
+        {decrement('old', 'total')};
+        {increment('new', 'total')};
+    END''',
+]
+
+for dimension, column in COLUMNS.items():
+    CREATE_SQL.append(
+        f'''CREATE TRIGGER projects_issue_stats_{dimension} AFTER UPDATE OF {column}, project_id ON projects_issue
+        WHEN old.{column} IS NOT new.{column} OR old.project_id IS NOT new.project_id BEGIN
+            {decrement('old', dimension)};
+            {increment('new', dimension)};
+        END''')
+
+# Counts the issues that exist when the migration runs.
+CREATE_SQL.append('''INSERT INTO projects_issuestat (project_id, dimension, value, count)
+    SELECT project_id, 'total', '', COUNT(*) FROM projects_issue GROUP BY project_id
+    UNION ALL
+    SELECT project_id, 'status', status, COUNT(*) FROM projects_issue GROUP BY project_id, status
+    UNION ALL
+    SELECT project_id, 'priority', priority, COUNT(*) FROM projects_issue GROUP BY project_id, priority
+    UNION ALL
+    SELECT project_id, 'assignee', COALESCE(CAST(assignee_id AS TEXT), ''), COUNT(*)
+    FROM projects_issue GROUP BY project_id, assignee_id''')
+
+DROP_SQL = [
+    'DROP TRIGGER IF EXISTS ' + statement.split()[2]
+    for statement in reversed(CREATE_SQL) if statement.startswith('CREATE TRIGGER')
+]
+
+
+def run(statements):
+    def operation(apps, schema_editor):
+        if schema_editor.connection.vendor != 'sqlite':
+            return
+
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    return operation
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0006_import_jobs'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IssueStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dimension', models.CharField(max_length=20)),
+                ('value', models.CharField(blank=True, max_length=100)),
+                ('count', models.IntegerField(default=0)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='issue_stats', to='projects.project')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='issuestat',
+            constraint=models.UniqueConstraint(fields=('project', 'dimension', 'value'), name='unique_issue_stat'),
+        ),
+        migrations.RunPython(run(CREATE_SQL), run(DROP_SQL)),
+    ]
@@ -0,0 +1,134 @@
+# Generated by Django 4.1.2 on 2026-10-18 19:56
+
+from django.db import migrations, models
+
+NOW = "strftime('%Y-%m-%d %H:%M:%f', 'now')"
+LOG = '''INSERT INTO projects_change (project_id, kind, object_id, action, created_at)
+        VALUES ({project}, '{kind}', {object}, '{action}', ''' + NOW + ')'
+# Comments reach their project through their issue.
+LOG_COMMENT = '''INSERT INTO projects_change (project_id, kind, object_id, action, created_at)
+        SELECT project_id, 'comment', {row}.id, '{action}', ''' + NOW + '''
+        FROM projects_issue WHERE id = {row}.issue_id'''
+
+CREATE_SQL = [
+    f'''CREATE TRIGGER projects_project_changes_insert AFTER INSERT ON projects_project BEGIN
+        {LOG.format(project='new.id', kind='project', object='new.id', action='create')};
+    END''',
+    f'''CREATE TRIGGER projects_project_changes_update AFTER UPDATE OF title, description, type ON projects_project BEGIN
+        {LOG.format(project='new.id', kind='project', object='new.id', action='update')};
+    END''',
+    f'''CREATE TRIGGER projects_project_changes_delete AFTER DELETE ON projects_project BEGIN
+        {LOG.format(project='old.id', kind='project', object='old.id', action='delete')};
+    END''',
+    f'''CREATE TRIGGER projects_contributor_changes_insert AFTER INSERT ON projects_contributor BEGIN
+        {LOG.format(project='new.project_id', kind='contributor', object='new.user_id', action='create')};
+    END''',
+    f'''CREATE TRIGGER projects_contributor_changes_update AFTER UPDATE ON projects_contributor BEGIN
+        {LOG.format(project='new.project_id', kind='contributor', object='new.user_id', action='update')};
+    END''',
+    f'''CREATE TRIGGER projects_contributor_changes_delete AFTER DELETE ON projects_contributor BEGIN
+        {LOG.format(project='old.project_id', kind='contributor', object='old.user_id', action='delete')};
+    END''',
+    f'''CREATE TRIGGER projects_issue_changes_insert AFTER INSERT ON projects_issue BEGIN
+        {LOG.format(project='new.project_id', kind='issue', object='new.id', action='create')};
+    END''',
+    f'''CREATE TRIGGER projects_issue_changes_update AFTER UPDATE ON projects_issue
+    WHEN old.project_id IS new.project_id BEGIN
+        {LOG.format(project='new.project_id', kind='issue', object='new.id', action='update')};
+    END''',
+    # An issue moved to another project is deleted from the old one's point of view.
+    f'''CREATE TRIGGER projects_issue_changes_move AFTER UPDATE OF project_id ON projects_issue
+    WHEN old.project_id IS NOT new.project_id BEGIN
+        {LOG.format(project='old.project_id', kind='issue', object='old.id', action='delete')};
+        {LOG.format(project='new.project_id', kind='issue', object='new.id', action='create')};
+    END''',
+    f'''CREATE TRIGGER projects_issue_changes_delete AFTER DELETE ON projects_issue BEGIN
+        {LOG.format(project='old.project_id', kind='issue', object='old.id', action='delete')};
+    END''',
+    f'''CREATE TRIGGER projects_comment_changes_insert AFTER INSERT ON projects_comment BEGIN
+        {LOG_COMMENT.format(row='new', action='create')};
+    END''',
+    f'''CREATE TRIGGER projects_comment_changes_update AFTER UPDATE ON projects_comment BEGIN
+        {LOG_COMMENT.format(row='new', action='update')};
+    END''',
+    f'''CREATE TRIGGER projects_comment_changes_move AFTER UPDATE OF issue_id ON projects_comment
+    WHEN old.issue_id IS NOT new.issue_id BEGIN
+        {LOG_COMMENT.format(row='old', action='delete')};
+    END''',
+    f'''CREATE TRIGGER projects_comment_changes_delete AFTER DELETE ON projects_comment BEGIN
+        {LOG_COMMENT.format(row='old', action='delete')};
+    END''',
+    # Contributor entries show usernames.
+    f'''CREATE TRIGGER projects_user_changes_update AFTER UPDATE OF username ON auth_user BEGIN
+        INSERT INTO projects_change (project_id, kind, object_id, action, created_at)
+        SELECT project_id, 'contributor', user_id, 'update', {NOW}
+        FROM projects_contributor WHERE user_id = new.id;
+    END''',
+]
+
+DROP_SQL = [
+    'DROP TRIGGER IF EXISTS ' + statement.split()[2]
+    for statement in reversed(CREATE_SQL)
+]
+
+# Logs everything that exists when the migration runs, so syncing from 0 is complete.
+SEED_SQL = [
+    f'''INSERT INTO projects_change (project_id, kind, object_id, action, created_at)
+    SELECT id, 'project', id, 'create', {NOW} FROM projects_project''',
+    f'''INSERT INTO projects_change (project_id, kind, object_id, action, created_at)
+    SELECT project_id, 'contributor', user_id, 'create', {NOW} FROM projects_contributor''',
+    f'''INSERT INTO projects_change (project_id, kind, object_id, action, created_at)
+    SELECT project_id, 'issue', id, 'create', {NOW} FROM projects_issue''',
+    f'''INSERT INTO projects_change (project_id, kind, object_id, action, created_at)
+    SELECT issue.project_id, 'comment', comment.id, 'create', {NOW}
+    FROM projects_comment comment JOIN projects_issue issue ON issue.id = comment.issue_id''',
+]
+
+
+def run(statements):
+    def operation(apps, schema_editor):
+        if schema_editor.connection.vendor != 'sqlite':
+            return
+
+        # No parameters, so the % of strftime() formats is not taken for a placeholder.
+        for statement in statements:
+            schema_editor.execute(statement, None)
+
+    return operation
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0007_issue_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Change',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('project_id', models.BigIntegerField()),
+                ('kind', models.CharField(choices=[('project', 'project'), ('contributor', 'contributor'), ('issue', 'issue'), ('comment', 'comment')], max_length=20)),
+                ('object_id', models.BigIntegerField()),
+                ('action', models.CharField(choices=[('create', 'create'), ('update', 'update'), ('delete', 'delete')], max_length=10)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ChangeHorizon',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('seq', models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='change',
+            index=models.Index(fields=['project_id', 'id'], name='projects_ch_project_0feaa4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='change',
+            index=models.Index(fields=['action', 'created_at'], name='projects_ch_action_3bc547_idx'),
+        ),
+        migrations.RunPython(run(SEED_SQL + CREATE_SQL), run(DROP_SQL)),
+    ]
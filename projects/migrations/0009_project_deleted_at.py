@@ -0,0 +1,46 @@
+# Generated by Django 4.1.2 on 2026-10-18 20:12
+
+from django.db import migrations, models
+
+# A project deleted in the background is gone for sync clients as soon as it
+# is marked, not when it is purged.
+CREATE_SQL = [
+    '''CREATE TRIGGER projects_project_changes_soft_delete AFTER UPDATE OF deleted_at ON projects_project
+    WHEN old.deleted_at IS NULL AND new.deleted_at IS NOT NULL BEGIN
+        INSERT INTO projects_change (project_id, kind, object_id, action, created_at)
+        VALUES (new.id, 'project', new.id, 'delete', strftime('%Y-%m-%d %H:%M:%f', 'now'));
+    END''',
+]
+
+DROP_SQL = [
+    'DROP TRIGGER IF EXISTS ' + statement.split()[2]
+    for statement in reversed(CREATE_SQL)
+]
+
+
+def run(statements):
+    def operation(apps, schema_editor):
+        if schema_editor.connection.vendor != 'sqlite':
+            return
+
+        # No parameters, so the % of strftime() formats is not taken for a placeholder.
+        for statement in statements:
+            schema_editor.execute(statement, None)
+
+    return operation
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0008_change_log'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(run(CREATE_SQL), run(DROP_SQL)),
+    ]
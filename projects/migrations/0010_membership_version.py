@@ -0,0 +1,63 @@
+# Generated by Django 4.1.2 on 2026-10-18 20:24
+
+from django.db import migrations, models
+
+BUMP = '''INSERT INTO projects_membershipversion (user_id, version) VALUES ({user}, 1)
+        ON CONFLICT (user_id) DO UPDATE SET version = version + 1'''
+
+CREATE_SQL = [
+    f'''CREATE TRIGGER projects_contributor_membership_insert AFTER INSERT ON projects_contributor BEGIN
+        {BUMP.format(user='new.user_id')};
+    END''',
+    f'''CREATE TRIGGER projects_contributor_membership_update AFTER UPDATE OF user_id, project_id, permission
+    ON projects_contributor BEGIN
+        {BUMP.format(user='old.user_id')};
+        {BUMP.format(user='new.user_id')};
+    END''',
+    # Purging a project deleted in the background changes no membership, they
+    # went when it was marked.
+    f'''CREATE TRIGGER projects_contributor_membership_delete AFTER DELETE ON projects_contributor
+    WHEN NOT EXISTS (SELECT 1 FROM projects_project WHERE id = old.project_id AND deleted_at IS NOT NULL) BEGIN
+        {BUMP.format(user='old.user_id')};
+    END''',
+    '''CREATE TRIGGER projects_project_membership_soft_delete AFTER UPDATE OF deleted_at ON projects_project
+    WHEN old.deleted_at IS NULL AND new.deleted_at IS NOT NULL BEGIN
+        INSERT INTO projects_membershipversion (user_id, version)
+        SELECT user_id, 1 FROM projects_contributor WHERE project_id = new.id
+        ON CONFLICT (user_id) DO UPDATE SET version = version + 1;
+    END''',
+]
+
+DROP_SQL = [
+    'DROP TRIGGER IF EXISTS ' + statement.split()[2]
+    for statement in reversed(CREATE_SQL)
+]
+
+
+def run(statements):
+    def operation(apps, schema_editor):
+        if schema_editor.connection.vendor != 'sqlite':
+            return
+
+        for statement in statements:
+            schema_editor.execute(statement, None)
+
+    return operation
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0009_project_deleted_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MembershipVersion',
+            fields=[
+                ('user_id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('version', models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(run(CREATE_SQL), run(DROP_SQL)),
+    ]
@@ -0,0 +1,181 @@
+# Generated by Django 4.1.2 on 2026-10-18 20:33
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+GUARD = 'WHEN NOT EXISTS (SELECT 1 FROM projects_triggersuppression)'
+
+# The search index (0004), statistics (0007) and change log (0008) triggers
+# fired by inserting or deleting issues and comments, which archiving and
+# restoring must not fire. Copied as they were created, to recreate them
+# unchanged when this migration is reversed.
+TRIGGERS = [
+    '''CREATE TRIGGER projects_issue_search_insert AFTER INSERT ON projects_issue BEGIN
+        INSERT INTO projects_issue_search (rowid, project, title, description)
+        VALUES (new.id, new.project_id, new.title, new.description);
+    END''',
+    '''CREATE TRIGGER projects_issue_search_delete AFTER DELETE ON projects_issue BEGIN
+        DELETE FROM projects_issue_search WHERE rowid = old.id;
+    END''',
+    '''CREATE TRIGGER projects_comment_search_insert AFTER INSERT ON projects_comment BEGIN
+        INSERT INTO projects_comment_search (rowid, project, issue_id, description)
+        VALUES (new.id, (SELECT project_id FROM projects_issue WHERE id = new.issue_id), new.issue_id, new.description);
+    END''',
+    '''CREATE TRIGGER projects_comment_search_delete AFTER DELETE ON projects_comment BEGIN
+        DELETE FROM projects_comment_search WHERE rowid = old.id;
+    END''',
+    '''CREATE TRIGGER projects_issue_stats_insert AFTER INSERT ON projects_issue BEGIN
+        INSERT INTO projects_issuestat (project_id, dimension, value, count)
+        VALUES (new.project_id, 'total', '', 1)
+        ON CONFLICT (project_id, dimension, value) DO UPDATE SET count = count + 1;
+        INSERT INTO projects_issuestat (project_id, dimension, value, count)
+        VALUES (new.project_id, 'status', new.status, 1)
+        ON CONFLICT (project_id, dimension, value) DO UPDATE SET count = count + 1;
+        INSERT INTO projects_issuestat (project_id, dimension, value, count)
+        VALUES (new.project_id, 'priority', new.priority, 1)
+        ON CONFLICT (project_id, dimension, value) DO UPDATE SET count = count + 1;
+        INSERT INTO projects_issuestat (project_id, dimension, value, count)
+        VALUES (new.project_id, 'assignee', COALESCE(CAST(new.assignee_id AS TEXT), ''), 1)
+        ON CONFLICT (project_id, dimension, value) DO UPDATE SET count = count + 1;
+    END''',
+    '''CREATE TRIGGER projects_issue_stats_delete AFTER DELETE ON projects_issue BEGIN
+        UPDATE projects_issuestat SET count = count - 1
+        WHERE project_id = old.project_id AND dimension = 'total' AND value = '';
+        UPDATE projects_issuestat SET count = count - 1
+        WHERE project_id = old.project_id AND dimension = 'status' AND value = old.status;
+        UPDATE projects_issuestat SET count = count - 1
+        WHERE project_id = old.project_id AND dimension = 'priority' AND value = old.priority;
+        UPDATE projects_issuestat SET count = count - 1
+        WHERE project_id = old.project_id AND dimension = 'assignee' AND value = COALESCE(CAST(old.assignee_id AS TEXT), '');
+    END''',
+    '''CREATE TRIGGER projects_issue_changes_insert AFTER INSERT ON projects_issue BEGIN
+        INSERT INTO projects_change (project_id, kind, object_id, action, created_at)
+        VALUES (new.project_id, 'issue', new.id, 'create', strftime('%Y-%m-%d %H:%M:%f', 'now'));
+    END''',
+    '''CREATE TRIGGER projects_issue_changes_delete AFTER DELETE ON projects_issue BEGIN
+        INSERT INTO projects_change (project_id, kind, object_id, action, created_at)
+        VALUES (old.project_id, 'issue', old.id, 'delete', strftime('%Y-%m-%d %H:%M:%f', 'now'));
+    END''',
+    '''CREATE TRIGGER projects_comment_changes_insert AFTER INSERT ON projects_comment BEGIN
+        INSERT INTO projects_change (project_id, kind, object_id, action, created_at)
+        SELECT project_id, 'comment', new.id, 'create', strftime('%Y-%m-%d %H:%M:%f', 'now')
+        FROM projects_issue WHERE id = new.issue_id;
+    END''',
+    '''CREATE TRIGGER projects_comment_changes_delete AFTER DELETE ON projects_comment BEGIN
+        INSERT INTO projects_change (project_id, kind, object_id, action, created_at)
+        SELECT project_id, 'comment', old.id, 'delete', strftime('%Y-%m-%d %H:%M:%f', 'now')
+        FROM projects_issue WHERE id = old.issue_id;
+    END''',
+]
+
+# The delete triggers again on the archive tables, for archived rows deleted
+# with their project or author: they still count and are still indexed.
+ARCHIVED = [
+    f'''CREATE TRIGGER projects_archivedissue_search_delete AFTER DELETE ON projects_archivedissue
+    {GUARD} BEGIN
+        DELETE FROM projects_issue_search WHERE rowid = old.id;
+    END''',
+    f'''CREATE TRIGGER projects_archivedcomment_search_delete AFTER DELETE ON projects_archivedcomment
+    {GUARD} BEGIN
+        DELETE FROM projects_comment_search WHERE rowid = old.id;
+    END''',
+    f'''CREATE TRIGGER projects_archivedissue_stats_delete AFTER DELETE ON projects_archivedissue
+    {GUARD} BEGIN
+        UPDATE projects_issuestat SET count = count - 1
+        WHERE project_id = old.project_id AND dimension = 'total' AND value = '';
+        UPDATE projects_issuestat SET count = count - 1
+        WHERE project_id = old.project_id AND dimension = 'status' AND value = old.status;
+        UPDATE projects_issuestat SET count = count - 1
+        WHERE project_id = old.project_id AND dimension = 'priority' AND value = old.priority;
+        UPDATE projects_issuestat SET count = count - 1
+        WHERE project_id = old.project_id AND dimension = 'assignee' AND value = COALESCE(CAST(old.assignee_id AS TEXT), '');
+    END''',
+    f'''CREATE TRIGGER projects_archivedissue_changes_delete AFTER DELETE ON projects_archivedissue
+    {GUARD} BEGIN
+        INSERT INTO projects_change (project_id, kind, object_id, action, created_at)
+        VALUES (old.project_id, 'issue', old.id, 'delete', strftime('%Y-%m-%d %H:%M:%f', 'now'));
+    END''',
+    f'''CREATE TRIGGER projects_archivedcomment_changes_delete AFTER DELETE ON projects_archivedcomment
+    {GUARD} BEGIN
+        INSERT INTO projects_change (project_id, kind, object_id, action, created_at)
+        SELECT project_id, 'comment', old.id, 'delete', strftime('%Y-%m-%d %H:%M:%f', 'now')
+        FROM projects_archivedissue WHERE id = old.issue_id;
+    END''',
+]
+
+
+def guard(statement):
+    return statement.replace(' BEGIN', f'\n    {GUARD} BEGIN', 1)
+
+
+def drop(statement):
+    return 'DROP TRIGGER IF EXISTS ' + statement.split()[2]
+
+
+CREATE_SQL = [sql for statement in TRIGGERS for sql in (drop(statement), guard(statement))] + ARCHIVED
+
+DROP_SQL = [drop(statement) for statement in ARCHIVED] + [
+    sql for statement in TRIGGERS for sql in (drop(statement), statement)]
+
+
+def run(statements):
+    def operation(apps, schema_editor):
+        if schema_editor.connection.vendor != 'sqlite':
+            return
+
+        for statement in statements:
+            schema_editor.execute(statement, None)
+
+    return operation
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('projects', '0010_membership_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TriggerSuppression',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ArchivedIssue',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=100)),
+                ('description', models.CharField(blank=True, max_length=8192)),
+                ('tag', models.CharField(blank=True, max_length=100)),
+                ('priority', models.CharField(blank=True, max_length=100)),
+                ('status', models.CharField(blank=True, max_length=100)),
+                ('created_at', models.DateTimeField()),
+                ('assignee', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='archived_assigned_issues', to=settings.AUTH_USER_MODEL)),
+                ('author', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_issues', to=settings.AUTH_USER_MODEL)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_issues', to='projects.project')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ArchivedComment',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('description', models.CharField(blank=True, max_length=8192)),
+                ('created_at', models.DateTimeField()),
+                ('author', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_comments', to=settings.AUTH_USER_MODEL)),
+                ('issue', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='comments', to='projects.archivedissue')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='archivedissue',
+            index=models.Index(fields=['project', 'created_at'], name='projects_ar_project_295bb4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedcomment',
+            index=models.Index(fields=['issue', 'created_at'], name='projects_ar_issue_i_441e32_idx'),
+        ),
+        migrations.RunPython(run(CREATE_SQL), run(DROP_SQL)),
+    ]
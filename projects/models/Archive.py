@@ -0,0 +1,56 @@
+from django.conf import settings
+from django.db import models
+
+from .Issue import IssueQuerySet
+
+
+class ArchivedIssue(models.Model):
+    """
+    Issue moved out of the Issue table by the archiver, with its original id,
+    see projects/archive.py. Editing or commenting on it restores it.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    title = models.CharField(max_length=100)
+    description = models.CharField(max_length=8192, blank=True)
+    tag = models.CharField(max_length=100, blank=True)
+    priority = models.CharField(max_length=100, blank=True)
+    project = models.ForeignKey(
+        "Project", on_delete=models.CASCADE, related_name="archived_issues")
+    status = models.CharField(max_length=100, blank=True)
+    author = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="archived_issues")
+    assignee = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, blank=True, null=True,
+        related_name="archived_assigned_issues")
+    created_at = models.DateTimeField()
+
+    objects = IssueQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['project', 'created_at']),
+        ]
+
+
+class ArchivedComment(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    description = models.CharField(max_length=8192, blank=True)
+    author = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="archived_comments")
+    issue = models.ForeignKey(
+        "ArchivedIssue", on_delete=models.CASCADE, related_name="comments")
+    created_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['issue', 'created_at']),
+        ]
+
+
+class TriggerSuppression(models.Model):
+    """
+    Holds a row only inside the archiver's transactions, never committed.
+    The statistics, change log and search index triggers skip the rows
+    inserted or deleted while it does, so moving issues between the hot and
+    archive tables is not taken for deleting and creating them.
+    """
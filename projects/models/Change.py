@@ -0,0 +1,38 @@
+from django.db import models
+
+
+class Change(models.Model):
+    """
+    Change log entry, written by database triggers (see projects/changes.py).
+    The id is the sequence number clients sync from. There is no foreign key,
+    so entries outlive the objects they record, as tombstones for deletes.
+    """
+    project_id = models.BigIntegerField()
+    kind = models.CharField(max_length=20, choices=[
+        ("project", "project"),
+        ("contributor", "contributor"),
+        ("issue", "issue"),
+        ("comment", "comment"),
+    ])
+    # User id for contributors, which are identified by user within a project.
+    object_id = models.BigIntegerField()
+    action = models.CharField(max_length=10, choices=[
+        ("create", "create"),
+        ("update", "update"),
+        ("delete", "delete"),
+    ])
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['project_id', 'id']),
+            models.Index(fields=['action', 'created_at']),
+        ]
+
+
+class ChangeHorizon(models.Model):
+    """
+    Highest sequence number whose tombstones were purged by compaction.
+    Clients that synced before it have to start over.
+    """
+    seq = models.BigIntegerField(default=0)
@@ -3,6 +3,9 @@ from django.db import models
 
 from rest_framework import serializers
 
+from ..expansions import ExpandableMixin
+from ..fieldsets import SparseFieldsetMixin
+
 
 class Comment(models.Model):
     description = models.CharField(max_length=8192, blank=True)
@@ -12,8 +15,15 @@ class Comment(models.Model):
         "Issue", on_delete=models.CASCADE, related_name="comments")
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['issue', 'created_at']),
+        ]
+
+
+class CommentSerializer(ExpandableMixin, SparseFieldsetMixin, serializers.ModelSerializer):
+    user_fields = ['author']
 
-class CommentSerializer(serializers.ModelSerializer):
     class Meta:
         model = Comment
         fields = ['id', 'description', 'author', 'issue', 'created_at']
@@ -3,6 +3,14 @@ from django.db import models
 
 from rest_framework import serializers
 
+from ..fieldsets import SparseFieldsetMixin
+
+
+class ContributorQuerySet(models.QuerySet):
+    def with_username(self):
+        return self.select_related('user').only(
+            'project', 'user', 'permission', 'role', 'user__username')
+
 
 class Contributor(models.Model):
     user = models.ForeignKey(
@@ -15,10 +23,23 @@ class Contributor(models.Model):
     ])
     role = models.CharField(max_length=100, blank=True)
 
+    objects = ContributorQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['project', 'user']),
+        ]
+
 
-class ContributorSerializer(serializers.ModelSerializer):
+class ContributorSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     username = serializers.ReadOnlyField(source='user.username')
 
     class Meta:
         model = Contributor
         fields = ['username', 'permission', 'role']
+
+    def narrow_queryset(self, queryset, extra=()):
+        if 'username' not in self.fields:
+            queryset = queryset.select_related(None)
+
+        return super().narrow_queryset(queryset, extra)
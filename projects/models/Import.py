@@ -0,0 +1,22 @@
+from django.db import models
+
+
+class ImportJob(models.Model):
+    name = models.CharField(max_length=255, unique=True)
+    # Input records committed so far, the checkpoint a resumed import skips to.
+    records = models.PositiveBigIntegerField(default=0)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+
+class ImportedObject(models.Model):
+    job = models.ForeignKey(
+        ImportJob, on_delete=models.CASCADE, related_name="imported_objects")
+    kind = models.CharField(max_length=20)
+    external_id = models.CharField(max_length=100)
+    object_id = models.BigIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['job', 'kind', 'external_id'], name='unique_imported_object'),
+        ]
@@ -1,8 +1,38 @@
 from django.conf import settings
 from django.db import models
+from django.db.models.functions import Coalesce
 
 from rest_framework import serializers
 
+from ..expansions import ExpandableMixin
+from ..fieldsets import SparseFieldsetMixin
+from .Comment import CommentSerializer
+
+
+class IssueQuerySet(models.QuerySet):
+    """
+    Shared by Issue and ArchivedIssue, whose comments live in another table.
+    """
+
+    def get_comment_model(self):
+        return self.model._meta.get_field('comments').related_model
+
+    def with_comments(self, users=False):
+        comments = self.get_comment_model().objects.order_by('created_at', 'id')
+
+        if users:
+            comments = comments.select_related('author').only(
+                'description', 'issue', 'created_at', 'author__id', 'author__username')
+
+        return self.prefetch_related(models.Prefetch('comments', queryset=comments))
+
+    def with_comment_count(self):
+        # A correlated count reads the (issue, created_at) index, without grouping the issues.
+        count = self.get_comment_model().objects.filter(issue=models.OuterRef('pk')).order_by().values('issue').annotate(
+            count=models.Count('id')).values('count')
+
+        return self.annotate(comment_count=Coalesce(models.Subquery(count), 0))
+
 
 class Issue(models.Model):
     title = models.CharField(max_length=100)
@@ -18,9 +48,42 @@ class Issue(models.Model):
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE, blank=True, null=True, related_name="assigned_issues")
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = IssueQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['project', 'created_at']),
+            models.Index(fields=['project', 'status', 'created_at']),
+            models.Index(fields=['project', 'priority', 'created_at']),
+            models.Index(fields=['assignee', 'status']),
+        ]
+
+
+class IssueSerializer(ExpandableMixin, SparseFieldsetMixin, serializers.ModelSerializer):
+    expansions = ['comments', 'comment_count', 'users']
+    user_fields = ['author', 'assignee']
 
-class IssueSerializer(serializers.ModelSerializer):
     class Meta:
         model = Issue
         fields = ['id', 'title', 'description', 'tag', 'priority',
                   'project', 'status', 'author', 'assignee', 'created_at']
+
+    def get_expanded_fields(self):
+        fields = {}
+
+        if 'comments' in self.expand:
+            fields['comments'] = CommentSerializer(read_only=True, many=True, expand=self.expand & {'users'})
+
+        if 'comment_count' in self.expand:
+            fields['comment_count'] = serializers.IntegerField(read_only=True)
+
+        return fields
+
+    def narrow_queryset(self, queryset, extra=()):
+        if 'comments' in self.expand:
+            queryset = queryset.with_comments(users='users' in self.expand)
+
+        if 'comment_count' in self.expand:
+            queryset = queryset.with_comment_count()
+
+        return super().narrow_queryset(queryset, extra)
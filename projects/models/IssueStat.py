@@ -0,0 +1,20 @@
+from django.db import models
+
+
+class IssueStat(models.Model):
+    """
+    Issue count of a project for one value of a dimension (`status`,
+    `priority`, `assignee`, or `total` with an empty value). Maintained by
+    database triggers, see projects/stats.py.
+    """
+    project = models.ForeignKey(
+        "Project", on_delete=models.CASCADE, related_name="issue_stats")
+    dimension = models.CharField(max_length=20)
+    value = models.CharField(max_length=100, blank=True)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['project', 'dimension', 'value'], name='unique_issue_stat'),
+        ]
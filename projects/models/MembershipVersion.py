@@ -0,0 +1,12 @@
+from django.db import models
+
+
+class MembershipVersion(models.Model):
+    """
+    Version of a user's project memberships, bumped by database triggers
+    whenever one of them is added, changed or removed. Access tokens carrying
+    memberships are only trusted while they carry the current version, see
+    projects/tokens.py. There is no foreign key, the triggers write it.
+    """
+    user_id = models.BigIntegerField(primary_key=True)
+    version = models.PositiveBigIntegerField(default=0)
@@ -3,7 +3,24 @@ from django.db import models
 
 from rest_framework import serializers
 
-from .Contributor import ContributorSerializer
+from ..fieldsets import SparseFieldsetMixin
+from .Contributor import Contributor, ContributorSerializer
+
+
+class ProjectQuerySet(models.QuerySet):
+    def with_contributors(self):
+        return self.prefetch_related(models.Prefetch(
+            'contributor_set', queryset=Contributor.objects.with_username()))
+
+
+class ProjectManager(models.Manager.from_queryset(ProjectQuerySet)):
+    """
+    Leaves out the projects deleted in the background that are not purged
+    yet, see projects/deletion.py.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_at__isnull=True)
 
 
 class Project(models.Model):
@@ -12,12 +29,25 @@ class Project(models.Model):
     type = models.CharField(max_length=100, blank=True)
     contributors = models.ManyToManyField(
         settings.AUTH_USER_MODEL, through="Contributor", related_name="projects")
+    # Bumped by database triggers whenever the project or anything in it changes.
+    version = models.PositiveBigIntegerField(default=0, editable=False)
+    # Set when the project is deleted in the background, until it is purged.
+    deleted_at = models.DateTimeField(blank=True, null=True, editable=False)
+
+    objects = ProjectManager()
+    all_objects = ProjectQuerySet.as_manager()
 
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     contributors = ContributorSerializer(
         read_only=True, many=True, source='contributor_set')
 
     class Meta:
         model = Project
         fields = ['id', 'title', 'description', 'type', 'contributors']
+
+    def narrow_queryset(self, queryset, extra=()):
+        if 'contributors' in self.fields:
+            queryset = queryset.with_contributors()
+
+        return super().narrow_queryset(queryset, extra)
@@ -1,4 +1,9 @@
+from . import Archive
+from . import Change
 from . import Comment
 from . import Contributor
+from . import Import
 from . import Issue
+from . import IssueStat
+from . import MembershipVersion
 from . import Project
\ No newline at end of file
@@ -0,0 +1,234 @@
+import base64
+import binascii
+import json
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+from .rows import RowSerializer
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination seeking on the full ordering key, so that every page is
+    an index range scan whatever its depth. Clients opt in by passing either
+    `cursor` or `page_size`; the `next` link carries an opaque cursor.
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+    invalid_cursor_message = 'Invalid cursor.'
+
+    def __init__(self, ordering=('created_at', 'id')):
+        self.ordering = ordering
+
+    def is_requested(self, request):
+        return (self.cursor_query_param in request.query_params
+                or self.page_size_query_param in request.query_params)
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return api_settings.PAGE_SIZE or self.max_page_size
+
+        return min(max(page_size, 1), self.max_page_size)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self.get_page(list(self.get_page_queryset(queryset, request)))
+
+    def get_page_queryset(self, queryset, request):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.fields = [queryset.model._meta.get_field(name.lstrip('-'))
+                       for name in self.ordering]
+
+        queryset = queryset.order_by(*self.get_order_by())
+        position = self.decode_cursor(request)
+
+        if position is not None:
+            queryset = queryset.filter(self.get_seek_filter(position))
+
+        return queryset[:self.page_size + 1]
+
+    def get_page(self, rows):
+        self.next_position = None
+
+        if len(rows) > self.page_size:
+            rows = rows[:self.page_size]
+            self.next_position = self.get_position(rows[-1])
+
+        return rows
+
+    def get_paginated_data(self, data):
+        return {'next': self.get_next_link(), 'results': data}
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+
+        return replace_query_param(self.request.build_absolute_uri(),
+                                   self.cursor_query_param, self.encode_cursor(self.next_position))
+
+    def get_order_by(self):
+        order_by = []
+
+        for name, field in zip(self.ordering, self.fields):
+            if not field.null:
+                order_by.append(name)
+            elif name.startswith('-'):
+                order_by.append(F(field.attname).desc(nulls_last=True))
+            else:
+                order_by.append(F(field.attname).asc(nulls_first=True))
+
+        return order_by
+
+    def get_position(self, row):
+        if isinstance(row, dict):
+            return [row[field.attname] for field in self.fields]
+
+        return [getattr(row, field.attname) for field in self.fields]
+
+    def get_seek_filter(self, position):
+        seek = Q()
+        equal = Q()
+
+        for name, field, value in zip(self.ordering, self.fields, position):
+            descending = name.startswith('-')
+
+            # Nulls sort first ascending and last descending, see get_order_by().
+            if value is None:
+                if not descending:
+                    seek |= equal & Q(**{f'{field.attname}__isnull': False})
+                equal &= Q(**{f'{field.attname}__isnull': True})
+                continue
+
+            after = Q(**{f'{field.attname}__{"lt" if descending else "gt"}': value})
+
+            if field.null and descending:
+                after |= Q(**{f'{field.attname}__isnull': True})
+
+            seek |= equal & after
+            equal &= Q(**{field.attname: value})
+
+        return seek
+
+    def encode_cursor(self, position):
+        raw = json.dumps([value.isoformat() if hasattr(value, 'isoformat') else value
+                          for value in position])
+
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+
+        if not encoded:
+            return None
+
+        try:
+            position = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+
+            if not isinstance(position, list) or len(position) != len(self.fields):
+                raise ValueError
+
+            return [field.to_python(value) for field, value in zip(self.fields, position)]
+        except (binascii.Error, ValueError, TypeError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+
+def get_list_serializer(queryset, serializer_class, ordering, fieldset=None):
+    """
+    Returns the queryset to list and a function serializing rows of it, going
+    through RowSerializer whenever the serializer can be compiled.
+    """
+    fieldset = fieldset or {}
+    rows = None
+
+    if settings.FAST_LIST_SERIALIZATION:
+        rows = RowSerializer.compile(serializer_class(**fieldset))
+
+    if rows is None:
+        return queryset, lambda page: serializer_class(page, many=True, **fieldset).data
+
+    return rows.get_queryset(queryset, ordering), rows.to_representation
+
+
+def merge_rows(model, results, ordering):
+    """
+    Merges the rows listed from tables with the same columns (see
+    projects/archive.py) on the ordering, sorting nulls the way
+    KeysetPagination.get_order_by() has the database sort them.
+    """
+    if len(results) == 1:
+        return list(results[0])
+
+    rows = [row for result in results for row in result]
+
+    # Stable sorts from the last ordering field to the first.
+    for name in reversed(ordering):
+        attname = model._meta.get_field(name.lstrip('-')).attname
+        rows.sort(key=lambda row: (0,) if getattr(row, attname) is None else (1, getattr(row, attname)),
+                  reverse=name.startswith('-'))
+
+    return rows
+
+
+def get_list_serializers(querysets, serializer_class, ordering, fieldset):
+    serialize = None
+    listed = []
+
+    for queryset in querysets:
+        queryset, serialize = get_list_serializer(queryset, serializer_class, ordering, fieldset)
+        listed.append(queryset)
+
+    return listed, serialize
+
+
+def paginated_response(request, queryset, serializer_class, ordering=('created_at', 'id'), fieldset=None, union=()):
+    """
+    Lists the queryset, merged with the `union` querysets when given, one
+    page at a time when the client asks for it.
+    """
+    paginator = KeysetPagination(ordering)
+    querysets, serialize = get_list_serializers([queryset, *union], serializer_class, ordering, fieldset)
+
+    if not union:
+        if not paginator.is_requested(request):
+            return Response(serialize(querysets[0]))
+
+        page = paginator.paginate_queryset(querysets[0], request)
+
+        return paginator.get_paginated_response(serialize(page))
+
+    if not paginator.is_requested(request):
+        return Response(serialize(merge_rows(queryset.model, querysets, ordering)))
+
+    # Each queryset's next page, then the next page of them all.
+    results = [paginator.get_page_queryset(queryset, request) for queryset in querysets]
+    page = paginator.get_page(merge_rows(queryset.model, results, ordering)[:paginator.page_size + 1])
+
+    return paginator.get_paginated_response(serialize(page))
+
+
+async def apaginate(request, queryset, serializer_class, ordering=('created_at', 'id'), fieldset=None, union=()):
+    paginator = KeysetPagination(ordering)
+    querysets, serialize = get_list_serializers([queryset, *union], serializer_class, ordering, fieldset)
+
+    if not paginator.is_requested(request):
+        results = [[row async for row in queryset] for queryset in querysets]
+
+        return serialize(merge_rows(queryset.model, results, ordering) if union else results[0])
+
+    results = [[row async for row in paginator.get_page_queryset(queryset, request)] for queryset in querysets]
+    page = paginator.get_page(merge_rows(queryset.model, results, ordering)[:paginator.page_size + 1])
+
+    return paginator.get_paginated_data(serialize(page))
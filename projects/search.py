@@ -0,0 +1,93 @@
+from django.db import connection, transaction
+
+SEARCH_SQL = '''
+    SELECT 'issue', rowid, NULL, title,
+           snippet(projects_issue_search, 2, '<mark>', '</mark>', '...', 24),
+           bm25(projects_issue_search, 0.0, 4.0, 1.0) AS rank
+    FROM projects_issue_search
+    WHERE projects_issue_search MATCH %s
+    UNION ALL
+    SELECT 'comment', rowid, issue_id, NULL,
+           snippet(projects_comment_search, 2, '<mark>', '</mark>', '...', 24),
+           bm25(projects_comment_search, 0.0, 0.0, 1.0) AS rank
+    FROM projects_comment_search
+    WHERE projects_comment_search MATCH %s
+    ORDER BY rank
+    LIMIT %s OFFSET %s
+'''
+
+REBUILD_SQL = [
+    'DELETE FROM projects_issue_search',
+    'INSERT INTO projects_issue_search (rowid, project, title, description) '
+    'SELECT id, project_id, title, description FROM projects_issue '
+    'UNION ALL SELECT id, project_id, title, description FROM projects_archivedissue',
+    "INSERT INTO projects_issue_search (projects_issue_search) VALUES ('optimize')",
+    'DELETE FROM projects_comment_search',
+    'INSERT INTO projects_comment_search (rowid, project, issue_id, description) '
+    'SELECT comment.id, issue.project_id, comment.issue_id, comment.description '
+    'FROM projects_comment comment JOIN projects_issue issue ON issue.id = comment.issue_id '
+    'UNION ALL SELECT comment.id, issue.project_id, comment.issue_id, comment.description '
+    'FROM projects_archivedcomment comment JOIN projects_archivedissue issue ON issue.id = comment.issue_id',
+    "INSERT INTO projects_comment_search (projects_comment_search) VALUES ('optimize')",
+]
+
+
+def is_available():
+    return connection.vendor == 'sqlite'
+
+
+def build_match(project_id, text, columns):
+    """
+    Turns free text into an FTS5 query scoped to a project, whose terms only
+    match the given text columns: `project` is indexed too, so a term equal
+    to the project id would otherwise match every row. Every term is quoted
+    so user input can never be parsed as FTS5 syntax; a trailing `*` keeps
+    its prefix-search meaning.
+    """
+    terms = []
+
+    for term in text.split():
+        prefix = term.endswith('*')
+        term = term.rstrip('*').replace('"', '""')
+
+        if term:
+            terms.append(f'"{term}"' + (' *' if prefix else ''))
+
+    if not terms:
+        return None
+
+    return f'project : "{int(project_id)}" AND {{{" ".join(columns)}}} : ({" ".join(terms)})'
+
+
+def search(project_id, text, limit, offset=0):
+    issue_match = build_match(project_id, text, ['title', 'description'])
+    comment_match = build_match(project_id, text, ['description'])
+
+    if issue_match is None:
+        return []
+
+    with connection.cursor() as cursor:
+        cursor.execute(SEARCH_SQL, [issue_match, comment_match, limit, offset])
+        rows = cursor.fetchall()
+
+    results = []
+
+    for kind, object_id, issue_id, title, snippet, rank in rows:
+        result = {'type': kind, 'id': object_id}
+
+        if kind == 'issue':
+            result['title'] = title
+        else:
+            result['issue'] = int(issue_id)
+
+        result['snippet'] = snippet
+        result['rank'] = rank
+        results.append(result)
+
+    return results
+
+
+def rebuild_index():
+    with transaction.atomic(), connection.cursor() as cursor:
+        for statement in REBUILD_SQL:
+            cursor.execute(statement)
@@ -0,0 +1,32 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .authentication import user_cache, version_cache
+from .models.Contributor import Contributor
+from .models.Project import Project
+
+
+@receiver([post_save, post_delete], sender=get_user_model())
+def invalidate_cached_user(sender, instance, **kwargs):
+    user_cache.invalidate(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Contributor)
+def invalidate_membership_version(sender, instance, **kwargs):
+    version_cache.invalidate(instance.user_id)
+
+
+@receiver(m2m_changed, sender=Project.contributors.through)
+def invalidate_membership_versions(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if reverse:
+        version_cache.invalidate(instance.pk)
+    elif pk_set is not None:
+        for user_id in pk_set:
+            version_cache.invalidate(user_id)
+    else:
+        # post_clear does not tell which users were removed.
+        version_cache.clear()
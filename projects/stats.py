@@ -0,0 +1,76 @@
+from django.db import connection, transaction
+
+from .models.IssueStat import IssueStat
+
+DIMENSIONS = ['status', 'priority', 'assignee']
+
+# Archived issues still count, see projects/archive.py.
+COUNT_SQL = '''
+    WITH issues AS (
+        SELECT project_id, status, priority, assignee_id FROM projects_issue
+        UNION ALL
+        SELECT project_id, status, priority, assignee_id FROM projects_archivedissue
+    )
+    SELECT project_id, 'total', '', COUNT(*)
+    FROM issues {where} GROUP BY project_id
+    UNION ALL
+    SELECT project_id, 'status', status, COUNT(*)
+    FROM issues {where} GROUP BY project_id, status
+    UNION ALL
+    SELECT project_id, 'priority', priority, COUNT(*)
+    FROM issues {where} GROUP BY project_id, priority
+    UNION ALL
+    SELECT project_id, 'assignee', COALESCE(CAST(assignee_id AS TEXT), ''), COUNT(*)
+    FROM issues {where} GROUP BY project_id, assignee_id
+'''
+
+
+def is_maintained():
+    """
+    The counters are kept up to date by SQLite triggers, created in the
+    0007_issue_stats migration. Other databases count issues on demand.
+    """
+    return connection.vendor == 'sqlite'
+
+
+def count(project_id=None):
+    where, params = '', []
+
+    if project_id is not None:
+        where, params = 'WHERE project_id = %s', [project_id]
+
+    with connection.cursor() as cursor:
+        cursor.execute(COUNT_SQL.format(where=where), params * 4)
+        return cursor.fetchall()
+
+
+def get_stats(project_id):
+    if is_maintained():
+        rows = IssueStat.objects.filter(project_id=project_id, count__gt=0).order_by(
+            'dimension', 'value').values_list('project_id', 'dimension', 'value', 'count')
+    else:
+        rows = count(project_id)
+
+    stats = {'total': 0, **{dimension: {} for dimension in DIMENSIONS}}
+
+    for _, dimension, value, total in rows:
+        if dimension == 'total':
+            stats['total'] = total
+        elif dimension == 'assignee':
+            stats['assignee'][value or 'none'] = total
+        else:
+            stats[dimension][value] = total
+
+    return stats
+
+
+def recompute(project_id=None):
+    where, params = '', []
+
+    if project_id is not None:
+        where, params = 'WHERE project_id = %s', [project_id]
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM projects_issuestat {where}', params)
+        cursor.execute('INSERT INTO projects_issuestat (project_id, dimension, value, count) '
+                       + COUNT_SQL.format(where=where), params * 4)
@@ -0,0 +1,421 @@
+import json
+import tempfile
+from concurrent.futures import Future
+from datetime import datetime, timedelta, timezone
+from io import StringIO
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from . import deletion, hashing
+from .archive import archive_issues
+from .membership import get_membership
+from .models.Archive import ArchivedIssue
+from .models.Comment import Comment
+from .models.Contributor import Contributor
+from .models.Issue import Issue
+from .models.Project import Project
+from .views import ProjectIssuesView
+
+# Rows per project: contributors, issues, and comments per issue.
+SIZES = [2, 20]
+
+
+class ProjectTestCase(APITestCase):
+    """
+    Requests are made as an authenticated author, without a token, so
+    memberships are resolved from the database, see projects/membership.py.
+    """
+
+    def setUp(self):
+        caches['throttle'].clear()
+        self.user = User.objects.create_user('author')
+        self.client.force_authenticate(self.user)
+
+    def make_project(self, size):
+        project = Project.objects.create(title='project', description='', type='back')
+        users = User.objects.bulk_create(
+            User(username=f'{project.id}-{n}') for n in range(size - 1))
+        Contributor.objects.bulk_create(
+            [Contributor(project=project, user=self.user, permission='author', role='author')] +
+            [Contributor(project=project, user=user, permission='editor', role='editor') for user in users])
+        issues = Issue.objects.bulk_create(
+            Issue(project=project, author=self.user, title=f'issue {n}', status='open') for n in range(size))
+        Comment.objects.bulk_create(
+            Comment(issue=issue, author=self.user, description=f'comment {n}')
+            for issue in issues for n in range(size))
+
+        return project, users, issues
+
+
+class QueryCountTestCase(ProjectTestCase):
+    def assertQueries(self, count, method, url, data=None):
+        with self.assertNumQueries(count):
+            response = getattr(self.client, method)(url, data, format='json')
+
+        self.assertLess(response.status_code, 300, response.content)
+
+        return response
+
+
+class MembershipQueryCountTest(QueryCountTestCase):
+    """
+    Every endpoint resolves the membership with one query whatever the size
+    of the project.
+    """
+
+    def test_membership_is_memoized(self):
+        project, _, _ = self.make_project(2)
+        request = SimpleNamespace(user=self.user, auth=None)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(get_membership(request, project.id), (True, 'author'))
+            self.assertEqual(get_membership(request, str(project.id)), (True, 'author'))
+
+    def test_project_list(self):
+        for size in SIZES:
+            with self.subTest(size=size):
+                self.make_project(size)
+                self.assertQueries(2, 'get', '/projects')
+
+    def test_project_detail(self):
+        for size in SIZES:
+            with self.subTest(size=size):
+                project, _, _ = self.make_project(size)
+                self.assertQueries(3, 'get', f'/projects/{project.id}')
+                self.assertQueries(4, 'put', f'/projects/{project.id}', {'title': 'renamed'})
+
+    def test_project_users(self):
+        for size in SIZES:
+            with self.subTest(size=size):
+                project, users, _ = self.make_project(size)
+                newcomer = User.objects.create_user(f'newcomer-{size}')
+                self.assertQueries(2, 'get', f'/projects/{project.id}/users')
+                self.assertQueries(4, 'post', f'/projects/{project.id}/users',
+                                   {'user_id': newcomer.id, 'permission': 'editor'})
+                self.assertQueries(3, 'delete', f'/projects/{project.id}/users/{users[0].id}')
+
+    def test_project_issues(self):
+        for size in SIZES:
+            with self.subTest(size=size):
+                project, users, issues = self.make_project(size)
+                url = f'/projects/{project.id}/issues'
+                self.assertQueries(2, 'get', url)
+                self.assertQueries(2, 'post', url, {'title': 'new', 'description': '', 'tag': 'bug',
+                                                    'priority': 'low', 'status': 'open'})
+                self.assertQueries(3, 'put', f'{url}/{issues[0].id}', {'status': 'closed'})
+                self.assertQueries(4, 'delete', f'{url}/{issues[1].id}')
+
+    def test_project_issue_comments(self):
+        for size in SIZES:
+            with self.subTest(size=size):
+                project, _, issues = self.make_project(size)
+                url = f'/projects/{project.id}/issues/{issues[0].id}/comments'
+                comment = Comment.objects.filter(issue=issues[0]).first()
+                self.assertQueries(2, 'get', url)
+                self.assertQueries(2, 'get', f'{url}/{comment.id}')
+                self.assertQueries(3, 'post', url, {'description': 'new'})
+                self.assertQueries(4, 'put', f'{url}/{comment.id}', {'description': 'edited'})
+                self.assertQueries(4, 'delete', f'{url}/{comment.id}')
+
+
+class ProjectContributorsQueryCountTest(QueryCountTestCase):
+    """
+    Projects nest their contributors with usernames, which must not cost a
+    query per project or per contributor.
+    """
+
+    def test_project_list(self):
+        for projects, size in [(1, 2), (12, 10)]:
+            with self.subTest(projects=projects, size=size):
+                Project.objects.all().delete()
+
+                for _ in range(projects):
+                    self.make_project(size)
+
+                response = self.assertQueries(2, 'get', '/projects')
+                self.assertEqual(len(response.data), projects)
+                self.assertEqual({len(project['contributors']) for project in response.data}, {size})
+
+                self.assertQueries(2, 'get', '/projects?page_size=5')
+
+    def test_project_detail(self):
+        for size in [2, 50]:
+            with self.subTest(size=size):
+                project, _, _ = self.make_project(size)
+
+                response = self.assertQueries(3, 'get', f'/projects/{project.id}')
+                self.assertEqual(len(response.data['contributors']), size)
+
+                self.assertQueries(4, 'put', f'/projects/{project.id}', {'title': 'renamed'})
+
+
+class BulkIssuesValidationTest(ProjectTestCase):
+    def test_invalid_items(self):
+        project, _, issues = self.make_project(2)
+        item = {'title': 'new', 'description': '', 'tag': 'bug', 'priority': 'low', 'status': 'open'}
+
+        response = self.client.post(f'/projects/{project.id}/issues/bulk', {
+            'create': [{**item, 'assignee': [1]}, {**item, 'assignee': {'id': 1}}, {**item, 'assignee': True},
+                       {**item, 'title': ['new']}, item],
+            'update': [{'id': [issues[0].id]}, {'id': {'id': 1}}, {'id': None}, {'status': 'closed'},
+                       {'id': issues[0].id, 'assignee': [1]}, {'id': issues[1].id, 'status': 'closed'}],
+        }, format='json')
+
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual([result['status'] for result in response.data['create']], [400, 400, 400, 400, 201])
+        self.assertEqual([result.get('error') for result in response.data['update']], [
+            'Invalid issue.', 'Invalid issue.', 'Invalid issue.', 'Invalid issue.', 'Invalid assignee.', None])
+        self.assertEqual(Issue.objects.get(id=issues[1].id).status, 'closed')
+
+    def test_invalid_payload(self):
+        project, _, _ = self.make_project(2)
+
+        for payload in [[], [{'create': []}], 'create', {'create': {}}]:
+            with self.subTest(payload=payload):
+                response = self.client.post(f'/projects/{project.id}/issues/bulk', payload, format='json')
+                self.assertEqual(response.status_code, 400, response.content)
+                self.assertEqual(response.data, {'error': 'Invalid payload. (create, update)'})
+
+
+@override_settings(THROTTLE_BUCKETS={'DEFAULT': {'read': (2, 3), 'write': (1, 1)}})
+class ThrottlingTest(ProjectTestCase):
+    """
+    Buckets hold `burst` requests and refill at `rate` requests per second
+    of the clock the throttle reads.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.now = 1000.0
+        patcher = mock.patch('projects.throttling.time.monotonic', lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.project, _, _ = self.make_project(2)
+        self.url = f'/projects/{self.project.id}/issues'
+
+    def get_statuses(self, requests, method='get', data=None):
+        return [getattr(self.client, method)(self.url, data, format='json').status_code for _ in range(requests)]
+
+    def test_burst_then_refill(self):
+        self.assertEqual(self.get_statuses(4), [200, 200, 200, 429])
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response['Retry-After'], '1')
+
+        self.now += 0.5
+        self.assertEqual(self.get_statuses(2), [200, 429])
+
+        # An idle bucket refills up to its burst, not beyond.
+        self.now += 60
+        self.assertEqual(self.get_statuses(4), [200, 200, 200, 429])
+
+    def test_buckets_per_user_and_method(self):
+        self.get_statuses(3)
+        issue = {'title': 'new', 'description': '', 'tag': 'bug', 'priority': 'low', 'status': 'open'}
+        self.assertEqual(self.get_statuses(2, 'post', issue), [200, 429])
+
+        other = User.objects.create_user('other')
+        Contributor.objects.create(project=self.project, user=other, permission='editor')
+        self.client.force_authenticate(other)
+        self.assertEqual(self.get_statuses(4), [200, 200, 200, 429])
+
+    def test_no_extra_queries(self):
+        with CaptureQueriesContext(connection) as throttled:
+            self.client.get(self.url)
+
+        with mock.patch.object(ProjectIssuesView, 'throttle_classes', ()), \
+                CaptureQueriesContext(connection) as unthrottled:
+            self.client.get(self.url)
+
+        self.assertEqual(len(throttled), len(unthrottled))
+
+
+class HashingPoolTest(ProjectTestCase):
+    def test_timeout_then_full_queue(self):
+        future = Future()
+        pool = hashing.HashingPool(workers=1, queue_size=0, timeout=0.01)
+        self.addCleanup(future.set_result, None)
+
+        with mock.patch.object(hashing, 'get_pool', return_value=pool), \
+                mock.patch.object(pool, 'get_executor', return_value=SimpleNamespace(submit=lambda *args: future)):
+            credentials = {'username': 'author', 'password': 'password'}
+            response = self.client.post('/login', credentials, format='json')
+            self.assertEqual(response.status_code, 503, response.content)
+
+            # The job that timed out still holds the only slot.
+            response = self.client.post('/login', credentials, format='json')
+            self.assertEqual(response.status_code, 429, response.content)
+
+
+class ArchiveTest(ProjectTestCase):
+    def setUp(self):
+        super().setUp()
+        self.project, _, self.issues = self.make_project(2)
+        Issue.objects.filter(id=self.issues[0].id).update(status='closed')
+        self.assertEqual(archive_issues(age=timedelta(0)), 1)
+
+    def test_listing(self):
+        url = f'/projects/{self.project.id}/issues'
+        self.assertEqual([issue['id'] for issue in self.client.get(url).data], [self.issues[1].id])
+        self.assertEqual([issue['id'] for issue in self.client.get(f'{url}?include_archived=true').data],
+                         [issue.id for issue in self.issues])
+        self.assertEqual(self.client.get(f'{url}/{self.issues[0].id}/comments?include_archived=true').data[0]['issue'],
+                         self.issues[0].id)
+
+    def test_restored_on_edit(self):
+        response = self.client.put(f'/projects/{self.project.id}/issues/{self.issues[0].id}', {'status': 'open'},
+                                   format='json')
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertFalse(ArchivedIssue.objects.exists())
+        self.assertEqual(Comment.objects.filter(issue_id=self.issues[0].id).count(), 2)
+
+    def test_not_restored_from_another_project(self):
+        other, _, _ = self.make_project(2)
+        url = f'/projects/{other.id}/issues'
+
+        response = self.client.put(f'{url}/{self.issues[0].id}', {'status': 'open'}, format='json')
+        self.assertEqual(response.status_code, 400, response.content)
+
+        response = self.client.post(f'{url}/bulk', {'update': [{'id': self.issues[0].id, 'status': 'open'}]},
+                                    format='json')
+        self.assertEqual(response.data['update'][0]['error'], 'Invalid issue.')
+        self.assertTrue(ArchivedIssue.objects.filter(id=self.issues[0].id).exists())
+
+
+class SearchTest(ProjectTestCase):
+    def test_query_equal_to_project_id(self):
+        project, _, issues = self.make_project(2)
+        Issue.objects.filter(project=project).update(title='issue', description='')
+        Comment.objects.filter(issue__project=project).update(description='comment')
+        url = f'/projects/{project.id}/search?q={project.id}'
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.data['results'], [])
+
+        Issue.objects.filter(id=issues[0].id).update(title=f'release {project.id}')
+        Comment.objects.filter(issue=issues[1]).update(description=f'fixed in {project.id}')
+
+        response = self.client.get(url)
+        self.assertEqual(sorted((result['type'], result.get('issue')) for result in response.data['results']),
+                         [('comment', issues[1].id), ('comment', issues[1].id), ('issue', None)])
+
+
+class DeletedProjectTest(ProjectTestCase):
+    def test_child_endpoints_after_soft_delete(self):
+        project, _, issues = self.make_project(2)
+        urls = [f'/projects/{project.id}', f'/projects/{project.id}/users', f'/projects/{project.id}/issues',
+                f'/projects/{project.id}/issues/{issues[0].id}/comments']
+
+        self.assertEqual([self.client.get(url).status_code for url in urls], [200] * len(urls))
+
+        # Left for the purge, which runs on commit.
+        with mock.patch.object(deletion.purger, 'submit'):
+            deletion.soft_delete_project(project.id)
+
+        for url in urls:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 404, url)
+            self.assertEqual(response.data, {'error': 'Project not found.'})
+
+        self.assertEqual(Issue.objects.filter(project_id=project.id).count(), 2)
+
+
+class FormerContributorChangesTest(ProjectTestCase):
+    """
+    Former contributors read the change log up to the change that ended their
+    access, to learn that it ended.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.project, self.users, self.issues = self.make_project(2)
+        self.url = f'/projects/{self.project.id}/changes'
+
+    def test_removed_contributor(self):
+        former = self.users[0]
+        response = self.client.delete(f'/projects/{self.project.id}/users/{former.id}')
+        self.assertLess(response.status_code, 300, response.content)
+        self.client.put(f'/projects/{self.project.id}/issues/{self.issues[0].id}', {'status': 'closed'},
+                        format='json')
+
+        self.client.force_authenticate(former)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.data['ended'], 'removed')
+        self.assertEqual({key: response.data['results'][-1][key] for key in ['type', 'id', 'action']},
+                         {'type': 'contributor', 'id': former.id, 'action': 'delete'})
+        self.assertEqual({result['data'] for result in response.data['results']}, {None})
+
+        response = self.client.get(f'{self.url}?since={response.data["seq"]}')
+        self.assertEqual((response.data['results'], response.data['next']), ([], None))
+
+        self.client.force_authenticate(User.objects.create_user('stranger'))
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+    def test_deleted_project(self):
+        with mock.patch.object(deletion.purger, 'submit'):
+            deletion.soft_delete_project(self.project.id)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.data['ended'], 'deleted')
+        self.assertEqual({key: response.data['results'][-1][key] for key in ['type', 'id', 'action']},
+                         {'type': 'project', 'id': self.project.id, 'action': 'delete'})
+
+        deletion.delete_project(self.project.id)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.data['ended'], 'deleted')
+
+
+class ImportTest(ProjectTestCase):
+    def import_file(self, name, content, *args):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name) / name
+        path.write_text(content)
+        stderr = StringIO()
+        call_command('import_projects', str(path), *args, stdout=StringIO(), stderr=stderr)
+
+        return stderr.getvalue()
+
+    def test_created_at(self):
+        created_at = datetime(2001, 2, 3, 4, 5, 6, tzinfo=timezone.utc)
+        records = [
+            {'type': 'project', 'data': {'id': 1, 'title': 'imported', 'type': 'back'}},
+            {'type': 'issue', 'data': {'id': 1, 'project': 1, 'author': self.user.id, 'title': 'dated',
+                                       'status': 'open', 'created_at': created_at.isoformat()}},
+            {'type': 'issue', 'data': {'id': 2, 'project': 1, 'author': self.user.id, 'title': 'undated',
+                                       'status': 'open'}},
+        ]
+
+        self.import_file('projects.ndjson', '\n'.join(json.dumps(record) for record in records))
+
+        self.assertEqual(Issue.objects.get(title='dated').created_at, created_at)
+        self.assertGreater(Issue.objects.get(title='undated').created_at, created_at)
+        self.assertTrue(Issue._meta.get_field('created_at').auto_now_add)
+
+    def test_invalid_csv(self):
+        stderr = self.import_file('untyped.csv', 'id,title\n1,untyped\n')
+        self.assertIn('1 records skipped: record without a type.', stderr)
+
+        stderr = self.import_file('usernames.csv', 'type,id,project,author,title,status\n'
+                                                   'project,1,,,imported,\n'
+                                                   f'issue,1,1,{self.user.username},issue,open\n',
+                                  '--user-field', 'id')
+        self.assertIn('1 records skipped: issue with an unknown author or assignee.', stderr)
+        self.assertTrue(Project.objects.filter(title='imported').exists())
+        self.assertFalse(Issue.objects.exists())
@@ -0,0 +1,31 @@
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from . import membership
+
+
+class MembershipRefreshToken(RefreshToken):
+    """
+    Refresh token whose access tokens carry the user's project memberships,
+    read again each time one is issued. The refresh token itself does not
+    carry them, so a refresh picks up the memberships changed since login.
+    """
+
+    @property
+    def access_token(self):
+        access = super().access_token
+        claims = membership.get_claims(self[api_settings.USER_ID_CLAIM])
+
+        for claim, value in claims.items():
+            access[claim] = value
+
+        return access
+
+
+class MembershipTokenObtainPairSerializer(TokenObtainPairSerializer):
+    token_class = MembershipRefreshToken
+
+
+class MembershipTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = MembershipRefreshToken
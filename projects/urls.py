@@ -1,15 +1,34 @@
+from django.conf import settings
 from django.urls import path
 
 from . import views
 
+if settings.ASYNC_READ_VIEWS:
+    ProjectsView = views.AsyncProjectsView
+    ProjectView = views.AsyncProjectView
+    ProjectUsersView = views.AsyncProjectUsersView
+    ProjectIssuesView = views.AsyncProjectIssuesView
+    ProjectIssuesCommentsView = views.AsyncProjectIssuesCommentsView
+else:
+    ProjectsView = views.ProjectsView
+    ProjectView = views.ProjectView
+    ProjectUsersView = views.ProjectUsersView
+    ProjectIssuesView = views.ProjectIssuesView
+    ProjectIssuesCommentsView = views.ProjectIssuesCommentsView
+
 urlpatterns = [
     path('signup', views.SignupView.as_view()),
-    path('projects', views.ProjectsView.as_view(), name='projects'),
-    path('projects/<int:project_id>', views.ProjectView.as_view(), name='project'),
-    path('projects/<int:project_id>/users', views.ProjectUsersView.as_view(), name='project_users'),
-    path('projects/<int:project_id>/users/<int:user_id>', views.ProjectUsersView.as_view(), name='project_users'),
-    path('projects/<int:project_id>/issues', views.ProjectIssuesView.as_view(), name='project_issues'),
-    path('projects/<int:project_id>/issues/<int:issue_id>', views.ProjectIssuesView.as_view(), name='project_issues'),
-    path('projects/<int:project_id>/issues/<int:issue_id>/comments', views.ProjectIssuesCommentsView.as_view(), name='project_issues_comments'),
-    path('projects/<int:project_id>/issues/<int:issue_id>/comments/<int:comment_id>', views.ProjectIssuesCommentsView.as_view(), name='project_issues_comments'),
+    path('projects', ProjectsView.as_view(), name='projects'),
+    path('projects/<int:project_id>', ProjectView.as_view(), name='project'),
+    path('projects/<int:project_id>/users', ProjectUsersView.as_view(), name='project_users'),
+    path('projects/<int:project_id>/users/<int:user_id>', ProjectUsersView.as_view(), name='project_users'),
+    path('projects/<int:project_id>/issues', ProjectIssuesView.as_view(), name='project_issues'),
+    path('projects/<int:project_id>/issues/<int:issue_id>', ProjectIssuesView.as_view(), name='project_issues'),
+    path('projects/<int:project_id>/issues/bulk', views.ProjectIssuesBulkView.as_view(), name='project_issues_bulk'),
+    path('projects/<int:project_id>/issues/<int:issue_id>/comments', ProjectIssuesCommentsView.as_view(), name='project_issues_comments'),
+    path('projects/<int:project_id>/issues/<int:issue_id>/comments/<int:comment_id>', ProjectIssuesCommentsView.as_view(), name='project_issues_comments'),
+    path('projects/<int:project_id>/changes', views.ProjectChangesView.as_view(), name='project_changes'),
+    path('projects/<int:project_id>/export', views.ProjectExportView.as_view(), name='project_export'),
+    path('projects/<int:project_id>/search', views.ProjectSearchView.as_view(), name='project_search'),
+    path('projects/<int:project_id>/stats', views.ProjectStatsView.as_view(), name='project_stats'),
 ]
@@ -0,0 +1,217 @@
+from asgiref.sync import sync_to_async
+from django.db.models import Q
+from django.http import HttpResponse
+from django.utils.decorators import classonlymethod
+from django.views import View
+from rest_framework.exceptions import APIException, NotAuthenticated, Throttled
+from rest_framework.settings import api_settings
+
+from ..authentication import AsyncJWTAuthentication
+from ..conditional import conditional_project_get
+from ..filters import filter_issues, get_issue_ordering, include_archived
+from ..models.Archive import ArchivedComment, ArchivedIssue
+from ..models.Comment import Comment, CommentSerializer
+from ..models.Contributor import Contributor, ContributorSerializer
+from ..models.Issue import Issue, IssueSerializer
+from ..models.Project import Project, ProjectSerializer
+from ..pagination import apaginate
+from .Project import ProjectIssuesCommentsView, ProjectIssuesView, ProjectsView, ProjectUsersView, ProjectView
+
+
+def get_renderers():
+    # The browsable API needs a DRF view around it.
+    return [renderer() for renderer in api_settings.DEFAULT_RENDERER_CLASSES if renderer.format != 'api']
+
+
+def render(request, data, status=200, headers=None):
+    renderer = getattr(request, 'accepted_renderer', None) or get_renderers()[0]
+
+    return HttpResponse(renderer.render(data), status=status,
+                        headers=headers, content_type=renderer.media_type)
+
+
+class AsyncReadView(View):
+    """
+    Serves GET on the event loop with the async ORM, and hands every other
+    method to the synchronous DRF `write_view` so a URL keeps its write paths.
+    """
+    write_view = None
+    authentication = AsyncJWTAuthentication()
+    negotiation = api_settings.DEFAULT_CONTENT_NEGOTIATION_CLASS()
+
+    @property
+    def throttle_scope(self):
+        # Shares the buckets of the synchronous view serving the same URL.
+        return self.write_view.__name__
+
+    @classonlymethod
+    def as_view(cls, **initkwargs):
+        if cls.write_view is not None:
+            cls.write_handler = staticmethod(sync_to_async(cls.write_view.as_view()))
+
+        view = super().as_view(**initkwargs)
+        view.csrf_exempt = True
+        return view
+
+    async def get(self, request, *args, **kwargs):
+        # Lets the DRF-oriented helpers read query parameters off a plain HttpRequest.
+        request.query_params = request.GET
+
+        try:
+            request.accepted_renderer, request.accepted_media_type = self.negotiation.select_renderer(
+                request, get_renderers())
+
+            authenticated = await self.authentication.aauthenticate(request)
+
+            if authenticated is None:
+                raise NotAuthenticated()
+
+            request.user, request.auth = authenticated
+            self.check_throttles(request)
+
+            return await self.read(request, *args, **kwargs)
+        except APIException as exc:
+            headers = None
+
+            if exc.status_code == 401:
+                headers = {'WWW-Authenticate': self.authentication.authenticate_header(request)}
+
+            if getattr(exc, 'wait', None):
+                headers = {'Retry-After': '%d' % exc.wait}
+
+            data = exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+
+            return render(request, data, status=exc.status_code, headers=headers)
+
+    def check_throttles(self, request):
+        for throttle in api_settings.DEFAULT_THROTTLE_CLASSES:
+            throttle = throttle()
+
+            if not throttle.allow_request(request, self):
+                raise Throttled(throttle.wait())
+
+    async def post(self, request, *args, **kwargs):
+        return await self.write(request, *args, **kwargs)
+
+    async def put(self, request, *args, **kwargs):
+        return await self.write(request, *args, **kwargs)
+
+    async def delete(self, request, *args, **kwargs):
+        return await self.write(request, *args, **kwargs)
+
+    async def write(self, request, *args, **kwargs):
+        return await self.write_handler(request, *args, **kwargs)
+
+    async def read(self, request, *args, **kwargs):
+        raise NotImplementedError
+
+
+class AsyncProjectsView(AsyncReadView):
+    write_view = ProjectsView
+
+    async def read(self, request):
+        try:
+            fieldset = ProjectSerializer.get_fieldset(request.query_params)
+        except ValueError as error:
+            return render(request, {'error': str(error)}, status=400)
+
+        projects = ProjectSerializer(**fieldset).narrow_queryset(
+            Project.objects.filter(Q(contributors=request.user)), extra=('id',))
+
+        return render(request, await apaginate(
+            request, projects, ProjectSerializer, ordering=('id',), fieldset=fieldset))
+
+
+class AsyncProjectView(AsyncReadView):
+    write_view = ProjectView
+
+    @conditional_project_get
+    async def read(self, request, project_id):
+        try:
+            fieldset = ProjectSerializer.get_fieldset(request.query_params)
+        except ValueError as error:
+            return render(request, {'error': str(error)}, status=400)
+
+        project = await ProjectSerializer(**fieldset).narrow_queryset(
+            Project.objects.filter(id=project_id)).afirst()
+
+        if not project:
+            return render(request, {'error': 'Project not found.'}, status=404)
+
+        return render(request, ProjectSerializer(project, **fieldset).data)
+
+
+class AsyncProjectUsersView(AsyncReadView):
+    write_view = ProjectUsersView
+
+    @conditional_project_get
+    async def read(self, request, project_id):
+        try:
+            fieldset = ContributorSerializer.get_fieldset(request.query_params)
+        except ValueError as error:
+            return render(request, {'error': str(error)}, status=400)
+
+        users = ContributorSerializer(**fieldset).narrow_queryset(
+            Contributor.objects.with_username().filter(project_id=project_id), extra=('id',))
+
+        return render(request, await apaginate(
+            request, users, ContributorSerializer, ordering=('id',), fieldset=fieldset))
+
+
+class AsyncProjectIssuesView(AsyncReadView):
+    write_view = ProjectIssuesView
+
+    @conditional_project_get
+    async def read(self, request, project_id):
+        issues = Issue.objects.filter(project_id=project_id)
+        archived = []
+
+        try:
+            issues = filter_issues(issues, request.query_params)
+            ordering = get_issue_ordering(request.query_params)
+            fieldset = IssueSerializer.get_fieldset(request.query_params)
+
+            if include_archived(request.query_params):
+                archived = [filter_issues(ArchivedIssue.objects.filter(project_id=project_id), request.query_params)]
+        except ValueError as error:
+            return render(request, {'error': str(error)}, status=400)
+
+        if 'ordering' in request.query_params:
+            issues = issues.order_by(*ordering)
+
+        serializer = IssueSerializer(**fieldset)
+        issues = serializer.narrow_queryset(issues, extra=ordering)
+        archived = [serializer.narrow_queryset(queryset, extra=ordering) for queryset in archived]
+
+        return render(request, await apaginate(
+            request, issues, IssueSerializer, ordering=ordering, fieldset=fieldset, union=archived))
+
+
+class AsyncProjectIssuesCommentsView(AsyncReadView):
+    write_view = ProjectIssuesCommentsView
+
+    @conditional_project_get
+    async def read(self, request, project_id, issue_id, comment_id=None):
+        try:
+            fieldset = CommentSerializer.get_fieldset(request.query_params)
+            models = [Comment, ArchivedComment] if include_archived(request.query_params) else [Comment]
+        except ValueError as error:
+            return render(request, {'error': str(error)}, status=400)
+
+        serializer = CommentSerializer(**fieldset)
+
+        if comment_id:
+            for model in models:
+                comment = await serializer.narrow_queryset(model.objects.filter(
+                    id=comment_id, issue__project_id=project_id)).afirst()
+
+                if comment:
+                    break
+
+            return render(request, CommentSerializer(comment, **fieldset).data)
+
+        comments = [serializer.narrow_queryset(model.objects.filter(
+            issue_id=issue_id, issue__project_id=project_id), extra=('created_at', 'id')) for model in models]
+
+        return render(request, await apaginate(
+            request, comments[0], CommentSerializer, fieldset=fieldset, union=comments[1:]))
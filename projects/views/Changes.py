@@ -0,0 +1,56 @@
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+from rest_framework.views import APIView
+
+from .. import changes
+from ..membership import get_membership
+
+
+class ProjectChangesView(APIView):
+    permission_classes = [IsAuthenticated]
+    max_page_size = 1000
+
+    def get(self, request, project_id):
+        if not changes.is_available():
+            return Response(status=501, data={'error': 'Change tracking is not available on this database.'})
+
+        is_member, _ = get_membership(request, project_id)
+        ended = None
+
+        # Former contributors read the log up to the change that ended their
+        # access, without the current state of the objects, which may be
+        # newer.
+        if not is_member:
+            ended = changes.get_access_end(project_id, request.user.id)
+
+            if ended is None:
+                return Response(status=403, data={'message': 'You are not a contributor to this project.'})
+
+        try:
+            since = max(int(request.query_params.get('since', 0)), 0)
+            page_size = min(max(int(request.query_params.get(
+                'page_size', api_settings.PAGE_SIZE)), 1), self.max_page_size)
+        except ValueError:
+            return Response(status=400, data={'error': 'Invalid sync parameters.'})
+
+        if 0 < since < changes.get_horizon():
+            return Response(status=410, data={'error': 'Changes since this sequence number were compacted, sync from 0.'})
+
+        if ended:
+            results, seq, more = changes.get_changes(project_id, since, page_size, until=ended[1], serialize=False)
+        else:
+            results, seq, more = changes.get_changes(project_id, since, page_size)
+
+        next_link = None
+
+        if more:
+            next_link = replace_query_param(request.build_absolute_uri(), 'since', seq)
+
+        data = {'seq': seq, 'next': next_link, 'results': results}
+
+        if ended:
+            data['ended'] = ended[0]
+
+        return Response(data)
@@ -0,0 +1,74 @@
+import json
+
+from django.http import StreamingHttpResponse
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.views import APIView
+
+from ..membership import get_membership
+from ..models.Archive import ArchivedComment, ArchivedIssue
+from ..models.Comment import Comment, CommentSerializer
+from ..models.Issue import Issue, IssueSerializer
+from ..models.Project import Project, ProjectSerializer
+
+
+def ndjson(kind, data):
+    return json.dumps({'type': kind, 'data': data}, cls=JSONEncoder,
+                      ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+def export_lines(project, sources, chunk_size):
+    """
+    Yields the project, then every issue followed by its comments, for each
+    (issues, comments) pair of `sources`. Both querysets are ordered by issue
+    and read through chunked iterators, so memory stays flat whatever the
+    size of the project.
+    """
+    yield ndjson('project', ProjectSerializer(project).data)
+
+    issue_serializer = IssueSerializer()
+    comment_serializer = CommentSerializer()
+
+    for issues, comments in sources:
+        comments = comments.iterator(chunk_size=chunk_size)
+        comment = next(comments, None)
+
+        for issue in issues.iterator(chunk_size=chunk_size):
+            yield ndjson('issue', issue_serializer.to_representation(issue))
+
+            while comment is not None and comment.issue_id <= issue.id:
+                if comment.issue_id == issue.id:
+                    yield ndjson('comment', comment_serializer.to_representation(comment))
+
+                comment = next(comments, None)
+
+
+class ProjectExportView(APIView):
+    permission_classes = [IsAuthenticated]
+    chunk_size = 2000
+
+    def get(self, request, project_id):
+        is_member, _ = get_membership(request, project_id)
+
+        if not is_member:
+            return Response(status=403, data={'message': 'You are not a contributor to this project.'})
+
+        project = Project.objects.with_contributors().get(id=project_id)
+
+        # Resolve the database now: the response is consumed after this view
+        # (and any routing middleware) has returned. Archived issues follow
+        # the live ones.
+        sources = []
+
+        for issue_model, comment_model in ((Issue, Comment), (ArchivedIssue, ArchivedComment)):
+            issues = issue_model.objects.filter(project_id=project_id).order_by('id')
+            comments = comment_model.objects.filter(issue__project_id=project_id).order_by('issue_id', 'id')
+            sources.append((issues.using(issues.db), comments.using(comments.db)))
+
+        response = StreamingHttpResponse(
+            export_lines(project, sources, self.chunk_size),
+            content_type='application/x-ndjson')
+        response['Content-Disposition'] = f'attachment; filename="project-{project_id}.ndjson"'
+
+        return response
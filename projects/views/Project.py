@@ -2,23 +2,36 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from django.conf import settings
 from django.contrib.auth.models import User
+from django.db import transaction
 from django.db.models import Q
 
 from ..models.Project import Project, ProjectSerializer
 from ..models.Contributor import Contributor, ContributorSerializer
 from ..models.Issue import Issue, IssueSerializer
 from ..models.Comment import Comment, CommentSerializer
+from ..models.Archive import ArchivedComment, ArchivedIssue
+from .. import archive, deletion
+from ..conditional import conditional_project_get
+from ..filters import filter_issues, get_issue_ordering, include_archived
+from ..membership import get_membership
+from ..pagination import paginated_response
 
 
 class ProjectsView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        projects = Project.objects.filter(
-            Q(contributors=request.user))
+        try:
+            fieldset = ProjectSerializer.get_fieldset(request.query_params)
+        except ValueError as error:
+            return Response(status=400, data={'error': str(error)})
 
-        return Response(ProjectSerializer(projects, many=True).data)
+        projects = ProjectSerializer(**fieldset).narrow_queryset(
+            Project.objects.filter(Q(contributors=request.user)), extra=('id',))
+
+        return paginated_response(request, projects, ProjectSerializer, ordering=('id',), fieldset=fieldset)
 
     def post(self, request):
         required_fields = ['title', 'description', 'type']
@@ -37,52 +50,73 @@ class ProjectsView(APIView):
 class ProjectView(APIView):
     permission_classes = [IsAuthenticated]
 
-    def get(self, _, project_id):
-        project = Project.objects.get(id=project_id)
-        return Response(ProjectSerializer(project).data)
+    @conditional_project_get
+    def get(self, request, project_id):
+        try:
+            fieldset = ProjectSerializer.get_fieldset(request.query_params)
+        except ValueError as error:
+            return Response(status=400, data={'error': str(error)})
+
+        project = ProjectSerializer(**fieldset).narrow_queryset(
+            Project.objects.filter(id=project_id)).first()
+
+        if not project:
+            return Response(status=404, data={'error': 'Project not found.'})
+
+        return Response(ProjectSerializer(project, **fieldset).data)
 
     def put(self, request, project_id):
-        project = Project.objects.get(id=project_id)
+        is_member, _ = get_membership(request, project_id)
 
-        if request.user not in project.contributors.all():
+        if not is_member:
             return Response(status=403, data={'message': 'You are not a contributor to this project.'})
 
+        project = Project.objects.with_contributors().get(id=project_id)
+
         project.title = request.data.get('title', project.title)
         project.description = request.data.get(
             'description', project.description)
         project.type = request.data.get('type', project.type)
 
-        project.save()
+        project.save(update_fields=['title', 'description', 'type'])
         return Response(ProjectSerializer(project).data)
 
     def delete(self, request, project_id):
-        project = Project.objects.get(id=project_id)
+        is_member, permission = get_membership(request, project_id)
 
-        if request.user not in project.contributors.all():
+        if not is_member:
             return Response(status=403, data={'message': 'You are not a contributor to this project.'})
 
-        contributor = Contributor.objects.get(
-            user=request.user, project=project)
-
-        if contributor.permission != 'author':
+        if permission != 'author':
             return Response(status=403, data={'message': 'You are not an author of this project.'})
 
-        project.delete()
+        if settings.PROJECT_DELETION['BACKGROUND']:
+            deletion.soft_delete_project(project_id)
+        else:
+            deletion.delete_project(project_id)
+
         return Response(status=204, data={'message': 'Project deleted.'})
 
 
 class ProjectUsersView(APIView):
     permission_classes = [IsAuthenticated]
 
-    def get(self, _, project_id):
-        users = Contributor.objects.filter(project_id=project_id)
+    @conditional_project_get
+    def get(self, request, project_id):
+        try:
+            fieldset = ContributorSerializer.get_fieldset(request.query_params)
+        except ValueError as error:
+            return Response(status=400, data={'error': str(error)})
+
+        users = ContributorSerializer(**fieldset).narrow_queryset(
+            Contributor.objects.with_username().filter(project_id=project_id), extra=('id',))
 
-        return Response(ContributorSerializer(users, many=True).data)
+        return paginated_response(request, users, ContributorSerializer, ordering=('id',), fieldset=fieldset)
 
     def post(self, request, project_id):
-        project = Project.objects.get(id=project_id)
+        is_member, _ = get_membership(request, project_id)
 
-        if request.user not in project.contributors.all():
+        if not is_member:
             return Response(status=403, data={'message': 'You are not a contributor to this project.'})
 
         required_fields = ['user_id', 'permission']
@@ -96,43 +130,38 @@ class ProjectUsersView(APIView):
         if permission not in ['author', 'editor']:
             return Response(status=400, data={'error': 'Invalid permission.'})
 
-        user = User.objects.filter(id=request.data['user_id']).first()
+        user_id = request.data['user_id']
 
-        if not user:
+        if not User.objects.filter(id=user_id).exists():
             return Response(status=400, data={'error': 'Invalid user.'})
 
-        if user in project.contributors.all():
+        if Contributor.objects.filter(project_id=project_id, user_id=user_id).exists():
             return Response(status=400, data={'error': 'User is already a contributor to this project.'})
 
-        project.contributors.add(user, through_defaults={
-                                 'permission': permission, 'role': request.data.get('role', permission)})
+        Contributor.objects.create(
+            project_id=project_id, user_id=user_id, permission=permission, role=request.data.get('role', permission))
 
         return Response(status=204, data={'message': 'User added to project.'})
 
     def delete(self, request, project_id, user_id):
-        project = Project.objects.get(id=project_id)
+        is_member, permission = get_membership(request, project_id)
 
-        if request.user not in project.contributors.all():
+        if not is_member:
             return Response(status=403, data={'message': 'You are not a contributor to this project.'})
 
-        contributor = Contributor.objects.get(
-            user=request.user, project=project)
-
-        if contributor.permission != 'author':
+        if permission != 'author':
             return Response(status=403, data={'message': 'You are not an author of this project.'})
 
-        user = User.objects.get(id=user_id)
+        contributor = Contributor.objects.filter(
+            project_id=project_id, user_id=user_id).first()
 
-        if user not in project.contributors.all():
+        if not contributor:
             return Response(status=400, data={'error': 'User is not a contributor to this project.'})
 
-        contributor = Contributor.objects.get(
-            user=user, project=project)
-
         if contributor.permission == 'author':
             return Response(status=403, data={'message': 'You cannot remove an author from a project.'})
 
-        project.contributors.remove(user)
+        contributor.delete()
 
         return Response(status=204, data={'message': 'User removed from project.'})
 
@@ -140,15 +169,35 @@ class ProjectUsersView(APIView):
 class ProjectIssuesView(APIView):
     permission_classes = [IsAuthenticated]
 
-    def get(self, _, project_id):
+    @conditional_project_get
+    def get(self, request, project_id):
         issues = Issue.objects.filter(project_id=project_id)
+        archived = []
+
+        try:
+            issues = filter_issues(issues, request.query_params)
+            ordering = get_issue_ordering(request.query_params)
+            fieldset = IssueSerializer.get_fieldset(request.query_params)
+
+            if include_archived(request.query_params):
+                archived = [filter_issues(ArchivedIssue.objects.filter(project_id=project_id), request.query_params)]
+        except ValueError as error:
+            return Response(status=400, data={'error': str(error)})
 
-        return Response(IssueSerializer(issues, many=True).data)
+        if 'ordering' in request.query_params:
+            issues = issues.order_by(*ordering)
+
+        serializer = IssueSerializer(**fieldset)
+        issues = serializer.narrow_queryset(issues, extra=ordering)
+        archived = [serializer.narrow_queryset(queryset, extra=ordering) for queryset in archived]
+
+        return paginated_response(
+            request, issues, IssueSerializer, ordering=ordering, fieldset=fieldset, union=archived)
 
     def post(self, request, project_id):
-        project = Project.objects.get(id=project_id)
+        is_member, _ = get_membership(request, project_id)
 
-        if request.user not in project.contributors.all():
+        if not is_member:
             return Response(status=403, data={'message': 'You are not a contributor to this project.'})
 
         required_fields = ['title', 'description',
@@ -161,10 +210,10 @@ class ProjectIssuesView(APIView):
         assignee = None
 
         if 'assignee' in request.data:
-            if not User.objects.filter(id=request.data['assignee']).exists():
-                return Response(status=400, data={'error': 'Invalid assignee.'})
+            assignee = User.objects.filter(id=request.data['assignee']).first()
 
-            assignee = User.objects.get(id=request.data['assignee'])
+            if not assignee:
+                return Response(status=400, data={'error': 'Invalid assignee.'})
 
         issue = Issue.objects.create(
             title=request.data['title'],
@@ -173,23 +222,23 @@ class ProjectIssuesView(APIView):
             priority=request.data['priority'],
             status=request.data['status'],
             assignee=assignee,
-            project=project,
+            project_id=project_id,
             author=request.user)
 
         return Response(IssueSerializer(issue).data)
 
     def put(self, request, project_id, issue_id):
-        project = Project.objects.get(id=project_id)
+        is_member, _ = get_membership(request, project_id)
 
-        if request.user not in project.contributors.all():
+        if not is_member:
             return Response(status=403, data={'message': 'You are not a contributor to this project.'})
 
-        issue = Issue.objects.filter(id=issue_id).first()
+        issue = archive.get_issue(issue_id, project_id)
 
         if not issue:
             return Response(status=400, data={'error': 'Invalid issue.'})
 
-        if issue.project != project:
+        if issue.project_id != project_id:
             return Response(status=400, data={'error': 'Issue does not belong to this project.'})
 
         issue.title = request.data.get('title', issue.title)
@@ -200,27 +249,29 @@ class ProjectIssuesView(APIView):
         issue.status = request.data.get('status', issue.status)
 
         if 'assignee' in request.data:
-            if not User.objects.filter(id=request.data['assignee']).exists():
+            assignee = User.objects.filter(id=request.data['assignee']).first()
+
+            if not assignee:
                 return Response(status=400, data={'error': 'Invalid assignee.'})
 
-            issue.assignee = User.objects.get(id=request.data['assignee'])
+            issue.assignee = assignee
 
         issue.save()
 
         return Response(IssueSerializer(issue).data)
 
     def delete(self, request, project_id, issue_id):
-        project = Project.objects.get(id=project_id)
+        is_member, _ = get_membership(request, project_id)
 
-        if request.user not in project.contributors.all():
+        if not is_member:
             return Response(status=403, data={'message': 'You are not a contributor to this project.'})
 
-        issue = Issue.objects.filter(id=issue_id).first()
+        issue = archive.get_issue(issue_id, project_id)
 
         if not issue:
             return Response(status=404, data={'error': 'Issue not found.'})
 
-        if issue.project != project:
+        if issue.project_id != project_id:
             return Response(status=400, data={'error': 'Issue does not belong to this project.'})
 
         issue.delete()
@@ -228,31 +279,172 @@ class ProjectIssuesView(APIView):
         return Response(status=204, data={'message': 'Issue deleted.'})
 
 
+def is_id(value):
+    # JSON booleans are ints to Python, and lists or objects are unhashable.
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+class ProjectIssuesBulkView(APIView):
+    permission_classes = [IsAuthenticated]
+    max_items = 1000
+    required_fields = ['title', 'description', 'tag', 'priority', 'status']
+    editable_fields = ['title', 'description', 'tag', 'priority', 'status']
+
+    def post(self, request, project_id):
+        is_member, _ = get_membership(request, project_id)
+
+        if not is_member:
+            return Response(status=403, data={'message': 'You are not a contributor to this project.'})
+
+        if not isinstance(request.data, dict):
+            return Response(status=400, data={'error': 'Invalid payload. (create, update)'})
+
+        creates = request.data.get('create', [])
+        updates = request.data.get('update', [])
+
+        if not isinstance(creates, list) or not isinstance(updates, list):
+            return Response(status=400, data={'error': 'Invalid payload. (create, update)'})
+
+        if len(creates) + len(updates) > self.max_items:
+            return Response(status=400, data={'error': f'Too many items. (max {self.max_items})'})
+
+        assignees = self.get_assignees(creates + updates)
+        ids = [item['id'] for item in updates if isinstance(item, dict) and is_id(item.get('id'))]
+        issues = Issue.objects.in_bulk(ids)
+        restored = archive.restore_issues([id for id in ids if id not in issues], project_id)
+
+        if restored:
+            issues.update(Issue.objects.in_bulk(restored))
+
+        issues = {id: issue for id, issue in issues.items()
+                  if issue.project_id == project_id}
+
+        create_results, created = [], []
+        update_results, updated = [], {}
+
+        for item in creates:
+            error = self.validate(item, assignees, self.required_fields)
+
+            if error:
+                create_results.append({'status': 400, 'error': error})
+                continue
+
+            issue = Issue(project_id=project_id, author=request.user,
+                          assignee_id=item.get('assignee'))
+
+            for field in self.editable_fields:
+                setattr(issue, field, item[field])
+
+            create_results.append({'status': 201, 'issue': issue})
+            created.append(issue)
+
+        for item in updates:
+            error = self.validate(item, assignees, [])
+
+            if not error and not is_id(item.get('id')):
+                error = 'Invalid issue.'
+
+            issue = issues.get(item['id']) if not error else None
+
+            if not error and not issue:
+                error = 'Invalid issue.'
+
+            if not error and issue.id in updated:
+                error = 'Duplicate issue.'
+
+            if error:
+                update_results.append({'status': 400, 'error': error})
+                continue
+
+            for field in self.editable_fields:
+                setattr(issue, field, item.get(field, getattr(issue, field)))
+
+            if 'assignee' in item:
+                issue.assignee_id = item['assignee']
+
+            update_results.append({'status': 200, 'issue': issue})
+            updated[issue.id] = issue
+
+        with transaction.atomic():
+            Issue.objects.bulk_create(created)
+            Issue.objects.bulk_update(
+                updated.values(), self.editable_fields + ['assignee'], batch_size=200)
+
+        results = [result for result in create_results + update_results if 'issue' in result]
+        serialized = IssueSerializer([result['issue'] for result in results], many=True).data
+
+        for result, data in zip(results, serialized):
+            result['issue'] = data
+
+        return Response({'create': create_results, 'update': update_results})
+
+    def get_assignees(self, items):
+        ids = set()
+
+        for item in items:
+            if isinstance(item, dict) and is_id(item.get('assignee')):
+                ids.add(item['assignee'])
+
+        return set(User.objects.filter(id__in=ids).values_list('id', flat=True))
+
+    def validate(self, item, assignees, required_fields):
+        if not isinstance(item, dict):
+            return 'Invalid item.'
+
+        for field in required_fields:
+            if not field in item:
+                return f'Missing required fields. ({field})'
+
+        for field in self.editable_fields:
+            if field in item and not isinstance(item[field], str):
+                return f'Invalid field value. ({field})'
+
+        if item.get('assignee') is not None and (not is_id(item['assignee']) or item['assignee'] not in assignees):
+            return 'Invalid assignee.'
+
+        return None
+
+
 class ProjectIssuesCommentsView(APIView):
     permission_classes = [IsAuthenticated]
 
-    def get(self, _, project_id, issue_id, comment_id=None):
+    @conditional_project_get
+    def get(self, request, project_id, issue_id, comment_id=None):
+        try:
+            fieldset = CommentSerializer.get_fieldset(request.query_params)
+            models = [Comment, ArchivedComment] if include_archived(request.query_params) else [Comment]
+        except ValueError as error:
+            return Response(status=400, data={'error': str(error)})
+
+        serializer = CommentSerializer(**fieldset)
+
         if comment_id:
-            comments = Comment.objects.filter(id=comment_id).first()
+            for model in models:
+                comment = serializer.narrow_queryset(model.objects.filter(
+                    id=comment_id, issue__project_id=project_id)).first()
+
+                if comment:
+                    break
 
-            return Response(CommentSerializer(comments).data)
+            return Response(CommentSerializer(comment, **fieldset).data)
 
-        comments = Comment.objects.filter(issue_id=issue_id)
+        comments = [serializer.narrow_queryset(model.objects.filter(
+            issue_id=issue_id, issue__project_id=project_id), extra=('created_at', 'id')) for model in models]
 
-        return Response(CommentSerializer(comments, many=True).data)
+        return paginated_response(request, comments[0], CommentSerializer, fieldset=fieldset, union=comments[1:])
 
     def post(self, request, project_id, issue_id):
-        project = Project.objects.get(id=project_id)
+        is_member, _ = get_membership(request, project_id)
 
-        if request.user not in project.contributors.all():
+        if not is_member:
             return Response(status=403, data={'message': 'You are not a contributor to this project.'})
 
-        issue = Issue.objects.filter(id=issue_id).first()
+        issue = archive.get_issue(issue_id, project_id)
 
         if not issue:
             return Response(status=400, data={'error': 'Invalid issue.'})
 
-        if issue.project != project:
+        if issue.project_id != project_id:
             return Response(status=400, data={'error': 'Issue does not belong to this project.'})
 
         required_fields = ['description']
@@ -269,17 +461,17 @@ class ProjectIssuesCommentsView(APIView):
         return Response(CommentSerializer(comment).data)
 
     def delete(self, request, project_id, issue_id, comment_id):
-        project = Project.objects.get(id=project_id)
+        is_member, _ = get_membership(request, project_id)
 
-        if request.user not in project.contributors.all():
+        if not is_member:
             return Response(status=403, data={'message': 'You are not a contributor to this project.'})
 
-        issue = Issue.objects.filter(id=issue_id).first()
+        issue = archive.get_issue(issue_id, project_id)
 
         if not issue:
             return Response(status=400, data={'error': 'Invalid issue.'})
 
-        if issue.project != project:
+        if issue.project_id != project_id:
             return Response(status=400, data={'error': 'Issue does not belong to this project.'})
 
         comment = Comment.objects.filter(id=comment_id).first()
@@ -287,7 +479,7 @@ class ProjectIssuesCommentsView(APIView):
         if not comment:
             return Response(status=404, data={'error': 'Comment not found.'})
 
-        if comment.issue != issue:
+        if comment.issue_id != issue.id:
             return Response(status=400, data={'error': 'Comment does not belong to this issue.'})
 
         comment.delete()
@@ -295,17 +487,17 @@ class ProjectIssuesCommentsView(APIView):
         return Response(status=204, data={'message': 'Comment deleted.'})
 
     def put(self, request, project_id, issue_id, comment_id):
-        project = Project.objects.get(id=project_id)
+        is_member, _ = get_membership(request, project_id)
 
-        if request.user not in project.contributors.all():
+        if not is_member:
             return Response(status=403, data={'message': 'You are not a contributor to this project.'})
 
-        issue = Issue.objects.filter(id=issue_id).first()
+        issue = archive.get_issue(issue_id, project_id)
 
         if not issue:
             return Response(status=400, data={'error': 'Invalid issue.'})
 
-        if issue.project != project:
+        if issue.project_id != project_id:
             return Response(status=400, data={'error': 'Issue does not belong to this project.'})
 
         comment = Comment.objects.filter(id=comment_id).first()
@@ -313,7 +505,7 @@ class ProjectIssuesCommentsView(APIView):
         if not comment:
             return Response(status=404, data={'error': 'Comment not found.'})
 
-        if comment.issue != issue:
+        if comment.issue_id != issue.id:
             return Response(status=400, data={'error': 'Comment does not belong to this issue.'})
 
         comment.description = request.data.get(
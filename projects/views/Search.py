@@ -0,0 +1,43 @@
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+from rest_framework.views import APIView
+
+from .. import search
+from ..membership import get_membership
+
+
+class ProjectSearchView(APIView):
+    permission_classes = [IsAuthenticated]
+    max_page_size = 100
+
+    def get(self, request, project_id):
+        is_member, _ = get_membership(request, project_id)
+
+        if not is_member:
+            return Response(status=403, data={'message': 'You are not a contributor to this project.'})
+
+        if not search.is_available():
+            return Response(status=501, data={'error': 'Search is not available on this database.'})
+
+        if not 'q' in request.query_params:
+            return Response(status=400, data={'error': 'Missing required fields. (q)'})
+
+        try:
+            page = max(int(request.query_params.get('page', 1)), 1)
+            page_size = min(max(int(request.query_params.get(
+                'page_size', api_settings.PAGE_SIZE)), 1), self.max_page_size)
+        except ValueError:
+            return Response(status=400, data={'error': 'Invalid pagination parameters.'})
+
+        results = search.search(
+            project_id, request.query_params['q'], page_size + 1, (page - 1) * page_size)
+
+        next_link = None
+
+        if len(results) > page_size:
+            next_link = replace_query_param(
+                request.build_absolute_uri(), 'page', page + 1)
+
+        return Response({'next': next_link, 'results': results[:page_size]})
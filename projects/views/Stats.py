@@ -0,0 +1,18 @@
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .. import stats
+from ..membership import get_membership
+
+
+class ProjectStatsView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, project_id):
+        is_member, _ = get_membership(request, project_id)
+
+        if not is_member:
+            return Response(status=403, data={'message': 'You are not a contributor to this project.'})
+
+        return Response(stats.get_stats(project_id))
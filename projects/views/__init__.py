@@ -2,6 +2,21 @@ from .Project import ProjectView
 from .Project import ProjectsView
 from .Project import ProjectUsersView
 from .Project import ProjectIssuesView
+from .Project import ProjectIssuesBulkView
 from .Project import ProjectIssuesCommentsView
 
+from .Async import AsyncProjectView
+from .Async import AsyncProjectsView
+from .Async import AsyncProjectUsersView
+from .Async import AsyncProjectIssuesView
+from .Async import AsyncProjectIssuesCommentsView
+
+from .Changes import ProjectChangesView
+
+from .Export import ProjectExportView
+
+from .Search import ProjectSearchView
+
+from .Stats import ProjectStatsView
+
 from .User import SignupView